@@ -5,12 +5,116 @@ Generates a detailed Markdown research document from complex Excel models.
 
 import os
 import re
-from collections import defaultdict
+import zipfile
+from functools import lru_cache
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from xml.etree import ElementTree
 from openpyxl import load_workbook
-from openpyxl.utils import get_column_letter, column_index_from_string
+from openpyxl.formula.translate import Translator
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._reader import FORMULA_TAG, WorkSheetParser
+from openpyxl.xml.constants import PKG_REL_NS, SHEET_MAIN_NS
 import glob
 
 
+# Column letters indexed by 1-based column number, covering every Excel column
+COL_LETTERS = [""] + [get_column_letter(col) for col in range(1, 16385)]
+# 1-based column number of each column letter
+COLUMN_NUMBERS = {letters: col for col, letters in enumerate(COL_LETTERS) if letters}
+DIGITS = "0123456789"
+ROW_TAG = f"{{{SHEET_MAIN_NS}}}row"
+CELL_TAG = f"{{{SHEET_MAIN_NS}}}c"
+# Only the first 199 columns of a sheet are analyzed
+MAX_SCAN_COLUMNS = 199
+
+# Sheet references like 'Sheet Name'!A1 or SheetName!A1
+SHEET_REF_RE = re.compile(r"'?([^'!]+)'?!([A-Z]+\d+(?::[A-Z]+\d+)?)")
+# Local cell references like A1, $A$1, A1:B10
+CELL_REF_RE = re.compile(r"(?<![A-Z])(\$?[A-Z]+\$?\d+(?::\$?[A-Z]+\$?\d+)?)")
+
+# Function names recognised in formulas. Matching is by substring on the
+# upper-cased formula, so a formula using XIRR also reports IRR, SUMIF also
+# reports SUM and IF, and PPMT/IPMT also report PMT.
+FORMULA_KEYWORDS = (
+    "XIRR", "IRR", "XNPV", "NPV", "SUMPRODUCT", "SUMIF", "SUM", "AVERAGE", "AVG",
+    "MAX", "MIN", "IF", "VLOOKUP", "HLOOKUP", "INDEX", "MATCH", "PPMT", "IPMT",
+    "PMT", "ROUND",
+)
+# FORMULA_KEYWORDS grouped under a substring common to the whole group, so a
+# formula without the probe is not searched for any of the group's keywords
+FORMULA_KEYWORD_GROUPS = (
+    ("IRR", ("XIRR", "IRR")),
+    ("NPV", ("XNPV", "NPV")),
+    ("SUM", ("SUMPRODUCT", "SUMIF", "SUM")),
+    ("AV", ("AVERAGE", "AVG")),
+    ("MAX", ("MAX",)),
+    ("MIN", ("MIN",)),
+    ("IF", ("IF",)),
+    ("LOOKUP", ("VLOOKUP", "HLOOKUP")),
+    ("INDEX", ("INDEX",)),
+    ("MATCH", ("MATCH",)),
+    ("PMT", ("PPMT", "IPMT", "PMT")),
+    ("ROUND", ("ROUND",)),
+)
+FINANCIAL_KEYWORDS = frozenset({"IRR", "NPV"})
+# IRR/NPV formulas are searched for in every cell above this row and left of this column
+FINANCIAL_SCAN_ROWS = 500
+FINANCIAL_SCAN_COLUMNS = 100
+ARITHMETIC_OPERATORS = ("+", "-", "*", "/")
+
+# (keywords, formula type) in priority order; the first rule that matches wins
+FORMULA_TYPE_RULES = (
+    (frozenset({"IRR"}), "IRR Calculation"),
+    (frozenset({"NPV"}), "NPV Calculation"),
+    (frozenset({"SUM"}), "Summation"),
+    (frozenset({"AVERAGE", "AVG"}), "Average"),
+    (frozenset({"MAX"}), "Maximum"),
+    (frozenset({"MIN"}), "Minimum"),
+    (frozenset({"IF"}), "Conditional Logic"),
+    (frozenset({"VLOOKUP", "HLOOKUP", "INDEX"}), "Lookup"),
+    (frozenset({"PMT"}), "Loan/Debt Calculation"),
+)
+
+# (header terms, sheet purpose) in priority order; the first rule with any
+# term in the lower-cased header text wins
+PURPOSE_RULES = (
+    (("hour", "8760", "dispatch", "generation"), "Hourly Dispatch / Time Series Simulation"),
+    (("cash flow", "cashflow", "revenue", "expense"), "Financial Cash Flow Projection"),
+    (("irr", "npv", "return"), "Financial Returns Analysis"),
+    (("debt", "loan", "interest", "principal"), "Debt / Financing Schedule"),
+    (("solar", "pv", "irradiance", "ghi"), "Solar Generation Model"),
+    (("battery", "bess", "storage", "charge", "discharge"), "Battery Storage Model"),
+    (("input", "assumption", "parameter"), "Model Inputs / Assumptions"),
+    (("summary", "output", "result"), "Summary / Outputs"),
+)
+
+# Each entry lists alternatives as (required keywords, English); only the
+# first alternative whose keywords are all present is reported
+FORMULA_TRANSLATIONS = (
+    (
+        (frozenset({"XIRR"}), "Calculates Internal Rate of Return using XIRR (dates-based)"),
+        (frozenset({"IRR"}), "Calculates Internal Rate of Return"),
+    ),
+    (
+        (frozenset({"XNPV"}), "Calculates Net Present Value using XNPV (dates-based)"),
+        (frozenset({"NPV"}), "Calculates Net Present Value"),
+    ),
+    ((frozenset({"SUM"}), "Sums values"),),
+    ((frozenset({"MAX"}), "Takes maximum value"),),
+    ((frozenset({"MIN"}), "Takes minimum value"),),
+    ((frozenset({"IF"}), "Applies conditional logic"),),
+    ((frozenset({"VLOOKUP"}), "Looks up value vertically"),),
+    ((frozenset({"INDEX", "MATCH"}), "Uses INDEX/MATCH lookup"),),
+    ((frozenset({"PMT"}), "Calculates payment amount"),),
+    ((frozenset({"PPMT"}), "Calculates principal payment"),),
+    ((frozenset({"IPMT"}), "Calculates interest payment"),),
+    ((frozenset({"SUMIF"}), "Conditional sum"),),
+    ((frozenset({"SUMPRODUCT"}), "Multiplies arrays and sums result"),),
+    ((frozenset({"ROUND"}), "Rounds value"),),
+)
+
+
 def find_excel_file():
     """Find Excel file in current directory."""
     xlsx_files = glob.glob("*.xlsx")
@@ -19,51 +123,67 @@ def find_excel_file():
     return xlsx_files[0]
 
 
+def _office_document_part(archive):
+    """Path of the workbook part inside an open XLSX archive."""
+    rels = ElementTree.fromstring(archive.read("_rels/.rels"))
+    for rel in rels.iter(f"{{{PKG_REL_NS}}}Relationship"):
+        if rel.get("Type", "").endswith("/officeDocument"):
+            return rel.get("Target").lstrip("/")
+    return "xl/workbook.xml"
+
+
+def read_sheet_names(excel_file):
+    """List sheet names in workbook order, read from the package's workbook part."""
+    with zipfile.ZipFile(excel_file) as archive:
+        workbook = ElementTree.fromstring(archive.read(_office_document_part(archive)))
+    return [sheet.get("name") for sheet in workbook.iter(f"{{{SHEET_MAIN_NS}}}sheet")]
+
+
 def parse_formula_references(formula):
     """Extract cell and sheet references from a formula."""
     if not formula or not isinstance(formula, str):
         return [], []
     
-    # Pattern for sheet references like 'Sheet Name'!A1 or SheetName!A1
-    sheet_ref_pattern = r"'?([^'!]+)'?!([A-Z]+\d+(?::[A-Z]+\d+)?)"
-    # Pattern for local cell references like A1, $A$1, A1:B10
-    cell_ref_pattern = r"(?<![A-Z])(\$?[A-Z]+\$?\d+(?::\$?[A-Z]+\$?\d+)?)"
-    
-    sheet_refs = re.findall(sheet_ref_pattern, formula)
-    local_refs = re.findall(cell_ref_pattern, formula)
+    sheet_refs = SHEET_REF_RE.findall(formula)
+    local_refs = CELL_REF_RE.findall(formula)
     
     return sheet_refs, local_refs
 
 
+@lru_cache(maxsize=8192)
+def formula_keywords(formula):
+    """Return the FORMULA_KEYWORDS that appear in a formula.
+
+    The formula is scanned once and the resulting set drives type
+    identification, English translation and the IRR/NPV search. Results are
+    cached, so repeated formulas and the report's re-translation of sampled
+    formulas cost a dictionary lookup.
+    """
+    # One upper() copy is a small share of the scan; a single re.IGNORECASE
+    # alternation over the probes is slower than all the substring tests together
+    formula_upper = formula.upper()
+    return frozenset(
+        keyword
+        for probe, keywords in FORMULA_KEYWORD_GROUPS if probe in formula_upper
+        for keyword in keywords if keyword in formula_upper
+    )
+
+
+def _formula_type(formula, keywords):
+    for rule_keywords, formula_type in FORMULA_TYPE_RULES:
+        if not keywords.isdisjoint(rule_keywords):
+            return formula_type
+    if any(op in formula for op in ARITHMETIC_OPERATORS):
+        return "Arithmetic"
+    return "Other Formula"
+
+
 def identify_formula_type(formula):
     """Identify the type/purpose of a formula."""
     if not formula or not isinstance(formula, str):
         return "hardcoded"
     
-    formula_upper = formula.upper()
-    
-    if "XIRR" in formula_upper or "IRR" in formula_upper:
-        return "IRR Calculation"
-    elif "XNPV" in formula_upper or "NPV" in formula_upper:
-        return "NPV Calculation"
-    elif "SUM" in formula_upper:
-        return "Summation"
-    elif "AVERAGE" in formula_upper or "AVG" in formula_upper:
-        return "Average"
-    elif "MAX" in formula_upper:
-        return "Maximum"
-    elif "MIN" in formula_upper:
-        return "Minimum"
-    elif "IF" in formula_upper:
-        return "Conditional Logic"
-    elif "VLOOKUP" in formula_upper or "HLOOKUP" in formula_upper or "INDEX" in formula_upper:
-        return "Lookup"
-    elif "PMT" in formula_upper or "PPMT" in formula_upper or "IPMT" in formula_upper:
-        return "Loan/Debt Calculation"
-    elif any(op in formula for op in ["+", "-", "*", "/"]):
-        return "Arithmetic"
-    else:
-        return "Other Formula"
+    return _formula_type(formula, formula_keywords(formula))
 
 
 def translate_formula_to_english(formula, col_headers=None):
@@ -71,58 +191,17 @@ def translate_formula_to_english(formula, col_headers=None):
     if not formula or not isinstance(formula, str):
         return "Hardcoded value"
     
-    formula_upper = formula.upper()
+    keywords = formula_keywords(formula)
     
     translations = []
-    
-    if "XIRR" in formula_upper:
-        translations.append("Calculates Internal Rate of Return using XIRR (dates-based)")
-    elif "IRR" in formula_upper:
-        translations.append("Calculates Internal Rate of Return")
-    
-    if "XNPV" in formula_upper:
-        translations.append("Calculates Net Present Value using XNPV (dates-based)")
-    elif "NPV" in formula_upper:
-        translations.append("Calculates Net Present Value")
-    
-    if "SUM" in formula_upper:
-        translations.append("Sums values")
-    
-    if "MAX" in formula_upper:
-        translations.append("Takes maximum value")
-    
-    if "MIN" in formula_upper:
-        translations.append("Takes minimum value")
-    
-    if "IF" in formula_upper:
-        translations.append("Applies conditional logic")
-    
-    if "VLOOKUP" in formula_upper:
-        translations.append("Looks up value vertically")
-    
-    if "INDEX" in formula_upper and "MATCH" in formula_upper:
-        translations.append("Uses INDEX/MATCH lookup")
-    
-    if "PMT" in formula_upper:
-        translations.append("Calculates payment amount")
-    
-    if "PPMT" in formula_upper:
-        translations.append("Calculates principal payment")
-    
-    if "IPMT" in formula_upper:
-        translations.append("Calculates interest payment")
-    
-    if "SUMIF" in formula_upper:
-        translations.append("Conditional sum")
-    
-    if "SUMPRODUCT" in formula_upper:
-        translations.append("Multiplies arrays and sums result")
-    
-    if "ROUND" in formula_upper:
-        translations.append("Rounds value")
+    for alternatives in FORMULA_TRANSLATIONS:
+        for required, english in alternatives:
+            if required <= keywords:
+                translations.append(english)
+                break
     
     if not translations:
-        if any(op in formula for op in ["+", "-", "*", "/"]):
+        if any(op in formula for op in ARITHMETIC_OPERATORS):
             translations.append("Performs arithmetic calculation")
         else:
             translations.append("Formula-based calculation")
@@ -130,12 +209,89 @@ def translate_formula_to_english(formula, col_headers=None):
     return "; ".join(translations)
 
 
-def analyze_sheet(ws_formulas, ws_values, sheet_name):
-    """Analyze a single sheet and return structured data."""
+def _scan_extent(ws):
+    """Return (max_row, max_column) of the cells present in a read-only worksheet.
+
+    Only the row and cell references are read; cell values are never decoded.
+    Rows and cells without an "r" attribute are numbered on from the previous
+    one, as openpyxl's parser does.
+    """
+    max_row = max_col = 0
+    row_counter = 0
+    # ReadOnlyWorksheet has no public handle on its XML part
+    with ws._get_source() as src:
+        for _, element in ElementTree.iterparse(src):
+            if element.tag != ROW_TAG:
+                continue
+            number = element.get("r")
+            row_counter = int(number) if number is not None else row_counter + 1
+            col_counter = 0
+            for cell in element.iterfind(CELL_TAG):
+                ref = cell.get("r")
+                col_counter = (COLUMN_NUMBERS[ref.rstrip(DIGITS)] if ref is not None
+                               else col_counter + 1)
+            if col_counter:
+                max_row = row_counter
+                max_col = max(max_col, col_counter)
+            element.clear()
+    return max_row, max_col
+
+
+class FormulaValueParser(WorkSheetParser):
+    """
+    Worksheet parser that reads each cell's formula and cached value together.
+
+    Every <c> element carries both the formula (<f>) and the value Excel last
+    calculated for it (<v>), so one pass over the sheet XML replaces loading
+    the workbook once with data_only=False and again with data_only=True.
+    Parsed cells gain a "formula" key holding what the formulas workbook
+    would show: the formula string, or the plain value for constants.
+
+    If ``keep_row`` is given, rows for which it returns False are yielded
+    with no cells and their cells are never decoded; only shared formula
+    definitions are recorded so later rows still translate correctly.
+    """
+
+    def __init__(self, src, shared_strings, keep_row=None, **kwargs):
+        super().__init__(src, shared_strings, data_only=True, **kwargs)
+        self.keep_row = keep_row
+
+    def parse_row(self, row):
+        number = row.get("r")
+        if self.keep_row is None or number is None or self.keep_row(int(number)):
+            return super().parse_row(row)
+        self.row_counter = int(number)
+        self.col_counter = 0
+        for element in row:
+            formula = element.find(FORMULA_TAG)
+            if (formula is not None and formula.get("t") == "shared"
+                    and formula.text is not None):
+                idx = formula.get("si")
+                if idx not in self.shared_formulae:
+                    self.shared_formulae[idx] = Translator("=" + formula.text, element.get("r"))
+        return self.row_counter, []
+
+    def parse_cell(self, element):
+        cell = super().parse_cell(element)
+        if element.find(FORMULA_TAG) is not None:
+            # parse_formula translates shared formulas to this cell
+            cell["formula"] = self.parse_formula(element)
+        else:
+            cell["formula"] = cell["value"]
+        return cell
+
+
+def analyze_sheet(ws, sheet_name):
+    """Analyze a single read-only sheet and return structured data."""
+    # Read-only worksheets trust the <dimension> element written by the
+    # producing application; some writers omit it or leave it at A1:A1
+    max_row, max_col = ws.max_row, ws.max_column
+    if max_row is None or max_col is None or (max_row, max_col) == (1, 1):
+        max_row, max_col = _scan_extent(ws)
     analysis = {
         "name": sheet_name,
         "purpose": "",
-        "dimensions": (ws_formulas.max_row, ws_formulas.max_column),
+        "dimensions": (max_row, max_col),
         "headers": [],
         "hardcoded_inputs": [],
         "time_series_data": [],
@@ -144,235 +300,241 @@ def analyze_sheet(ws_formulas, ws_values, sheet_name):
         "cross_sheet_refs": [],
         "financial_calcs": [],
         "anomalies": [],
-        "merged_cells": list(ws_formulas.merged_cells.ranges) if ws_formulas.merged_cells else []
+        "merged_cells_count": 0
     }
     
-    max_row = ws_formulas.max_row or 1
-    max_col = ws_formulas.max_column or 1
-    
-    if max_row == 0 or max_col == 0:
+    # A sheet whose extent holds no cells has nothing to stream
+    if not max_row or not max_col:
         analysis["purpose"] = "Empty sheet"
         return analysis
     
-    # Extract headers (first few rows often contain headers)
-    headers = {}
-    for col in range(1, min(max_col + 1, 200)):
-        for row in range(1, min(6, max_row + 1)):  # Check first 5 rows for headers
-            cell = ws_values.cell(row=row, column=col)
-            if cell.value and isinstance(cell.value, str) and len(cell.value.strip()) > 0:
-                col_letter = get_column_letter(col)
-                if col_letter not in headers:
-                    headers[col_letter] = cell.value.strip()[:50]
-                break
-    
-    analysis["headers"] = headers
+    scan_cols = min(max_col, MAX_SCAN_COLUMNS)
     
-    # Infer purpose from headers
-    header_text = " ".join(str(v).lower() for v in headers.values())
-    if any(term in header_text for term in ["hour", "8760", "dispatch", "generation"]):
-        analysis["purpose"] = "Hourly Dispatch / Time Series Simulation"
-    elif any(term in header_text for term in ["cash flow", "cashflow", "revenue", "expense"]):
-        analysis["purpose"] = "Financial Cash Flow Projection"
-    elif any(term in header_text for term in ["irr", "npv", "return"]):
-        analysis["purpose"] = "Financial Returns Analysis"
-    elif any(term in header_text for term in ["debt", "loan", "interest", "principal"]):
-        analysis["purpose"] = "Debt / Financing Schedule"
-    elif any(term in header_text for term in ["solar", "pv", "irradiance", "ghi"]):
-        analysis["purpose"] = "Solar Generation Model"
-    elif any(term in header_text for term in ["battery", "bess", "storage", "charge", "discharge"]):
-        analysis["purpose"] = "Battery Storage Model"
-    elif any(term in header_text for term in ["input", "assumption", "parameter"]):
-        analysis["purpose"] = "Model Inputs / Assumptions"
-    elif any(term in header_text for term in ["summary", "output", "result"]):
-        analysis["purpose"] = "Summary / Outputs"
-    else:
-        analysis["purpose"] = "General Calculations"
-    
-    # Analyze columns
-    col_analysis = defaultdict(lambda: {
-        "formulas": 0, "hardcoded": 0, "empty": 0, 
-        "sample_formula": None, "sample_value": None,
-        "formula_types": set(), "cross_sheet_refs": set()
-    })
-    
-    # Sample rows for analysis (don't scan all 8760 rows for every column)
+    # Sample rows for analysis (don't classify all 8760 rows for every column)
     sample_rows = list(range(1, min(101, max_row + 1)))  # First 100 rows
     if max_row > 100:
         sample_rows.extend([max_row // 4, max_row // 2, 3 * max_row // 4, max_row])  # Plus key rows
+    # Key rows can repeat one of the first 100 rows; such rows are counted twice
+    sample_weights = Counter(sample_rows)
     
-    for col in range(1, min(max_col + 1, 200)):
-        col_letter = get_column_letter(col)
-        
-        for row in sample_rows:
-            if row > max_row:
-                continue
-            cell_formula = ws_formulas.cell(row=row, column=col)
-            cell_value = ws_values.cell(row=row, column=col)
-            
-            if cell_formula.value is None and cell_value.value is None:
-                col_analysis[col_letter]["empty"] += 1
-            elif isinstance(cell_formula.value, str) and cell_formula.value.startswith("="):
-                col_analysis[col_letter]["formulas"] += 1
-                if col_analysis[col_letter]["sample_formula"] is None:
-                    col_analysis[col_letter]["sample_formula"] = cell_formula.value
-                    col_analysis[col_letter]["sample_value"] = cell_value.value
+    # Per-column stats as parallel lists indexed by column number (index 0 unused)
+    formulas_ct = [0] * (scan_cols + 1)
+    hardcoded_ct = [0] * (scan_cols + 1)
+    sample_formulas = [None] * (scan_cols + 1)
+    sample_values = [None] * (scan_cols + 1)
+    formula_types = [set() for _ in range(scan_cols + 1)]
+    cross_sheet_refs = [set() for _ in range(scan_cols + 1)]
+    
+    headers = {}
+    financial_cells = []
+    
+    # Stream the sheet XML once, reading each cell's formula and cached value
+    # together, and do all per-cell work in that single pass
+    wb = ws.parent
+    # ReadOnlyWorksheet has no public handle on its XML part or shared strings
+    with ws._get_source() as src:
+        parser = FormulaValueParser(
+            src,
+            ws._shared_strings,
+            epoch=wb.epoch,
+            date_formats=wb._date_formats,
+            timedelta_formats=wb._timedelta_formats,
+            # Beyond the IRR/NPV window only sampled rows need per-cell work;
+            # on 8760-row sheets this leaves almost every cell undecoded
+            keep_row=lambda row: row <= max_row and (row < FINANCIAL_SCAN_ROWS or row in sample_weights),
+        )
+        # Keep consuming past max_row so trailing <mergeCells> are parsed
+        for row, cells in parser.parse():
+            weight = sample_weights.get(row, 0)
+            for cell in cells:
+                col = cell["column"]
+                if col > scan_cols:
+                    break  # cells within a row are stored in column order
+                formula = cell["formula"]
+                value = cell["value"]
+                # Extract headers (first 5 rows often contain headers); keyed by column number
+                if row <= 5 and col not in headers and isinstance(value, str) and value.strip():
+                    headers[col] = value.strip()[:50]
                 
-                formula_type = identify_formula_type(cell_formula.value)
-                col_analysis[col_letter]["formula_types"].add(formula_type)
+                is_formula = isinstance(formula, str) and formula.startswith("=")
+                in_financial_scan = row < FINANCIAL_SCAN_ROWS and col < FINANCIAL_SCAN_COLUMNS
+                keywords = None
+                if is_formula and (weight or in_financial_scan):
+                    keywords = formula_keywords(formula)
                 
-                sheet_refs, _ = parse_formula_references(cell_formula.value)
-                for ref in sheet_refs:
-                    col_analysis[col_letter]["cross_sheet_refs"].add(ref[0])
-            else:
-                col_analysis[col_letter]["hardcoded"] += 1
-                if col_analysis[col_letter]["sample_value"] is None:
-                    col_analysis[col_letter]["sample_value"] = cell_value.value
+                # Look for specific financial formulas in the top of the sheet
+                if in_financial_scan and keywords and not keywords.isdisjoint(FINANCIAL_KEYWORDS):
+                    financial_cells.append((row, col, formula, value, keywords))
+                
+                if not weight or (formula is None and value is None):
+                    continue
+                if is_formula:
+                    formulas_ct[col] += weight
+                    if sample_formulas[col] is None:
+                        sample_formulas[col] = formula
+                        sample_values[col] = value
+                    
+                    formula_types[col].add(_formula_type(formula, keywords))
+                    
+                    sheet_refs, _ = parse_formula_references(formula)
+                    for ref in sheet_refs:
+                        cross_sheet_refs[col].add(ref[0])
+                else:
+                    hardcoded_ct[col] += weight
+                    if sample_values[col] is None:
+                        sample_values[col] = value
+    
+    if parser.merged_cells is not None:
+        analysis["merged_cells_count"] = len(parser.merged_cells.mergeCell)
+    
+    analysis["headers"] = headers
+    
+    # Infer purpose from headers
+    header_text = " ".join(str(v).lower() for v in headers.values())
+    analysis["purpose"] = next(
+        (purpose for terms, purpose in PURPOSE_RULES
+         if any(term in header_text for term in terms)),
+        "General Calculations",
+    )
     
     # Categorize columns
-    for col_letter, stats in col_analysis.items():
-        header = headers.get(col_letter, f"Column {col_letter}")
-        total_sampled = stats["formulas"] + stats["hardcoded"]
-        
-        if total_sampled == 0:
+    for col in range(1, scan_cols + 1):
+        formulas = formulas_ct[col]
+        hardcoded = hardcoded_ct[col]
+        if formulas + hardcoded == 0:
             continue  # Skip empty columns
         
+        col_letter = COL_LETTERS[col]
+        header = headers.get(col, f"Column {col_letter}")
+        sample_formula = sample_formulas[col]
+        sample_value = sample_values[col]
+        
         # Check if it's a time series (many rows of data)
-        is_time_series = max_row >= 100 and stats["hardcoded"] > 50
+        is_time_series = max_row >= 100 and hardcoded > 50
         
-        if stats["formulas"] > 0 and stats["hardcoded"] == 0:
+        if formulas > 0 and hardcoded == 0:
             # Pure calculated column
             analysis["calculated_columns"].append({
                 "column": col_letter,
                 "header": header,
-                "formula": stats["sample_formula"],
-                "formula_types": list(stats["formula_types"]),
-                "sample_value": stats["sample_value"]
+                "formula": sample_formula,
+                "formula_types": list(formula_types[col]),
+                "sample_value": sample_value
             })
-        elif stats["formulas"] == 0 and stats["hardcoded"] > 0:
+        elif formulas == 0 and hardcoded > 0:
             # Pure hardcoded
             if is_time_series:
                 analysis["time_series_data"].append({
                     "column": col_letter,
                     "header": header,
-                    "sample_value": stats["sample_value"],
+                    "sample_value": sample_value,
                     "row_count": max_row
                 })
             else:
                 analysis["hardcoded_inputs"].append({
                     "column": col_letter,
                     "header": header,
-                    "sample_value": stats["sample_value"]
+                    "sample_value": sample_value
                 })
-        elif stats["formulas"] > 0 and stats["hardcoded"] > 0:
+        elif formulas > 0 and hardcoded > 0:
             # Mixed - potential anomaly
             analysis["anomalies"].append({
                 "column": col_letter,
                 "header": header,
-                "issue": f"Mixed formulas ({stats['formulas']}) and hardcoded values ({stats['hardcoded']}) in calculation column",
-                "sample_formula": stats["sample_formula"]
+                "issue": f"Mixed formulas ({formulas}) and hardcoded values ({hardcoded}) in calculation column",
+                "sample_formula": sample_formula
             })
         
         # Track cross-sheet references
-        if stats["cross_sheet_refs"]:
+        if cross_sheet_refs[col]:
             analysis["cross_sheet_refs"].append({
                 "column": col_letter,
-                "references": list(stats["cross_sheet_refs"])
+                "references": list(cross_sheet_refs[col])
             })
         
         # Track financial calculations
         financial_types = {"IRR Calculation", "NPV Calculation", "Loan/Debt Calculation"}
-        found_financial = financial_types.intersection(stats["formula_types"])
+        found_financial = financial_types.intersection(formula_types[col])
         if found_financial:
             analysis["financial_calcs"].append({
                 "column": col_letter,
                 "header": header,
                 "calc_types": list(found_financial),
-                "formula": stats["sample_formula"],
-                "value": stats["sample_value"]
+                "formula": sample_formula,
+                "value": sample_value
             })
     
-    # Look for specific financial formulas in the entire sheet (scan more thoroughly)
-    for row in range(1, min(max_row + 1, 500)):
-        for col in range(1, min(max_col + 1, 100)):
-            cell = ws_formulas.cell(row=row, column=col)
-            if isinstance(cell.value, str) and cell.value.startswith("="):
-                formula_upper = cell.value.upper()
-                if any(term in formula_upper for term in ["XIRR", "XNPV", "IRR", "NPV"]):
-                    cell_val = ws_values.cell(row=row, column=col)
-                    col_letter = get_column_letter(col)
-                    # Avoid duplicates
-                    existing = [f for f in analysis["financial_calcs"] 
-                               if f.get("cell") == f"{col_letter}{row}"]
-                    if not existing:
-                        analysis["financial_calcs"].append({
-                            "cell": f"{col_letter}{row}",
-                            "header": headers.get(col_letter, ""),
-                            "formula": cell.value,
-                            "value": cell_val.value,
-                            "calc_types": [identify_formula_type(cell.value)]
-                        })
+    # The streaming pass visits each cell once, so these entries are already unique
+    for row, col, formula, value, keywords in financial_cells:
+        col_letter = COL_LETTERS[col]
+        analysis["financial_calcs"].append({
+            "cell": f"{col_letter}{row}",
+            "header": headers.get(col, ""),
+            "formula": formula,
+            "value": value,
+            "calc_types": [_formula_type(formula, keywords)]
+        })
     
     return analysis
 
 
-def generate_markdown_report(analyses, excel_filename):
-    """Generate the markdown report from all sheet analyses."""
-    
-    md_lines = [
-        f"# Excel Financial Model Analysis Report",
-        f"",
-        f"**Source File:** `{excel_filename}`",
-        f"",
-        f"**Analysis Date:** Generated by automated analyzer",
-        f"",
-        f"---",
-        f"",
-        f"## Executive Summary",
-        f"",
-        f"This document maps the mathematical relationships and data flows in the Excel financial model.",
-        f"",
-        f"### Sheets Analyzed:",
-        f""
-    ]
+def generate_markdown_report(analyses, excel_filename, out):
+    """Write the markdown report for all sheet analyses to the text stream ``out``."""
+    w = out.write
+    
+    w("# Excel Financial Model Analysis Report\n"
+      "\n"
+      f"**Source File:** `{excel_filename}`\n"
+      "\n"
+      "**Analysis Date:** Generated by automated analyzer\n"
+      "\n"
+      "---\n"
+      "\n"
+      "## Executive Summary\n"
+      "\n"
+      "This document maps the mathematical relationships and data flows in the Excel financial model.\n"
+      "\n"
+      "### Sheets Analyzed:\n"
+      "\n")
     
     for analysis in analyses:
         purpose = analysis["purpose"] or "Unknown"
-        md_lines.append(f"- **{analysis['name']}**: {purpose}")
+        w(f"- **{analysis['name']}**: {purpose}\n")
     
-    md_lines.extend(["", "---", ""])
+    w("\n---\n\n")
     
     # Detail for each sheet
     for analysis in analyses:
-        md_lines.append(f"## Sheet: {analysis['name']}")
-        md_lines.append(f"")
-        md_lines.append(f"### Purpose")
-        md_lines.append(f"{analysis['purpose']}")
-        md_lines.append(f"")
-        md_lines.append(f"**Dimensions:** {analysis['dimensions'][0]} rows × {analysis['dimensions'][1]} columns")
-        md_lines.append(f"")
+        w(f"## Sheet: {analysis['name']}\n")
+        w("\n")
+        w("### Purpose\n")
+        w(f"{analysis['purpose']}\n")
+        w("\n")
+        w(f"**Dimensions:** {analysis['dimensions'][0]} rows × {analysis['dimensions'][1]} columns\n")
+        w("\n")
         
         # Key Inputs
-        md_lines.append(f"### Key Inputs (Hardcoded Values)")
+        w("### Key Inputs (Hardcoded Values)\n")
         if analysis["hardcoded_inputs"]:
-            md_lines.append(f"")
+            w("\n")
             for inp in analysis["hardcoded_inputs"][:30]:  # Limit to 30
                 val_str = str(inp["sample_value"])[:50] if inp["sample_value"] is not None else "N/A"
-                md_lines.append(f"- **{inp['header']}** (Col {inp['column']}): `{val_str}`")
+                w(f"- **{inp['header']}** (Col {inp['column']}): `{val_str}`\n")
         else:
-            md_lines.append(f"No significant hardcoded inputs detected.")
-        md_lines.append(f"")
+            w("No significant hardcoded inputs detected.\n")
+        w("\n")
         
         # Time Series Data
         if analysis["time_series_data"]:
-            md_lines.append(f"### Time Series Data")
-            md_lines.append(f"")
+            w("### Time Series Data\n")
+            w("\n")
             for ts in analysis["time_series_data"][:20]:
-                md_lines.append(f"- **{ts['header']}** (Col {ts['column']}): ~{ts['row_count']} rows of data")
-            md_lines.append(f"")
+                w(f"- **{ts['header']}** (Col {ts['column']}): ~{ts['row_count']} rows of data\n")
+            w("\n")
         
         # The Math
-        md_lines.append(f"### The Math (Formulas and English Translation)")
-        md_lines.append(f"")
+        w("### The Math (Formulas and English Translation)\n")
+        w("\n")
         
         if analysis["calculated_columns"]:
             for calc in analysis["calculated_columns"][:40]:  # Limit
@@ -383,68 +545,66 @@ def generate_markdown_report(analyses, excel_filename):
                 val = calc.get("sample_value")
                 val_str = f" → Sample result: `{val}`" if val is not None else ""
                 
-                md_lines.append(f"#### Column {col}: {header}")
-                md_lines.append(f"")
-                md_lines.append(f"- **Formula:** `{formula}`")
-                md_lines.append(f"- **English:** {english}{val_str}")
-                md_lines.append(f"")
+                w(f"#### Column {col}: {header}\n")
+                w("\n")
+                w(f"- **Formula:** `{formula}`\n")
+                w(f"- **English:** {english}{val_str}\n")
+                w("\n")
         else:
-            md_lines.append(f"No calculated columns detected in sampled rows.")
-            md_lines.append(f"")
+            w("No calculated columns detected in sampled rows.\n")
+            w("\n")
         
         # Financial Calculations (IRR, NPV)
         if analysis["financial_calcs"]:
-            md_lines.append(f"### Financial Calculations (IRR, NPV, Debt)")
-            md_lines.append(f"")
+            w("### Financial Calculations (IRR, NPV, Debt)\n")
+            w("\n")
             for fc in analysis["financial_calcs"]:
                 location = fc.get("cell") or f"Col {fc.get('column')}"
-                md_lines.append(f"- **{location}**: `{fc['formula']}`")
+                w(f"- **{location}**: `{fc['formula']}`\n")
                 if fc.get("value") is not None:
-                    md_lines.append(f"  - **Result:** `{fc['value']}`")
-                md_lines.append(f"  - **Type:** {', '.join(fc['calc_types'])}")
-            md_lines.append(f"")
+                    w(f"  - **Result:** `{fc['value']}`\n")
+                w(f"  - **Type:** {', '.join(fc['calc_types'])}\n")
+            w("\n")
         
         # Cross-Sheet Dependencies
         if analysis["cross_sheet_refs"]:
-            md_lines.append(f"### Cross-Sheet Dependencies")
-            md_lines.append(f"")
+            w("### Cross-Sheet Dependencies\n")
+            w("\n")
             refs_summary = defaultdict(list)
             for ref in analysis["cross_sheet_refs"]:
                 for sheet in ref["references"]:
                     refs_summary[sheet].append(ref["column"])
             for sheet, cols in refs_summary.items():
-                md_lines.append(f"- References **{sheet}** from columns: {', '.join(cols[:10])}")
-            md_lines.append(f"")
+                w(f"- References **{sheet}** from columns: {', '.join(cols[:10])}\n")
+            w("\n")
         
         # Anomalies
-        md_lines.append(f"### Anomalies / Flags")
-        md_lines.append(f"")
+        w("### Anomalies / Flags\n")
+        w("\n")
         if analysis["anomalies"]:
             for anom in analysis["anomalies"]:
-                md_lines.append(f"- **⚠️ {anom['header']}** (Col {anom['column']}): {anom['issue']}")
+                w(f"- **⚠️ {anom['header']}** (Col {anom['column']}): {anom['issue']}\n")
                 if anom.get("sample_formula"):
-                    md_lines.append(f"  - Sample formula: `{anom['sample_formula']}`")
+                    w(f"  - Sample formula: `{anom['sample_formula']}`\n")
         else:
-            md_lines.append(f"No anomalies detected.")
-        md_lines.append(f"")
+            w("No anomalies detected.\n")
+        w("\n")
         
         # Merged cells note
-        if analysis["merged_cells"]:
-            md_lines.append(f"### Formatting Notes")
-            md_lines.append(f"")
-            md_lines.append(f"- **Merged cell regions:** {len(analysis['merged_cells'])} found (decorative/headers)")
-            md_lines.append(f"")
+        if analysis["merged_cells_count"]:
+            w("### Formatting Notes\n")
+            w("\n")
+            w(f"- **Merged cell regions:** {analysis['merged_cells_count']} found (decorative/headers)\n")
+            w("\n")
         
-        md_lines.append(f"---")
-        md_lines.append(f"")
+        w("---\n")
+        w("\n")
     
     # Final summary
-    md_lines.extend([
-        "## Data Flow Summary",
-        "",
-        "### Sheet Interdependencies",
-        ""
-    ])
+    w("## Data Flow Summary\n"
+      "\n"
+      "### Sheet Interdependencies\n"
+      "\n")
     
     # Build dependency graph
     dep_graph = {}
@@ -458,18 +618,73 @@ def generate_markdown_report(analyses, excel_filename):
     
     if dep_graph:
         for sheet, deps in dep_graph.items():
-            md_lines.append(f"- **{sheet}** depends on: {', '.join(deps)}")
+            w(f"- **{sheet}** depends on: {', '.join(deps)}\n")
     else:
-        md_lines.append("No cross-sheet dependencies detected in sampled data.")
-    
-    md_lines.extend([
-        "",
-        "---",
-        "",
-        "*End of Analysis Report*"
-    ])
+        w("No cross-sheet dependencies detected in sampled data.\n")
     
-    return "\n".join(md_lines)
+    w("\n"
+      "---\n"
+      "\n"
+      "*End of Analysis Report*")
+
+
+def _failed_analysis(sheet_name, error):
+    """Placeholder analysis for a sheet that could not be analyzed."""
+    return {
+        "name": sheet_name,
+        "purpose": f"Error during analysis: {error}",
+        "dimensions": (0, 0),
+        "headers": [],
+        "hardcoded_inputs": [],
+        "time_series_data": [],
+        "calculated_columns": [],
+        "formulas": [],
+        "cross_sheet_refs": [],
+        "financial_calcs": [],
+        "anomalies": [],
+        "merged_cells_count": 0
+    }
+
+
+# Read-only workbook opened once per worker process by _open_worker_workbook
+_worker_wb = None
+
+
+def _open_worker_workbook(excel_file):
+    """Open the workbook for the sheets this process will analyze."""
+    global _worker_wb
+    _worker_wb = load_workbook(excel_file, data_only=False, read_only=True, keep_links=False)
+
+
+def _analyze_worker_sheet(sheet_name):
+    """Analyze one sheet of the worker workbook; returns (analysis, error message)."""
+    try:
+        return analyze_sheet(_worker_wb[sheet_name], sheet_name), None
+    except Exception as e:
+        return _failed_analysis(sheet_name, e), str(e)
+
+
+def analyze_workbook(excel_file, sheet_names):
+    """
+    Yield (analysis, error message) for each sheet, in workbook order.
+
+    Sheets are independent and parsing them is CPU-bound, so they are spread
+    over worker processes, each holding its own read-only workbook handle.
+    """
+    workers = min(len(sheet_names), os.cpu_count() or 1)
+    if workers <= 1:
+        _open_worker_workbook(excel_file)
+        try:
+            for sheet_name in sheet_names:
+                yield _analyze_worker_sheet(sheet_name)
+        finally:
+            _worker_wb.close()
+        return
+    
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_open_worker_workbook, initargs=(excel_file,)
+    ) as executor:
+        yield from executor.map(_analyze_worker_sheet, sheet_names)
 
 
 def main():
@@ -482,60 +697,33 @@ def main():
     print(f"\n📂 Found Excel file: {excel_file}")
     print(f"   File size: {os.path.getsize(excel_file) / (1024*1024):.2f} MB")
     
-    # Load workbook twice: once with formulas, once with calculated values
-    print("\n📖 Loading workbook (formulas mode)... This may take a minute for large files.")
-    wb_formulas = load_workbook(excel_file, data_only=False, read_only=False)
+    # Only the sheet list is needed here; workbooks are opened by the workers
+    sheet_names = read_sheet_names(excel_file)
     
-    print("📖 Loading workbook (values mode)...")
-    wb_values = load_workbook(excel_file, data_only=True, read_only=False)
-    
-    print(f"\n📋 Found {len(wb_formulas.sheetnames)} sheets:")
-    for name in wb_formulas.sheetnames:
+    print(f"\n📋 Found {len(sheet_names)} sheets:")
+    for name in sheet_names:
         print(f"   - {name}")
     
     # Analyze each sheet
     analyses = []
     print("\n🔍 Analyzing sheets...")
     
-    for sheet_name in wb_formulas.sheetnames:
+    for sheet_name, (analysis, error) in zip(sheet_names, analyze_workbook(excel_file, sheet_names)):
         print(f"   Processing: {sheet_name}...", end=" ")
-        try:
-            ws_formulas = wb_formulas[sheet_name]
-            ws_values = wb_values[sheet_name]
-            analysis = analyze_sheet(ws_formulas, ws_values, sheet_name)
-            analyses.append(analysis)
+        analyses.append(analysis)
+        if error is None:
             print(f"✓ ({analysis['dimensions'][0]}×{analysis['dimensions'][1]})")
-        except Exception as e:
-            print(f"⚠️ Error: {e}")
-            analyses.append({
-                "name": sheet_name,
-                "purpose": f"Error during analysis: {e}",
-                "dimensions": (0, 0),
-                "headers": [],
-                "hardcoded_inputs": [],
-                "time_series_data": [],
-                "calculated_columns": [],
-                "formulas": [],
-                "cross_sheet_refs": [],
-                "financial_calcs": [],
-                "anomalies": [],
-                "merged_cells": []
-            })
+        else:
+            print(f"⚠️ Error: {error}")
     
     # Generate report
     print("\n📝 Generating markdown report...")
-    report = generate_markdown_report(analyses, excel_file)
-    
     output_file = "analysis_report.md"
     with open(output_file, "w", encoding="utf-8") as f:
-        f.write(report)
+        generate_markdown_report(analyses, excel_file, f)
     
     print(f"\n✅ Report saved to: {output_file}")
-    print(f"   Report size: {len(report)} characters")
-    
-    # Close workbooks
-    wb_formulas.close()
-    wb_values.close()
+    print(f"   Report size: {os.path.getsize(output_file)} bytes")
     
     print("\n" + "=" * 60)
     print("Analysis complete!")
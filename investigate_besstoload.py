@@ -3,10 +3,30 @@ Investigation Script: Lifetime Sheet - besstoload Jump Analysis
 Purpose: Identify why besstoload values jump at years 11 and 22
 """
 
-import openpyxl
+import io
+import re
+from xml.etree.ElementTree import iterparse
+import numpy as np
+from openpyxl.reader.excel import ExcelReader
 from openpyxl.utils import get_column_letter
+from openpyxl.worksheet._reader import FORMULA_TAG, WorkSheetParser
+from openpyxl.xml.constants import SHARED_STRINGS, SHEET_MAIN_NS
 import os
 
+# Column letters indexed by 1-based column number, covering every Excel column
+COL_LETTERS = [""] + [get_column_letter(col) for col in range(1, 16385)]
+
+# (year, column) pairs whose formulas are sampled: either side of the jumps at years 11 and 22
+KEY_YEAR_COLUMNS = [(1, 2), (10, 11), (11, 12), (21, 22), (22, 23)]
+
+# Text marking a row of the Other Input sheet as part of the augmentation/MRA schedule
+AUGMENTATION_KEYWORDS_RE = re.compile(
+    r"augment|replace|cycle|year 11|year 22|mra|capacity", re.IGNORECASE
+)
+
+# Stripped from row labels so "BESS to load" and "bess_to_load" both read "besstoload"
+NON_ALPHANUMERIC_RE = re.compile(r"[^a-z0-9]+")
+
 def find_excel_file():
     """Find the Excel file in the current directory."""
     for f in os.listdir('.'):
@@ -14,229 +34,383 @@ def find_excel_file():
             return f
     return None
 
-def investigate_besstoload(excel_file):
-    """Extract besstoload data from Lifetime sheet and related Loss sheet data."""
-    
-    print(f"Loading workbook: {excel_file}")
-    
-    # Load with formulas
-    wb_formulas = openpyxl.load_workbook(excel_file, data_only=False, read_only=False)
-    # Load with calculated values
-    wb_values = openpyxl.load_workbook(excel_file, data_only=True, read_only=False)
-    
-    results = []
+def read_shared_strings(src):
+    """
+    Read the shared string table as plain text, one entry per <si> element.
+
+    Gives the same strings as openpyxl's read_string_table: the plain <t> text
+    followed by the text of any rich-text runs, with phonetic (<rPh>) runs left
+    out. The runs are joined directly instead of being built into openpyxl
+    Text objects first.
+    """
+    si_tag = f"{{{SHEET_MAIN_NS}}}si"
+    text_tag = f"{{{SHEET_MAIN_NS}}}t"
+    run_text_path = f"{{{SHEET_MAIN_NS}}}r/{text_tag}"
+    strings = []
+    for _, element in iterparse(src):
+        if element.tag == si_tag:
+            parts = element.findall(text_tag) + element.findall(run_text_path)
+            strings.append("".join([t.text or "" for t in parts]).replace("x005F_", ""))
+            element.clear()
+    return strings
+
+class WorkbookReader(ExcelReader):
+    """Read-only workbook reader that loads the shared strings with read_shared_strings."""
+
+    def __init__(self, filename):
+        super().__init__(filename, read_only=True)
+
+    def read_strings(self):
+        ct = self.package.find(SHARED_STRINGS)
+        if ct is not None:
+            with self.archive.open(ct.PartName[1:]) as src:
+                self.shared_strings = read_shared_strings(src)
+
+def load_workbook(excel_file):
+    """Open excel_file as a read-only workbook."""
+    reader = WorkbookReader(excel_file)
+    reader.read()
+    return reader.wb
+
+class FormulaValueParser(WorkSheetParser):
+    """
+    Worksheet parser that reads each cell's formula and cached value together.
+
+    Every <c> element carries both the formula (<f>) and the value Excel last
+    calculated for it (<v>), so one pass replaces loading the workbook with
+    data_only=False and again with data_only=True. Parsed cells gain a
+    "formula" key: the formula string, or the plain value for constants.
+    """
+
+    def __init__(self, src, shared_strings, **kwargs):
+        super().__init__(src, shared_strings, data_only=True, **kwargs)
+
+    def parse_cell(self, element):
+        cell = super().parse_cell(element)
+        if element.find(FORMULA_TAG) is not None:
+            # parse_formula translates shared formulas to this cell
+            cell["formula"] = self.parse_formula(element)
+        else:
+            cell["formula"] = cell["value"]
+        return cell
+
+def read_sheet(ws):
+    """
+    Read a read-only worksheet's formulas and cached values in one streaming pass.
+
+    Returns (formula_rows, value_rows, max_row, max_column) where
+    value_rows[r - 1][c - 1] is the cached value at (r, c) and formula_rows holds
+    what a data_only=False workbook shows there. The extent is taken from the
+    cells actually present; the sheet's <dimension> element can overstate it.
+    """
+    wb = ws.parent
+    formula_rows = []
+    value_rows = []
+    # ReadOnlyWorksheet has no public handle on its XML part or shared strings
+    with ws._get_source() as src:
+        parser = FormulaValueParser(
+            src,
+            ws._shared_strings,
+            epoch=wb.epoch,
+            date_formats=wb._date_formats,
+            timedelta_formats=wb._timedelta_formats,
+        )
+        for row_idx, cells in parser.parse():
+            # Rows missing from the XML are empty
+            while len(value_rows) < row_idx - 1:
+                formula_rows.append(())
+                value_rows.append(())
+            width = cells[-1]["column"] if cells else 0
+            formulas = [None] * width
+            values = [None] * width
+            for cell in cells:
+                formulas[cell["column"] - 1] = cell["formula"]
+                values[cell["column"] - 1] = cell["value"]
+            formula_rows.append(tuple(formulas))
+            value_rows.append(tuple(values))
+    while value_rows and not value_rows[-1]:
+        formula_rows.pop()
+        value_rows.pop()
+    max_column = max((len(row) for row in value_rows), default=0)
+    return formula_rows, value_rows, len(value_rows), max_column
+
+def cell_value(rows, row, col):
+    """Value at (row, col) of a sheet read by read_sheet, or None outside it."""
+    if row > len(rows):
+        return None
+    values = rows[row - 1]
+    return values[col - 1] if col <= len(values) else None
+
+# Element-wise "is this cell a number" test over an object array
+_is_number = np.frompyfunc(lambda val: isinstance(val, (int, float)), 1, 1)
+
+def numeric_matrix(rows, width):
+    """
+    Cell values as a (len(rows), width) float array.
+
+    Every row must hold width values; anything that is not a number becomes NaN.
+    """
+    cells = np.empty((len(rows), width), dtype=object)
+    if cells.size:
+        cells[...] = rows
+    return np.where(_is_number(cells).astype(bool), cells, np.nan).astype(float)
+
+def percent_changes(before, after):
+    """
+    Element-wise percent change from before to after.
+
+    Changes from a zero base are reported as 0, and any pair with a missing
+    (NaN) value gives NaN, so neither is ever flagged as a jump.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(before != 0, (after - before) / before * 100, 0.0)
+
+def write_lifetime_section(wb, write):
+    """Write the Lifetime sheet row, jump and formula analysis."""
     
     # ========== LIFETIME SHEET ANALYSIS ==========
-    results.append("=" * 80)
-    results.append("LIFETIME SHEET - BESSTOLOAD INVESTIGATION")
-    results.append("=" * 80)
+    write("=" * 80 + "\n")
+    write("LIFETIME SHEET - BESSTOLOAD INVESTIGATION\n")
+    write("=" * 80 + "\n")
     
-    if 'Lifetime' in wb_formulas.sheetnames:
-        ws_f = wb_formulas['Lifetime']
-        ws_v = wb_values['Lifetime']
+    if 'Lifetime' in wb.sheetnames:
+        ws_f, ws_v, _, f_max_column = read_sheet(wb['Lifetime'])
+        headers = [cell_value(ws_v, 1, col) for col in range(1, f_max_column + 1)]
+        
+        # Single pass over the sheet: labels, year values and key-year formulas
+        # for every labelled row, from which all the sections below are written
+        labels = {}
+        data_rows = []
+        for row, row_values in enumerate(ws_v, start=1):
+            label = row_values[0] if row_values else None
+            if not label:
+                continue
+            labels[row] = label
+            if row == 1:
+                continue
+            # Year 1 = Col B, etc.; years 1-25 (columns B-Z typically)
+            year_values = [(col - 1, cell_value(ws_v, row, col))
+                           for col in range(2, min(f_max_column + 1, 28))]  # B to AA
+            key_year_cells = [(year, col, cell_value(ws_f, row, col), cell_value(ws_v, row, col))
+                              for year, col in KEY_YEAR_COLUMNS if col <= f_max_column]
+            data_rows.append((row, label, year_values, key_year_cells))
+        
+        # Year-over-year changes across the jump years for all rows at once
+        year_count = max(min(f_max_column + 1, 28) - 2, 0)
+        year_matrix = numeric_matrix(
+            [[val for _, val in year_values] for _, _, year_values, _ in data_rows], year_count
+        )
+        lifetime_jumps = []  # (before year, after year, values before, values after, pct, flagged)
+        for before_year, after_year in [(10, 11), (21, 22)]:
+            if year_count >= after_year:
+                before = year_matrix[:, before_year - 1]
+                after = year_matrix[:, after_year - 1]
+                pct = percent_changes(before, after)
+                lifetime_jumps.append((before_year, after_year, before, after, pct, np.abs(pct) > 5))  # More than 5% change
         
         # First, map row labels to find besstoload
-        results.append("\n### Row Labels in Lifetime Sheet (Column A):")
+        write("\n### Row Labels in Lifetime Sheet (Column A):\n")
         row_map = {}
-        for row in range(1, ws_f.max_row + 1):
-            cell_val = ws_v[f'A{row}'].value
-            if cell_val:
-                row_map[row] = str(cell_val).strip().lower()
-                results.append(f"  Row {row}: {cell_val}")
+        for row, cell_val in labels.items():
+            # Lower-cased with spaces, underscores and punctuation removed
+            row_map[row] = NON_ALPHANUMERIC_RE.sub("", str(cell_val).lower())
+            write(f"  Row {row}: {cell_val}\n")
         
         # Find besstoload row (case-insensitive search)
         besstoload_row = None
         for row, label in row_map.items():
-            if 'besstoload' in label or 'bess to load' in label or 'bess_to_load' in label:
+            if 'besstoload' in label:
                 besstoload_row = row
                 break
         
         if besstoload_row:
-            results.append(f"\n### Found besstoload at Row {besstoload_row}")
+            write(f"\n### Found besstoload at Row {besstoload_row}\n")
         else:
-            results.append("\n### besstoload row not found by exact match - showing all rows with data")
+            write("\n### besstoload row not found by exact match - showing all rows with data\n")
         
         # Get column headers (Year numbers in row 1)
-        results.append("\n### Column Headers (Row 1):")
+        write("\n### Column Headers (Row 1):\n")
         col_headers = {}
-        for col in range(1, ws_f.max_column + 1):
-            header = ws_v.cell(row=1, column=col).value
+        for col, header in enumerate(headers, start=1):
             if header:
                 col_headers[col] = header
-                results.append(f"  Col {get_column_letter(col)}: {header}")
+                write(f"  Col {COL_LETTERS[col]}: {header}\n")
         
         # Extract ALL rows with their values to find besstoload
-        results.append("\n### All Rows - Values Across Years:")
-        results.append("-" * 80)
-        
-        for row in range(2, ws_f.max_row + 1):
-            row_label = ws_v[f'A{row}'].value
-            if row_label:
-                results.append(f"\n**Row {row}: {row_label}**")
-                
-                # Get values for years 1-25 (columns B-Z typically)
-                values = []
-                for col in range(2, min(ws_f.max_column + 1, 28)):  # B to AA
-                    val = ws_v.cell(row=row, column=col).value
-                    year_num = col - 1  # Year 1 = Col B, etc.
-                    if val is not None:
-                        values.append(f"Y{year_num}:{val:.4f}" if isinstance(val, (int, float)) else f"Y{year_num}:{val}")
-                
-                # Show values in groups of 5
-                for i in range(0, len(values), 5):
-                    results.append("  " + " | ".join(values[i:i+5]))
-                
-                # Check for jumps at year 11 and 22
-                year_values = {}
-                for col in range(2, min(ws_f.max_column + 1, 28)):
-                    val = ws_v.cell(row=row, column=col).value
-                    if isinstance(val, (int, float)):
-                        year_values[col - 1] = val
-                
-                # Detect jumps
-                if 10 in year_values and 11 in year_values:
-                    change_10_11 = year_values[11] - year_values[10]
-                    pct_change = (change_10_11 / year_values[10] * 100) if year_values[10] != 0 else 0
-                    if abs(pct_change) > 5:  # More than 5% change
-                        results.append(f"  ⚠️ JUMP Y10→Y11: {year_values[10]:.4f} → {year_values[11]:.4f} ({pct_change:+.2f}%)")
-                
-                if 21 in year_values and 22 in year_values:
-                    change_21_22 = year_values[22] - year_values[21]
-                    pct_change = (change_21_22 / year_values[21] * 100) if year_values[21] != 0 else 0
-                    if abs(pct_change) > 5:
-                        results.append(f"  ⚠️ JUMP Y21→Y22: {year_values[21]:.4f} → {year_values[22]:.4f} ({pct_change:+.2f}%)")
+        write("\n### All Rows - Values Across Years:\n")
+        write("-" * 80 + "\n")
+        
+        for idx, (row, row_label, year_values, _) in enumerate(data_rows):
+            write(f"\n**Row {row}: {row_label}**\n")
+            
+            values = [f"Y{year_num}:{val:.4f}" if isinstance(val, (int, float)) else f"Y{year_num}:{val}"
+                      for year_num, val in year_values if val is not None]
+            
+            # Show values in groups of 5
+            for i in range(0, len(values), 5):
+                write("  " + " | ".join(values[i:i+5]) + "\n")
+            
+            # Report jumps at year 11 and 22
+            for before_year, after_year, before, after, pct, flagged in lifetime_jumps:
+                if flagged[idx]:
+                    write(f"  ⚠️ JUMP Y{before_year}→Y{after_year}: {before[idx]:.4f} → {after[idx]:.4f} ({pct[idx]:+.2f}%)\n")
         
         # Now get formulas for all rows
-        results.append("\n" + "=" * 80)
-        results.append("FORMULA ANALYSIS")
-        results.append("=" * 80)
-        
-        for row in range(2, ws_f.max_row + 1):
-            row_label = ws_v[f'A{row}'].value
-            if row_label:
-                results.append(f"\n**Row {row}: {row_label}**")
-                
-                # Sample formulas at key years
-                for year, col in [(1, 2), (10, 11), (11, 12), (21, 22), (22, 23)]:
-                    if col <= ws_f.max_column:
-                        formula = ws_f.cell(row=row, column=col).value
-                        value = ws_v.cell(row=row, column=col).value
-                        if formula and isinstance(formula, str) and formula.startswith('='):
-                            results.append(f"  Year {year} (Col {get_column_letter(col)}): {formula}")
-                            results.append(f"    → Value: {value}")
-                        elif formula:
-                            results.append(f"  Year {year} (Col {get_column_letter(col)}): HARDCODED = {formula}")
+        write("\n" + "=" * 80 + "\n")
+        write("FORMULA ANALYSIS\n")
+        write("=" * 80 + "\n")
+        
+        for row, row_label, _, key_year_cells in data_rows:
+            write(f"\n**Row {row}: {row_label}**\n")
+            
+            # Sample formulas at key years
+            for year, col, formula, value in key_year_cells:
+                if formula and isinstance(formula, str) and formula.startswith('='):
+                    write(f"  Year {year} (Col {COL_LETTERS[col]}): {formula}\n")
+                    write(f"    → Value: {value}\n")
+                elif formula:
+                    write(f"  Year {year} (Col {COL_LETTERS[col]}): HARDCODED = {formula}\n")
+
+def write_loss_section(wb, write):
+    """Write the Loss sheet degradation factors and their jumps."""
     
     # ========== LOSS SHEET ANALYSIS ==========
-    results.append("\n" + "=" * 80)
-    results.append("LOSS SHEET - DEGRADATION FACTORS")
-    results.append("=" * 80)
+    write("\n" + "=" * 80 + "\n")
+    write("LOSS SHEET - DEGRADATION FACTORS\n")
+    write("=" * 80 + "\n")
     
-    if 'Loss' in wb_formulas.sheetnames:
-        ws_loss_v = wb_values['Loss']
-        ws_loss_f = wb_formulas['Loss']
+    if 'Loss' in wb.sheetnames:
+        _, ws_loss_v, loss_max_row, loss_max_column = read_sheet(wb['Loss'])
         
-        results.append("\n### Loss Sheet Structure:")
+        write("\n### Loss Sheet Structure:\n")
         
         # Get headers
-        results.append("\nColumn Headers (Row 1 or 2):")
-        for col in range(1, min(ws_loss_v.max_column + 1, 15)):
-            h1 = ws_loss_v.cell(row=1, column=col).value
-            h2 = ws_loss_v.cell(row=2, column=col).value
-            h3 = ws_loss_v.cell(row=3, column=col).value
-            results.append(f"  Col {get_column_letter(col)}: R1={h1}, R2={h2}, R3={h3}")
+        write("\nColumn Headers (Row 1 or 2):\n")
+        for col in range(1, min(loss_max_column + 1, 15)):
+            h1 = cell_value(ws_loss_v, 1, col)
+            h2 = cell_value(ws_loss_v, 2, col)
+            h3 = cell_value(ws_loss_v, 3, col)
+            write(f"  Col {COL_LETTERS[col]}: R1={h1}, R2={h2}, R3={h3}\n")
         
         # The Lifetime formulas reference Loss!$A$3:$A$27 and Loss!$E$3:$E$27
         # So let's extract columns A and E (and nearby) from rows 3-27
-        results.append("\n### Loss Data (Rows 3-27) - Columns A through H:")
+        write("\n### Loss Data (Rows 3-27) - Columns A through H:\n")
         
         header_row = []
         for col in range(1, 9):
-            h = ws_loss_v.cell(row=2, column=col).value
-            header_row.append(str(h) if h else f"Col{get_column_letter(col)}")
-        results.append("  " + " | ".join(header_row))
-        results.append("  " + "-" * 60)
+            h = cell_value(ws_loss_v, 2, col)
+            header_row.append(str(h) if h else f"Col{COL_LETTERS[col]}")
+        write("  " + " | ".join(header_row) + "\n")
+        write("  " + "-" * 60 + "\n")
         
-        for row in range(3, min(ws_loss_v.max_row + 1, 28)):
+        for row in range(3, min(loss_max_row + 1, 28)):
             row_data = []
             for col in range(1, 9):
-                val = ws_loss_v.cell(row=row, column=col).value
+                val = cell_value(ws_loss_v, row, col)
                 if isinstance(val, float):
                     row_data.append(f"{val:.4f}")
                 elif val is not None:
                     row_data.append(str(val)[:12])
                 else:
                     row_data.append("-")
-            results.append(f"  Row {row}: " + " | ".join(row_data))
+            write(f"  Row {row}: " + " | ".join(row_data) + "\n")
         
         # Check for jumps in Loss sheet degradation factors
-        results.append("\n### Loss Sheet - Degradation Jump Analysis:")
+        write("\n### Loss Sheet - Degradation Jump Analysis:\n")
         
-        for col in range(2, min(ws_loss_v.max_column + 1, 15)):
-            col_header = ws_loss_v.cell(row=2, column=col).value
-            
-            # Get values for years 10, 11, 21, 22
-            values = {}
-            for row in range(3, min(ws_loss_v.max_row + 1, 28)):
-                year_val = ws_loss_v.cell(row=row, column=1).value
-                data_val = ws_loss_v.cell(row=row, column=col).value
-                if year_val and isinstance(data_val, (int, float)):
-                    values[int(year_val) if isinstance(year_val, (int, float)) else 0] = data_val
-            
-            # Check for jumps
-            if 10 in values and 11 in values and values[10] != 0:
-                change = (values[11] - values[10]) / values[10] * 100
-                if abs(change) > 2:
-                    results.append(f"  {col_header} (Col {get_column_letter(col)}): Y10={values[10]:.4f} → Y11={values[11]:.4f} ({change:+.2f}%)")
-            
-            if 21 in values and 22 in values and values[21] != 0:
-                change = (values[22] - values[21]) / values[21] * 100
-                if abs(change) > 2:
-                    results.append(f"  {col_header} (Col {get_column_letter(col)}): Y21={values[21]:.4f} → Y22={values[22]:.4f} ({change:+.2f}%)")
+        loss_rows = range(3, min(loss_max_row + 1, 28))
+        loss_cols = range(2, min(loss_max_column + 1, 15))
+        # Row position of each year in column A; non-numeric years count as year 0
+        year_positions = {}
+        for pos, row in enumerate(loss_rows):
+            year_val = cell_value(ws_loss_v, row, 1)
+            if year_val:
+                year_positions[int(year_val) if isinstance(year_val, (int, float)) else 0] = pos
+        loss_matrix = numeric_matrix(
+            [[cell_value(ws_loss_v, row, col) for col in loss_cols] for row in loss_rows], len(loss_cols)
+        )
+        
+        # Changes across the jump years for all factor columns at once
+        loss_jumps = []
+        for before_year, after_year in [(10, 11), (21, 22)]:
+            if before_year in year_positions and after_year in year_positions:
+                before = loss_matrix[year_positions[before_year]]
+                after = loss_matrix[year_positions[after_year]]
+                pct = percent_changes(before, after)
+                loss_jumps.append((before_year, after_year, before, after, pct, np.abs(pct) > 2))
+        
+        for idx, col in enumerate(loss_cols):
+            col_header = cell_value(ws_loss_v, 2, col)
+            for before_year, after_year, before, after, pct, flagged in loss_jumps:
+                if flagged[idx]:
+                    write(f"  {col_header} (Col {COL_LETTERS[col]}): Y{before_year}={before[idx]:.4f} → Y{after_year}={after[idx]:.4f} ({pct[idx]:+.2f}%)\n")
+
+def write_other_input_section(wb, write):
+    """Write the Other Input rows about augmentation and MRA."""
     
     # ========== OTHER INPUT - AUGMENTATION SCHEDULE ==========
-    results.append("\n" + "=" * 80)
-    results.append("OTHER INPUT SHEET - AUGMENTATION SCHEDULE")
-    results.append("=" * 80)
+    write("\n" + "=" * 80 + "\n")
+    write("OTHER INPUT SHEET - AUGMENTATION SCHEDULE\n")
+    write("=" * 80 + "\n")
     
-    if 'Other Input' in wb_formulas.sheetnames:
-        ws_other = wb_values['Other Input']
+    if 'Other Input' in wb.sheetnames:
+        _, ws_other, other_max_row, other_max_column = read_sheet(wb['Other Input'])
         
-        results.append("\n### Searching for Augmentation/MRA related data:")
+        write("\n### Searching for Augmentation/MRA related data:\n")
         
-        for row in range(1, min(ws_other.max_row + 1, 100)):
-            for col in range(1, min(ws_other.max_column + 1, 10)):
-                val = ws_other.cell(row=row, column=col).value
+        for row in range(1, min(other_max_row + 1, 100)):
+            for col in range(1, min(other_max_column + 1, 10)):
+                val = cell_value(ws_other, row, col)
                 if val and isinstance(val, str):
-                    val_lower = val.lower()
-                    if any(kw in val_lower for kw in ['augment', 'replace', 'cycle', 'year 11', 'year 22', 'mra', 'capacity']):
+                    if AUGMENTATION_KEYWORDS_RE.search(val):
                         # Found relevant row, extract the full row
                         row_data = []
-                        for c in range(1, min(ws_other.max_column + 1, 10)):
-                            cell_val = ws_other.cell(row=row, column=c).value
+                        for c in range(1, min(other_max_column + 1, 10)):
+                            cell_val = cell_value(ws_other, row, c)
                             if cell_val is not None:
-                                row_data.append(f"{get_column_letter(c)}:{cell_val}")
-                        results.append(f"  Row {row}: " + " | ".join(row_data))
+                                row_data.append(f"{COL_LETTERS[c]}:{cell_val}")
+                        write(f"  Row {row}: " + " | ".join(row_data) + "\n")
                         break
+
+def investigate_besstoload(excel_file, out=None):
+    """
+    Extract besstoload data from Lifetime sheet and related Loss sheet data.
+
+    The report is written to the text stream out; without one it is built in
+    memory and returned as a string.
+    """
     
-    wb_formulas.close()
-    wb_values.close()
+    print(f"Loading workbook: {excel_file}")
+    
+    # Formulas and cached values are both read from the one workbook
+    wb = load_workbook(excel_file)
+    
+    buf = out if out is not None else io.StringIO()
     
-    return "\n".join(results)
+    # Each section reads its own sheet and writes independently of the others
+    for write_section in (write_lifetime_section, write_loss_section, write_other_input_section):
+        write_section(wb, buf.write)
+        buf.flush()
+    
+    wb.close()
+    
+    if out is None:
+        return buf.getvalue()
 
 if __name__ == "__main__":
     excel_file = find_excel_file()
     if excel_file:
-        report = investigate_besstoload(excel_file)
-        
-        # Write to file
+        # Stream the report straight to file as each section is scanned
         output_file = "besstoload_investigation.md"
         with open(output_file, 'w', encoding='utf-8') as f:
             f.write("# BESS-to-Load Jump Investigation Report\n\n")
-            f.write(report)
+            investigate_besstoload(excel_file, f)
         
         print(f"\n✅ Investigation complete. Report saved to: {output_file}")
         print("\n" + "=" * 60)
-        print(report)
+        with open(output_file, encoding='utf-8') as f:
+            f.readline()  # Skip the title and blank line that precede the report
+            f.readline()
+            print(f.read())
     else:
         print("❌ No Excel file found in current directory")
@@ -7,6 +7,7 @@ feed the lifetime and financial layers.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from re_storage.core.exceptions import InputValidationError
@@ -47,11 +48,14 @@ def calculate_total_solar_generation_mwh(
             "scale_factor must be positive.", field="scale_factor", value=scale_factor
         )
 
-    solar_gen_kw = hourly_data[solar_gen_column]
-    if (solar_gen_kw < 0).any():
+    # Reduce on the raw float array: one min pass for the sign check, one sum.
+    # fmin skips NaN, so missing hours neither hide nor trigger a negative
+    solar_gen_kw = hourly_data[solar_gen_column].to_numpy(dtype=float)
+    if solar_gen_kw.size and np.fmin.reduce(solar_gen_kw) < 0:
         raise InputValidationError("solar_gen_kw contains negative values.")
 
-    total_kwh = float(solar_gen_kw.sum() * scale_factor)
+    # nansum matches Series.sum, which skips missing hours
+    total_kwh = float(np.nansum(solar_gen_kw)) * scale_factor
     return total_kwh / 1000.0
 
 
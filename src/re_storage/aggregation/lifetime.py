@@ -7,6 +7,7 @@ factors from the Loss table.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 from re_storage.core.exceptions import DegradationTableError, InputValidationError
@@ -24,15 +25,11 @@ def _validate_degradation_table(
             f"Missing required degradation columns: {sorted(missing)}"
         )
 
-    if (degradation_table["pv_factor"] <= 0).any() or (
-        degradation_table["pv_factor"] > 1
-    ).any():
-        raise InputValidationError("pv_factor must be within (0, 1].")
-
-    if (degradation_table["battery_factor_with_replacement"] <= 0).any() or (
-        degradation_table["battery_factor_with_replacement"] > 1
-    ).any():
-        raise InputValidationError("battery_factor_with_replacement must be within (0, 1].")
+    for column in ("pv_factor", "battery_factor_with_replacement"):
+        factors = degradation_table[column].to_numpy(dtype=float)
+        # fmin/fmax skip NaN entries; coverage gaps are reported separately
+        if factors.size and (np.fmin.reduce(factors) <= 0 or np.fmax.reduce(factors) > 1):
+            raise InputValidationError(f"{column} must be within (0, 1].")
 
     years = set(degradation_table["year"])
     missing_years = [year for year in range(1, project_years + 1) if year not in years]
@@ -43,6 +40,63 @@ def _validate_degradation_table(
         )
 
 
+def _degradation_factors(
+    degradation_table: pd.DataFrame,
+    project_years: int,
+    columns: list[str],
+) -> dict[str, np.ndarray]:
+    """
+    Validate the degradation table once and pull out factors per project year.
+
+    Args:
+        degradation_table: Loss table with year and factor columns.
+        project_years: Number of years in the projection.
+        columns: Factor columns to extract.
+
+    Returns:
+        Mapping of factor column to an array covering years 1..project_years.
+
+    Raises:
+        DegradationTableError: If coverage is incomplete.
+        InputValidationError: If the table is invalid.
+    """
+    _validate_degradation_table(degradation_table, project_years)
+
+    factors = degradation_table.set_index("year")[columns].reindex(
+        range(1, project_years + 1)
+    )
+    for column in columns:
+        if factors[column].isna().any():
+            raise DegradationTableError(f"Degradation table has missing {column} years.")
+    return {column: factors[column].to_numpy() for column in columns}
+
+
+def _validate_year1_generation(year1_generation_mwh: float) -> None:
+    if year1_generation_mwh < 0:
+        raise InputValidationError("year1_generation_mwh cannot be negative.")
+
+
+def _validate_battery_inputs(initial_capacity_kwh: float, replacement_cycle: int) -> None:
+    if initial_capacity_kwh <= 0:
+        raise InputValidationError("initial_capacity_kwh must be positive.")
+    if replacement_cycle <= 0:
+        raise InputValidationError("replacement_cycle must be positive.")
+
+
+def _project_generation_array(
+    year1_generation_mwh: float, pv_factors: np.ndarray
+) -> np.ndarray:
+    """Generation (MWh) per year from validated pv_factor values."""
+    return year1_generation_mwh * pv_factors
+
+
+def _project_battery_capacity_array(
+    initial_capacity_kwh: float, battery_factors: np.ndarray
+) -> np.ndarray:
+    """Effective capacity (kWh) per year from validated battery factor values."""
+    return initial_capacity_kwh * battery_factors
+
+
 def project_lifetime_generation_mwh(
     year1_generation_mwh: float,
     degradation_table: pd.DataFrame,
@@ -63,20 +117,14 @@ def project_lifetime_generation_mwh(
         DegradationTableError: If coverage is incomplete.
         InputValidationError: If inputs are invalid.
     """
-    if year1_generation_mwh < 0:
-        raise InputValidationError("year1_generation_mwh cannot be negative.")
-
-    _validate_degradation_table(degradation_table, project_years)
-
-    factors = degradation_table.set_index("year")["pv_factor"].reindex(
-        range(1, project_years + 1)
-    )
-    if factors.isna().any():
-        raise DegradationTableError("Degradation table has missing pv_factor years.")
+    _validate_year1_generation(year1_generation_mwh)
+    factors = _degradation_factors(degradation_table, project_years, ["pv_factor"])[
+        "pv_factor"
+    ]
 
     return pd.Series(
-        [year1_generation_mwh * factors.loc[year] for year in factors.index],
-        index=factors.index,
+        _project_generation_array(year1_generation_mwh, factors),
+        index=range(1, project_years + 1),
         name="generation_mwh",
     )
 
@@ -103,24 +151,14 @@ def project_battery_capacity_kwh(
         DegradationTableError: If coverage is incomplete.
         InputValidationError: If inputs are invalid.
     """
-    if initial_capacity_kwh <= 0:
-        raise InputValidationError("initial_capacity_kwh must be positive.")
-    if replacement_cycle <= 0:
-        raise InputValidationError("replacement_cycle must be positive.")
-
-    _validate_degradation_table(degradation_table, project_years)
-
-    factors = degradation_table.set_index("year")["battery_factor_with_replacement"].reindex(
-        range(1, project_years + 1)
-    )
-    if factors.isna().any():
-        raise DegradationTableError(
-            "Degradation table has missing battery_factor_with_replacement years."
-        )
+    _validate_battery_inputs(initial_capacity_kwh, replacement_cycle)
+    factors = _degradation_factors(
+        degradation_table, project_years, ["battery_factor_with_replacement"]
+    )["battery_factor_with_replacement"]
 
     return pd.Series(
-        [initial_capacity_kwh * factors.loc[year] for year in factors.index],
-        index=factors.index,
+        _project_battery_capacity_array(initial_capacity_kwh, factors),
+        index=range(1, project_years + 1),
         name="battery_capacity_kwh",
     )
 
@@ -165,34 +203,30 @@ def build_lifetime_projection(
     year1_dppa_revenue_usd = float(year1_totals.loc[1, "total_dppa_revenue_usd"])
     year1_grid_savings_usd = float(year1_totals.loc[1, "total_grid_savings_usd"])
 
-    generation_mwh = project_lifetime_generation_mwh(
-        year1_generation_mwh,
-        degradation_table,
-        project_years=project_years,
-    )
-    battery_capacity_kwh = project_battery_capacity_kwh(
-        initial_capacity_kwh,
-        degradation_table,
-        replacement_cycle=replacement_cycle,
-        project_years=project_years,
+    _validate_year1_generation(year1_generation_mwh)
+    _validate_battery_inputs(initial_capacity_kwh, replacement_cycle)
+    # Validate and index the table once for both projections
+    factors = _degradation_factors(
+        degradation_table, project_years, ["pv_factor", "battery_factor_with_replacement"]
     )
 
-    if year1_generation_mwh > 0:
-        pv_factors = generation_mwh / year1_generation_mwh
-    else:
-        pv_factors = pd.Series(0.0, index=generation_mwh.index)
+    generation_mwh = _project_generation_array(year1_generation_mwh, factors["pv_factor"])
+    battery_capacity_kwh = _project_battery_capacity_array(
+        initial_capacity_kwh, factors["battery_factor_with_replacement"]
+    )
 
-    dppa_revenue_usd = year1_dppa_revenue_usd * pv_factors
-    grid_savings_usd = year1_grid_savings_usd * pv_factors
+    # Revenue and savings follow generation; with no Year 1 generation they are zero
+    pv_factors = factors["pv_factor"] if year1_generation_mwh > 0 else np.zeros(project_years)
 
     result = pd.DataFrame(
         {
-            "year": generation_mwh.index,
-            "generation_mwh": generation_mwh.values,
-            "battery_capacity_kwh": battery_capacity_kwh.values,
-            "dppa_revenue_usd": dppa_revenue_usd.values,
-            "grid_savings_usd": grid_savings_usd.values,
-        }
+            "year": np.arange(1, project_years + 1, dtype=np.int64),
+            "generation_mwh": generation_mwh,
+            "battery_capacity_kwh": battery_capacity_kwh,
+            "dppa_revenue_usd": year1_dppa_revenue_usd * pv_factors,
+            "grid_savings_usd": year1_grid_savings_usd * pv_factors,
+        },
+        copy=False,
     )
 
     return result.set_index("year", drop=False)
@@ -7,12 +7,47 @@ Helper sheet logic in the Excel model.
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_dtype, is_float_dtype, is_integer_dtype
 
 from re_storage.core.exceptions import InputValidationError
 from re_storage.core.types import HourlyTimeSeries, MonthlyTimeSeries
 
 
+def _calendar_months(datetime_series: pd.Series) -> pd.Series:
+    """Calendar month (1-12) of each timestamp, named after the datetime column."""
+    if not is_datetime64_dtype(datetime_series):
+        # Timezone-aware stamps must be read in their own zone, not UTC
+        return datetime_series.dt.month
+    # Naive datetime64: whole months since 1970-01, folded onto the calendar
+    months = datetime_series.to_numpy().astype("datetime64[M]").astype(np.int64) % 12 + 1
+    return pd.Series(
+        months.astype(np.int32), index=datetime_series.index, name=datetime_series.name
+    )
+
+
+def _monthly_reduce(month_codes: np.ndarray, values: np.ndarray, how: str) -> np.ndarray:
+    """
+    Reduce hourly values into the 12 calendar-month bins.
+
+    Args:
+        month_codes: Month of each value as 0 (January) to 11 (December).
+        values: Hourly values as float64.
+        how: "sum" or "max"; NaN values are skipped, as in a pandas groupby.
+
+    Returns:
+        Array of 12 monthly results; unobserved months are 0 (sum) or NaN (max).
+    """
+    if how == "sum":
+        return np.bincount(
+            month_codes, weights=np.where(np.isnan(values), 0.0, values), minlength=12
+        )
+    result = np.full(12, np.nan)
+    np.fmax.at(result, month_codes, values)
+    return result
+
+
 def aggregate_hourly_to_monthly(
     hourly_data: HourlyTimeSeries,
     demand_reduction_target_ratio: float,
@@ -64,19 +99,41 @@ def aggregate_hourly_to_monthly(
     if missing:
         raise InputValidationError(f"Missing required columns: {sorted(missing)}")
 
-    datetime_series = pd.to_datetime(hourly_data[datetime_column], errors="coerce")
+    datetime_series = hourly_data[datetime_column]
+    if not is_datetime64_dtype(datetime_series):
+        datetime_series = pd.to_datetime(datetime_series, errors="coerce")
     if datetime_series.isna().any():
         raise InputValidationError("datetime_column contains invalid timestamps.")
 
-    month_index = datetime_series.dt.month
-
-    aggregated = hourly_data.groupby(month_index).agg(
-        **{
-            "baseline_peak_kw": (load_column, "max"),
-            "bau_grid_expense_usd": (bau_expense_column, "sum"),
-            "re_grid_expense_usd": (re_expense_column, "sum"),
-            "peak_demand_after_solar_kw": (grid_after_solar_column, "max"),
-            "peak_demand_after_re_kw": (grid_after_re_column, "max"),
+    # Months are a fixed 1-12 domain, so bin by month code instead of hashing
+    # and sorting group keys; only months present in the data are returned
+    month_codes = _calendar_months(datetime_series).to_numpy() - 1
+    observed = np.bincount(month_codes, minlength=12) > 0
+    aggregations = {
+        "baseline_peak_kw": (load_column, "max"),
+        "bau_grid_expense_usd": (bau_expense_column, "sum"),
+        "re_grid_expense_usd": (re_expense_column, "sum"),
+        "peak_demand_after_solar_kw": (grid_after_solar_column, "max"),
+        "peak_demand_after_re_kw": (grid_after_re_column, "max"),
+    }
+    aggregated = pd.DataFrame(
+        {
+            name: _monthly_reduce(
+                month_codes,
+                hourly_data[column].to_numpy(dtype=float, na_value=np.nan),
+                how,
+            )[observed]
+            for name, (column, how) in aggregations.items()
+        },
+        index=pd.Index(np.arange(1, 13, dtype=np.int32)[observed], name=datetime_column),
+    )
+    # The bins are computed in float64; return each aggregate in its source
+    # column's integer or float dtype, as a pandas groupby would
+    aggregated = aggregated.astype(
+        {
+            name: hourly_data[column].dtype
+            for name, (column, _) in aggregations.items()
+            if is_integer_dtype(hourly_data[column]) or is_float_dtype(hourly_data[column])
         }
     )
 
@@ -5,6 +5,8 @@ This module provides the foundational building blocks used across
 the entire RE-Storage simulation engine.
 """
 
+from typing import TYPE_CHECKING
+
 from re_storage.core.exceptions import (
     DSCRConstraintError,
     DegradationTableError,
@@ -18,19 +20,20 @@ from re_storage.core.types import (
     ChargingMode,
     EnergyKWH,
     EnergyMWH,
-    HourlyTimeSeries,
-    MonthlyTimeSeries,
-    AnnualTimeSeries,
     Percentage,
     PowerKW,
     PriceUSDPerKWH,
     Ratio,
     StrategyMode,
     TimePeriod,
+    HOURS_PER_DAY,
     HOURS_PER_YEAR,
     HOURS_PER_LEAP_YEAR,
 )
 
+if TYPE_CHECKING:
+    from re_storage.core.types import AnnualTimeSeries, HourlyTimeSeries, MonthlyTimeSeries
+
 __all__ = [
     # Exceptions
     "REStorageError",
@@ -55,6 +58,16 @@ __all__ = [
     "ChargingMode",
     "TimePeriod",
     # Constants
+    "HOURS_PER_DAY",
     "HOURS_PER_YEAR",
     "HOURS_PER_LEAP_YEAR",
 ]
+
+
+def __getattr__(name: str) -> object:
+    # The DataFrame aliases import pandas, so they are resolved on first use.
+    if name in ("HourlyTimeSeries", "MonthlyTimeSeries", "AnnualTimeSeries"):
+        from re_storage.core import types
+
+        return getattr(types, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -33,7 +33,19 @@ class REStorageError(Exception):
             logger.error(f"Simulation failed: {e}")
     """
 
-    pass
+    # Subclasses keep their context attributes in slots rather than the
+    # instance __dict__
+    __slots__ = ()
+
+    def __reduce__(self) -> tuple[type, tuple[object, ...], dict[str, object]]:
+        # BaseException pickles only args and __dict__; carry the slot
+        # attributes in the state so they survive pickling and copying
+        state = dict(self.__dict__)
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return type(self), self.args, state
 
 
 class EnergyBalanceError(REStorageError):
@@ -58,6 +70,8 @@ class EnergyBalanceError(REStorageError):
         timestep: The timestep where imbalance occurred (optional)
     """
 
+    __slots__ = ("imbalance_kwh", "timestep")
+
     def __init__(
         self,
         message: str,
@@ -88,6 +102,8 @@ class SoCBoundsError(REStorageError):
         timestep: The timestep where violation occurred (optional)
     """
 
+    __slots__ = ("soc_kwh", "max_capacity_kwh", "timestep")
+
     def __init__(
         self,
         message: str,
@@ -121,6 +137,8 @@ class InsufficientCapacityError(REStorageError):
         available_kw: Maximum available power
     """
 
+    __slots__ = ("requested_kw", "available_kw")
+
     def __init__(
         self,
         message: str,
@@ -151,6 +169,8 @@ class InputValidationError(REStorageError):
         value: The invalid value (optional)
     """
 
+    __slots__ = ("field", "value")
+
     def __init__(
         self,
         message: str,
@@ -181,6 +201,8 @@ class DegradationTableError(REStorageError):
         missing_years: List of years not covered (optional)
     """
 
+    __slots__ = ("missing_years",)
+
     def __init__(
         self,
         message: str,
@@ -212,6 +234,8 @@ class DSCRConstraintError(REStorageError):
         target_dscr: The required minimum DSCR
     """
 
+    __slots__ = ("min_dscr_achieved", "target_dscr")
+
     def __init__(
         self,
         message: str,
@@ -15,22 +15,26 @@ Naming Convention (from AGENTS.md):
 """
 
 from enum import Enum, auto
-from typing import TypeAlias
+from typing import TYPE_CHECKING, Final, TypeAlias
 
-import pandas as pd
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # =============================================================================
 # CONSTANTS
 # =============================================================================
 
-HOURS_PER_YEAR: int = 8760
+HOURS_PER_DAY: Final[int] = 24
+"""Hours in a day; hour-of-day values run from 0 to 23."""
+
+HOURS_PER_YEAR: Final[int] = 8760
 """Standard hours in a non-leap year."""
 
-HOURS_PER_LEAP_YEAR: int = 8784
+HOURS_PER_LEAP_YEAR: Final[int] = 8784
 """Hours in a leap year (366 days × 24 hours)."""
 
-DEFAULT_STEP_HOURS: float = 1.0
+DEFAULT_STEP_HOURS: Final[float] = 1.0
 """Default simulation timestep in hours."""
 
 
@@ -38,35 +42,52 @@ DEFAULT_STEP_HOURS: float = 1.0
 # TIME SERIES TYPE ALIASES
 # =============================================================================
 
-HourlyTimeSeries: TypeAlias = pd.DataFrame
-"""
-DataFrame representing hourly time series data.
+# The DataFrame aliases are resolved lazily through __getattr__ below so that
+# importing the enums and constants does not pull in pandas.
 
-Expected structure:
-    - Index: datetime or integer (0 to 8759/8783)
-    - Rows: 8760 (standard year) or 8784 (leap year)
-    - Columns: Depend on context (e.g., solar_gen_kw, load_kw, soc_kwh)
-"""
+if TYPE_CHECKING:
+    HourlyTimeSeries: TypeAlias = pd.DataFrame
+    """
+    DataFrame representing hourly time series data.
 
-MonthlyTimeSeries: TypeAlias = pd.DataFrame
-"""
-DataFrame representing monthly aggregated data.
+    Expected structure:
+        - Index: datetime or integer (0 to 8759/8783)
+        - Rows: 8760 (standard year) or 8784 (leap year)
+        - Columns: Depend on context (e.g., solar_gen_kw, load_kw, soc_kwh)
+    """
 
-Expected structure:
-    - Index: month (1-12) or datetime (first of month)
-    - Rows: 12
-    - Columns: Aggregated metrics (e.g., peak_demand_kw, total_revenue_usd)
-"""
+    MonthlyTimeSeries: TypeAlias = pd.DataFrame
+    """
+    DataFrame representing monthly aggregated data.
 
-AnnualTimeSeries: TypeAlias = pd.DataFrame
-"""
-DataFrame representing annual data over project lifetime.
+    Expected structure:
+        - Index: month (1-12) or datetime (first of month)
+        - Rows: 12
+        - Columns: Aggregated metrics (e.g., peak_demand_kw, total_revenue_usd)
+    """
 
-Expected structure:
-    - Index: year (1-25) or calendar year
-    - Rows: Typically 25 (project lifetime)
-    - Columns: Annual metrics (e.g., generation_mwh, revenue_usd, dscr)
-"""
+    AnnualTimeSeries: TypeAlias = pd.DataFrame
+    """
+    DataFrame representing annual data over project lifetime.
+
+    Expected structure:
+        - Index: year (1-25) or calendar year
+        - Rows: Typically 25 (project lifetime)
+        - Columns: Annual metrics (e.g., generation_mwh, revenue_usd, dscr)
+    """
+
+_DATAFRAME_ALIASES: Final = frozenset(
+    {"HourlyTimeSeries", "MonthlyTimeSeries", "AnnualTimeSeries"}
+)
+
+
+def __getattr__(name: str) -> object:
+    if name in _DATAFRAME_ALIASES:
+        import pandas as pd
+
+        globals()[name] = pd.DataFrame
+        return pd.DataFrame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # =============================================================================
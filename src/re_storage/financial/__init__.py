@@ -5,11 +5,13 @@ This package assembles annual cash flow waterfalls, sizes debt to DSCR
 constraints, and computes IRR/NPV metrics for project evaluation.
 """
 
+from re_storage.financial._validation import set_validation
 from re_storage.financial.debt import calculate_amortization_schedule, size_debt_for_dscr
 from re_storage.financial.metrics import (
     calculate_dscr_series,
     calculate_equity_irr,
     calculate_npv,
+    calculate_npv_batch,
     calculate_project_irr,
 )
 from re_storage.financial.waterfall import build_cash_flow_waterfall
@@ -19,7 +21,9 @@ __all__ = [
     "calculate_amortization_schedule",
     "size_debt_for_dscr",
     "calculate_npv",
+    "calculate_npv_batch",
     "calculate_project_irr",
     "calculate_equity_irr",
     "calculate_dscr_series",
+    "set_validation",
 ]
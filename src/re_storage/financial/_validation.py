@@ -0,0 +1,30 @@
+"""
+Input validation switch for the financial layer.
+
+Scenario sweeps call the financial functions thousands of times with inputs
+of identical, already-checked structure. Turning validation off skips the
+structural checks (required columns, index alignment, cashflow lengths, dates
+and signs) so only the calculations run. Malformed inputs then fail with
+whatever error pandas or NumPy raises, or give meaningless results.
+"""
+
+from __future__ import annotations
+
+_validation_enabled = True
+
+
+def set_validation(enabled: bool) -> None:
+    """
+    Enable or disable input validation in the financial functions.
+
+    Args:
+        enabled: False to skip the structural input checks; True (the
+            default) to run them.
+    """
+    global _validation_enabled
+    _validation_enabled = bool(enabled)
+
+
+def validation_enabled() -> bool:
+    """Return whether financial input validation is enabled."""
+    return _validation_enabled
@@ -7,13 +7,68 @@ consistent with the Excel GoalSeek logic.
 
 from __future__ import annotations
 
+from functools import lru_cache
+
+import numpy as np
 import pandas as pd
-from scipy.optimize import brentq
 
 from re_storage.core.exceptions import DSCRConstraintError, InputValidationError
 from re_storage.core.types import AnnualTimeSeries
 
 
+def _level_payment_usd(debt_amount_usd: float, rate: float, tenor_years: int) -> float:
+    """Equal annual payment that repays debt_amount_usd over tenor_years at rate."""
+    if rate == 0:
+        return debt_amount_usd / tenor_years
+    return debt_amount_usd * rate / (1 - (1 + rate) ** (-tenor_years))
+
+
+@lru_cache(maxsize=256)
+def _amortization_arrays(
+    debt_amount_usd: float, interest_rate_pct: float, tenor_years: int
+) -> tuple[np.ndarray, ...]:
+    """
+    Compute amortization schedule columns for validated loan terms.
+
+    Results are cached on the loan terms, so the returned arrays are shared
+    between callers and are marked read-only.
+
+    Returns:
+        Tuple of (years, opening balance, interest, principal, total debt
+        service, closing balance) arrays, one entry per year.
+    """
+    rate = interest_rate_pct / 100.0
+    payment_usd = _level_payment_usd(debt_amount_usd, rate, tenor_years)
+
+    # Opening balance in closed form: the principal accrued to year t less the
+    # accrued value of the t level payments already made
+    elapsed = np.arange(tenor_years, dtype=np.float64)
+    if rate == 0:
+        opening_balance_usd = debt_amount_usd - payment_usd * elapsed
+    else:
+        growth = (1 + rate) ** elapsed
+        opening_balance_usd = debt_amount_usd * growth - payment_usd * (growth - 1) / rate
+    interest_usd = opening_balance_usd * rate
+    principal_usd = payment_usd - interest_usd
+    closing_balance_usd = np.append(opening_balance_usd[1:], 0.0)
+    # The final payment clears whatever balance remains
+    principal_usd[-1] = opening_balance_usd[-1]
+    total_debt_service_usd = interest_usd + principal_usd
+
+    years = np.arange(1, tenor_years + 1, dtype=np.int64)
+    arrays = (
+        years,
+        opening_balance_usd,
+        interest_usd,
+        principal_usd,
+        total_debt_service_usd,
+        closing_balance_usd,
+    )
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
 def calculate_amortization_schedule(
     debt_amount_usd: float,
     interest_rate_pct: float,
@@ -40,38 +95,26 @@ def calculate_amortization_schedule(
     if tenor_years <= 0:
         raise InputValidationError("tenor_years must be positive.")
 
-    rate = interest_rate_pct / 100.0
-    if rate == 0:
-        payment_usd = debt_amount_usd / tenor_years
-    else:
-        payment_usd = debt_amount_usd * rate / (1 - (1 + rate) ** (-tenor_years))
-
-    balance = debt_amount_usd
-    rows: list[dict[str, float]] = []
-
-    for year in range(1, tenor_years + 1):
-        interest_usd = balance * rate
-        principal_usd = payment_usd - interest_usd
-        closing_balance_usd = balance - principal_usd
-        if year == tenor_years:
-            closing_balance_usd = 0.0
-            principal_usd = balance
-            payment_usd = interest_usd + principal_usd
-        rows.append(
-            {
-                "year": float(year),
-                "opening_balance_usd": balance,
-                "interest_usd": interest_usd,
-                "principal_usd": principal_usd,
-                "total_debt_service_usd": payment_usd,
-                "closing_balance_usd": closing_balance_usd,
-            }
-        )
-        balance = closing_balance_usd
-
-    schedule = pd.DataFrame(rows)
-    schedule["year"] = schedule["year"].astype(int)
-    return schedule.set_index("year", drop=False)
+    (
+        years,
+        opening_balance_usd,
+        interest_usd,
+        principal_usd,
+        total_debt_service_usd,
+        closing_balance_usd,
+    ) = _amortization_arrays(debt_amount_usd, interest_rate_pct, tenor_years)
+    # The frame copies the cached arrays, so callers may modify it freely
+    return pd.DataFrame(
+        {
+            "year": years,
+            "opening_balance_usd": opening_balance_usd,
+            "interest_usd": interest_usd,
+            "principal_usd": principal_usd,
+            "total_debt_service_usd": total_debt_service_usd,
+            "closing_balance_usd": closing_balance_usd,
+        },
+        index=pd.Index(years, name="year"),
+    )
 
 
 def size_debt_for_dscr(
@@ -89,7 +132,8 @@ def size_debt_for_dscr(
         interest_rate_pct: Annual interest rate (percent).
         tenor_years: Debt tenor (years).
         target_dscr: Minimum DSCR threshold.
-        initial_guess_usd: Initial debt guess for bracketing (USD).
+        initial_guess_usd: Initial debt guess (USD); validated but unused now
+            that the debt is solved in closed form.
 
     Returns:
         Tuple of (optimal_debt_amount_usd, amortization_schedule).
@@ -115,48 +159,29 @@ def size_debt_for_dscr(
     if (ebitda <= 0).any():
         raise DSCRConstraintError("EBITDA must be positive to size debt.")
 
-    def min_dscr(debt_amount_usd: float) -> float:
-        schedule = calculate_amortization_schedule(
-            debt_amount_usd=debt_amount_usd,
-            interest_rate_pct=interest_rate_pct,
-            tenor_years=tenor_years,
-        )
-        dscr = ebitda / schedule["total_debt_service_usd"]
-        return float(dscr.min())
-
-    def dscr_residual(debt_amount_usd: float) -> float:
-        return min_dscr(debt_amount_usd) - target_dscr
-
-    lower = 1e-6
-    upper = initial_guess_usd
-
-    residual_lower = dscr_residual(lower)
-    if residual_lower < 0:
-        raise DSCRConstraintError(
-            "EBITDA too low to meet DSCR even at minimal debt.",
-            min_dscr_achieved=residual_lower + target_dscr,
-            target_dscr=target_dscr,
-        )
-
-    residual_upper = dscr_residual(upper)
-    attempts = 0
-    while residual_upper > 0 and attempts < 20:
-        upper *= 2
-        residual_upper = dscr_residual(upper)
-        attempts += 1
-
-    if residual_upper > 0:
-        raise DSCRConstraintError(
-            "Unable to bracket DSCR target with initial_guess_usd.",
-            min_dscr_achieved=residual_upper + target_dscr,
-            target_dscr=target_dscr,
-        )
+    # Debt service is the same level payment every year and that payment is
+    # linear in the debt, so the binding year is the one with the lowest
+    # EBITDA and the DSCR target can be inverted directly for the debt size
+    ebitda_min_usd = float(ebitda.min())
+    rate = interest_rate_pct / 100.0
+    if rate == 0:
+        # Interest-free debt is repaid in equal instalments of debt / tenor
+        optimal_debt_usd = ebitda_min_usd * tenor_years / target_dscr
+    else:
+        payment_per_usd = _level_payment_usd(1.0, rate, tenor_years)
+        optimal_debt_usd = ebitda_min_usd / (target_dscr * payment_per_usd)
 
-    optimal_debt_usd = float(brentq(dscr_residual, lower, upper))
     schedule = calculate_amortization_schedule(
         debt_amount_usd=optimal_debt_usd,
         interest_rate_pct=interest_rate_pct,
         tenor_years=tenor_years,
     )
+    min_dscr = float((ebitda / schedule["total_debt_service_usd"]).min())
+    if min_dscr < target_dscr * (1 - 1e-9):
+        raise DSCRConstraintError(
+            "Sized debt does not meet the DSCR target.",
+            min_dscr_achieved=min_dscr,
+            target_dscr=target_dscr,
+        )
 
     return optimal_debt_usd, schedule
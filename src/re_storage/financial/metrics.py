@@ -7,41 +7,64 @@ with explicit validation for cashflow sign and date alignment.
 
 from __future__ import annotations
 
-from typing import Callable
+import math
+from typing import Callable, Final
 
 import numpy as np
 import pandas as pd
 from scipy.optimize import brentq
 
 from re_storage.core.exceptions import InputValidationError
+from re_storage.financial._validation import validation_enabled
+
+# Upper IRR bounds tried when bracketing the root: doubling from 100% to 102,400%
+IRR_UPPER_BOUNDS: Final = 2.0 ** np.arange(11)
+IRR_UPPER_BOUNDS.flags.writeable = False
 
 
 def _prepare_cashflows(
     cashflows: pd.Series, dates: pd.Series, label: str
 ) -> tuple[np.ndarray, np.ndarray]:
-    if len(cashflows) != len(dates):
+    validate = validation_enabled()
+    if validate and len(cashflows) != len(dates):
         raise InputValidationError(
             f"{label} cashflows and dates must have the same length.",
             field=label,
         )
 
-    cashflow_values = pd.Series(cashflows, dtype=float)
-    date_values = pd.to_datetime(pd.Series(dates), errors="coerce")
-    if date_values.isna().any():
-        raise InputValidationError(f"{label} dates contain invalid timestamps.")
-
-    if not (cashflow_values.gt(0).any() and cashflow_values.lt(0).any()):
+    cashflow_values = np.asarray(cashflows, dtype=np.float64)
+    year_fractions = _year_fractions(dates, label)
+    if validate and not (np.any(cashflow_values > 0) and np.any(cashflow_values < 0)):
         raise InputValidationError(
             f"{label} cashflows must include at least one positive and one negative value."
         )
+    return cashflow_values, year_fractions
+
 
-    base_date = date_values.iloc[0]
-    year_fractions = (date_values - base_date).dt.days.to_numpy(dtype=float) / 365.0
-    return cashflow_values.to_numpy(dtype=float), year_fractions
+def _year_fractions(dates: pd.Series, label: str) -> np.ndarray:
+    try:
+        date_index = pd.DatetimeIndex(pd.to_datetime(dates))
+    except (ValueError, TypeError) as exc:
+        raise InputValidationError(f"{label} dates contain invalid timestamps.") from exc
+    # Strict parsing rejects malformed dates, but missing ones still parse as NaT
+    if validation_enabled() and date_index.hasnans:
+        raise InputValidationError(f"{label} dates contain invalid timestamps.")
+
+    # Whole days elapsed since the first date, counted on UTC instants for
+    # timezone-aware dates
+    if date_index.empty:
+        return np.empty(0)
+    if date_index.tz is not None:
+        date_index = date_index.tz_convert(None)
+    date_values = date_index.to_numpy()
+    elapsed_days = (date_values - date_values[0]) // np.timedelta64(1, "D")
+    return np.asarray(elapsed_days / 365.0, dtype=np.float64)
 
 
 def _xnpv(rate: float, cashflows: np.ndarray, year_fractions: np.ndarray) -> float:
-    return float(np.sum(cashflows / (1 + rate) ** year_fractions))
+    # Discount factors (1 + rate) ** -t as exp(-t * log1p(rate)), summed by a dot product
+    discount_factors = np.exp(year_fractions * -math.log1p(rate))
+    return float(np.dot(cashflows, discount_factors))
 
 
 def _solve_irr(
@@ -53,21 +76,19 @@ def _solve_irr(
     lower = -0.9999
     upper = 1.0
     lower_value = npv_at(lower)
-    upper_value = npv_at(upper)
 
-    attempts = 0
-    while lower_value * upper_value > 0 and upper < 1000:
-        upper *= 2
-        upper_value = npv_at(upper)
-        attempts += 1
-        if attempts > 50:
-            break
-
-    if lower_value * upper_value > 0:
-        raise InputValidationError(
-            f"{label} IRR could not be bracketed for root finding.",
-            field=label,
-        )
+    if lower_value * npv_at(upper) > 0:
+        # Value the larger upper bounds 2, 4, ..., 1024 in one pass; the
+        # bracket is closed by the first one where the NPV changes sign
+        upper_candidates = IRR_UPPER_BOUNDS[1:]
+        discount_factors = np.exp(np.outer(-np.log1p(upper_candidates), year_fractions))
+        sign_changes = np.flatnonzero(lower_value * (discount_factors @ cashflows) <= 0)
+        if sign_changes.size == 0:
+            raise InputValidationError(
+                f"{label} IRR could not be bracketed for root finding.",
+                field=label,
+            )
+        upper = float(upper_candidates[sign_changes[0]])
 
     return float(brentq(npv_at, lower, upper))
 
@@ -97,6 +118,54 @@ def calculate_npv(
     return _xnpv(rate, cashflow_values, year_fractions)
 
 
+def calculate_npv_batch(
+    cashflows_usd: np.ndarray, dates: pd.Series, discount_rates_pct: np.ndarray
+) -> np.ndarray:
+    """
+    Calculate XNPV-style net present values for many scenarios and rates.
+
+    Every cashflow scenario is discounted at every rate in a single matrix
+    product, for sensitivity and Monte Carlo runs that would otherwise call
+    calculate_npv once per (scenario, rate) pair.
+
+    Args:
+        cashflows_usd: Cashflows as a (scenarios, periods) array (USD).
+        dates: Dates shared by every scenario, one per period.
+        discount_rates_pct: Discount rates as percentages (e.g., 8.0).
+
+    Returns:
+        Array of net present values (USD) with shape (scenarios, rates).
+
+    Raises:
+        InputValidationError: If inputs are invalid.
+    """
+    cashflow_values = np.asarray(cashflows_usd, dtype=np.float64)
+    rates = np.asarray(discount_rates_pct, dtype=np.float64).ravel() / 100.0
+    if np.any(rates <= -1):
+        raise InputValidationError("discount_rates_pct must be greater than -100.")
+
+    validate = validation_enabled()
+    if validate and (cashflow_values.ndim != 2 or cashflow_values.shape[1] != len(dates)):
+        raise InputValidationError(
+            "npv cashflows must be a (scenarios, periods) array with one period per date.",
+            field="npv",
+        )
+
+    year_fractions = _year_fractions(dates, "npv")
+    if validate and not (
+        np.all(np.any(cashflow_values > 0, axis=1))
+        and np.all(np.any(cashflow_values < 0, axis=1))
+    ):
+        raise InputValidationError(
+            "npv cashflows must include at least one positive and one negative value "
+            "in every scenario."
+        )
+
+    # (rates, periods) discount factors, then one product for the full grid
+    discount_factors = np.exp(np.outer(-np.log1p(rates), year_fractions))
+    return cashflow_values @ discount_factors.T
+
+
 def calculate_project_irr(cashflows: pd.Series, dates: pd.Series) -> float:
     """
     Calculate project IRR using XIRR-style root finding.
@@ -149,12 +218,17 @@ def calculate_dscr_series(ebitda_usd: pd.Series, debt_service_usd: pd.Series) ->
     Raises:
         InputValidationError: If inputs are invalid or debt service <= 0.
     """
-    if not ebitda_usd.index.equals(debt_service_usd.index):
+    validate = validation_enabled()
+    if validate and not ebitda_usd.index.equals(debt_service_usd.index):
         raise InputValidationError("ebitda_usd and debt_service_usd indices must align.")
 
-    if (debt_service_usd <= 0).any():
+    # Indices already match, so divide the raw arrays without realignment;
+    # float64 input is used as-is rather than copied
+    debt_service_values = debt_service_usd.to_numpy(dtype=np.float64)
+    if validate and np.any(debt_service_values <= 0):
         raise InputValidationError("debt_service_usd must be positive.")
 
-    dscr = ebitda_usd.astype(float) / debt_service_usd.astype(float)
-    dscr.name = "dscr_ratio"
-    return dscr
+    ebitda_values = ebitda_usd.to_numpy(dtype=np.float64)
+    return pd.Series(
+        ebitda_values / debt_service_values, index=ebitda_usd.index, name="dscr_ratio"
+    )
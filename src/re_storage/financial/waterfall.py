@@ -7,38 +7,52 @@ lifetime revenue, opex, and debt schedules.
 
 from __future__ import annotations
 
+from typing import Final
+
+import numpy as np
 import pandas as pd
 
 from re_storage.core.exceptions import InputValidationError
 from re_storage.core.types import AnnualTimeSeries
-
-
-REVENUE_COLUMNS = {
-    "year",
-    "dppa_revenue_usd",
-    "grid_savings_usd",
-    "demand_charge_savings_usd",
-}
-OPEX_COLUMNS = {
-    "year",
-    "o_and_m_usd",
-    "insurance_usd",
-    "land_lease_usd",
-    "management_fees_usd",
-    "grid_connection_usd",
-    "taxes_usd",
-    "mra_contribution_usd",
-}
-DEBT_COLUMNS = {
-    "year",
-    "interest_usd",
-    "principal_usd",
-    "total_debt_service_usd",
-}
-
-
-def _require_columns(data: pd.DataFrame, required: set[str], label: str) -> None:
-    missing = required - set(data.columns)
+from re_storage.financial._validation import validation_enabled
+
+YEAR_COLUMNS: Final = frozenset({"year"})
+REVENUE_COLUMNS: Final = frozenset(
+    {
+        "year",
+        "dppa_revenue_usd",
+        "grid_savings_usd",
+        "demand_charge_savings_usd",
+    }
+)
+OPEX_COLUMNS: Final = frozenset(
+    {
+        "year",
+        "o_and_m_usd",
+        "insurance_usd",
+        "land_lease_usd",
+        "management_fees_usd",
+        "grid_connection_usd",
+        "taxes_usd",
+        "mra_contribution_usd",
+    }
+)
+DEBT_COLUMNS: Final = frozenset(
+    {
+        "year",
+        "interest_usd",
+        "principal_usd",
+        "total_debt_service_usd",
+    }
+)
+
+
+def _require_columns(data: pd.DataFrame, required: frozenset[str], label: str) -> None:
+    if not validation_enabled():
+        return
+    # Probe the column index directly rather than building a set of all columns
+    columns = data.columns
+    missing = [column for column in required if column not in columns]
     if missing:
         raise InputValidationError(
             f"Missing required columns in {label}: {sorted(missing)}"
@@ -46,9 +60,17 @@ def _require_columns(data: pd.DataFrame, required: set[str], label: str) -> None
 
 
 def _with_year_index(data: AnnualTimeSeries, label: str) -> AnnualTimeSeries:
-    _require_columns(data, {"year"}, label)
-    result = data.copy()
-    return result.set_index("year", drop=False)
+    _require_columns(data, YEAR_COLUMNS, label)
+    # set_index returns a new frame, so the caller's data is never modified
+    return data.set_index("year", drop=False)
+
+
+def _column_values(data: pd.DataFrame, column: str) -> np.ndarray:
+    return np.asarray(data[column], dtype=np.float64)
+
+
+def _prepend_year_zero(values: np.ndarray) -> np.ndarray:
+    return np.concatenate(([0.0], values))
 
 
 def build_cash_flow_waterfall(
@@ -81,7 +103,7 @@ def build_cash_flow_waterfall(
     debt = _with_year_index(debt_schedule, "debt_schedule")
 
     years = revenue.index
-    if not years.equals(opex.index) or not years.equals(debt.index):
+    if validation_enabled() and (not years.equals(opex.index) or not years.equals(debt.index)):
         raise InputValidationError("Year indices must align across revenue, opex, and debt.")
 
     if "initial_capex_usd" not in capex:
@@ -99,61 +121,53 @@ def build_cash_flow_waterfall(
     else:
         raise InputValidationError("augmentation_capex_usd must be a pandas Series.")
 
+    # Year indices match, so the arithmetic runs on the raw column arrays
+    # without index alignment or intermediate Series.
     total_revenue_usd = (
-        revenue["dppa_revenue_usd"]
-        + revenue["grid_savings_usd"]
-        + revenue["demand_charge_savings_usd"]
+        _column_values(revenue, "dppa_revenue_usd")
+        + _column_values(revenue, "grid_savings_usd")
+        + _column_values(revenue, "demand_charge_savings_usd")
     )
     total_opex_usd = (
-        opex["o_and_m_usd"]
-        + opex["insurance_usd"]
-        + opex["land_lease_usd"]
-        + opex["management_fees_usd"]
-        + opex["grid_connection_usd"]
+        _column_values(opex, "o_and_m_usd")
+        + _column_values(opex, "insurance_usd")
+        + _column_values(opex, "land_lease_usd")
+        + _column_values(opex, "management_fees_usd")
+        + _column_values(opex, "grid_connection_usd")
     )
+    interest_usd = _column_values(debt, "interest_usd")
+    principal_usd = _column_values(debt, "principal_usd")
+    total_debt_service_usd = _column_values(debt, "total_debt_service_usd")
+    taxes_usd = _column_values(opex, "taxes_usd")
+    mra_contribution_usd = _column_values(opex, "mra_contribution_usd")
+
     ebitda_usd = total_revenue_usd - total_opex_usd
-    cfads_usd = ebitda_usd - debt["total_debt_service_usd"]
-    free_cash_flow_to_equity_usd = (
-        cfads_usd - opex["taxes_usd"] - opex["mra_contribution_usd"]
-    )
+    cfads_usd = ebitda_usd - total_debt_service_usd
+    free_cash_flow_to_equity_usd = cfads_usd - taxes_usd - mra_contribution_usd
 
     output_years = pd.Index([0]).append(years)
-    waterfall = pd.DataFrame(
-        index=output_years,
-        columns=[
-            "year",
-            "total_revenue_usd",
-            "total_opex_usd",
-            "ebitda_usd",
-            "interest_usd",
-            "principal_usd",
-            "total_debt_service_usd",
-            "cfads_usd",
-            "taxes_usd",
-            "mra_contribution_usd",
-            "free_cash_flow_to_equity_usd",
-            "capex_usd",
-        ],
-        data=0.0,
-    )
 
-    waterfall.loc[years, "total_revenue_usd"] = total_revenue_usd.values
-    waterfall.loc[years, "total_opex_usd"] = total_opex_usd.values
-    waterfall.loc[years, "ebitda_usd"] = ebitda_usd.values
-    waterfall.loc[years, "interest_usd"] = debt["interest_usd"].values
-    waterfall.loc[years, "principal_usd"] = debt["principal_usd"].values
-    waterfall.loc[years, "total_debt_service_usd"] = debt["total_debt_service_usd"].values
-    waterfall.loc[years, "cfads_usd"] = cfads_usd.values
-    waterfall.loc[years, "taxes_usd"] = opex["taxes_usd"].values
-    waterfall.loc[years, "mra_contribution_usd"] = opex["mra_contribution_usd"].values
-    waterfall.loc[years, "free_cash_flow_to_equity_usd"] = free_cash_flow_to_equity_usd.values
-
-    capex_usd = pd.Series(0.0, index=output_years)
-    capex_usd.loc[0] = initial_capex_usd
+    capex_usd = np.zeros(len(output_years))
+    capex_usd[0] = initial_capex_usd
     if not augmentation_series.empty:
         aligned = augmentation_series.reindex(output_years, fill_value=0.0)
-        capex_usd = capex_usd.add(aligned, fill_value=0.0)
-    waterfall["capex_usd"] = capex_usd.values
-    waterfall["year"] = waterfall.index
-
-    return waterfall
+        capex_usd += aligned.fillna(0.0).to_numpy()
+
+    # Year 0 carries only capex; operating lines start in year 1
+    return pd.DataFrame(
+        {
+            "year": output_years,
+            "total_revenue_usd": _prepend_year_zero(total_revenue_usd),
+            "total_opex_usd": _prepend_year_zero(total_opex_usd),
+            "ebitda_usd": _prepend_year_zero(ebitda_usd),
+            "interest_usd": _prepend_year_zero(interest_usd),
+            "principal_usd": _prepend_year_zero(principal_usd),
+            "total_debt_service_usd": _prepend_year_zero(total_debt_service_usd),
+            "cfads_usd": _prepend_year_zero(cfads_usd),
+            "taxes_usd": _prepend_year_zero(taxes_usd),
+            "mra_contribution_usd": _prepend_year_zero(mra_contribution_usd),
+            "free_cash_flow_to_equity_usd": _prepend_year_zero(free_cash_flow_to_equity_usd),
+            "capex_usd": capex_usd,
+        },
+        index=output_years,
+    )
@@ -5,10 +5,13 @@ This package validates raw input data before it enters the physics engine.
 """
 
 from re_storage.inputs.loaders import (
+    ModelInputs,
+    load_all,
     load_assumptions,
     load_degradation_table,
     load_hourly_data,
     load_tariff_schedule,
+    set_sheet_cache,
 )
 from re_storage.inputs.schemas import DegradationRow, HourlyInputRow, SystemAssumptions
 
@@ -16,8 +19,11 @@ __all__ = [
     "SystemAssumptions",
     "HourlyInputRow",
     "DegradationRow",
+    "ModelInputs",
+    "load_all",
     "load_assumptions",
     "load_hourly_data",
     "load_degradation_table",
     "load_tariff_schedule",
+    "set_sheet_cache",
 ]
@@ -7,8 +7,12 @@ passing data to the physics engine.
 
 from __future__ import annotations
 
+import os
+import pickle
 from pathlib import Path
+from typing import Final, NamedTuple, TypeAlias
 
+import numpy as np
 import pandas as pd
 from pydantic import ValidationError
 
@@ -22,34 +26,92 @@ from re_storage.core.types import (
 from re_storage.inputs.schemas import SystemAssumptions
 
 
-ASSUMPTIONS_SHEET = "Assumption"
-DATA_INPUT_SHEET = "Data Input"
-LOSS_SHEET = "Loss"
-TARIFF_SHEET = "Tariff Schedule"
+ASSUMPTIONS_SHEET: Final[str] = "Assumption"
+DATA_INPUT_SHEET: Final[str] = "Data Input"
+LOSS_SHEET: Final[str] = "Loss"
+TARIFF_SHEET: Final[str] = "Tariff Schedule"
 
-REQUIRED_HOURLY_COLUMNS = {
-    "datetime",
+REQUIRED_ASSUMPTIONS_COLUMNS: Final[frozenset[str]] = frozenset(SystemAssumptions.model_fields)
+
+REQUIRED_HOURLY_COLUMNS: Final[frozenset[str]] = frozenset(
+    {
+        "datetime",
+        "simulation_profile_kw",
+        "irradiation_wh_m2",
+        "load_kw",
+        "fmp_usd_per_kwh",
+        "cfmp_usd_per_kwh",
+    }
+)
+
+HOURLY_NUMERIC_COLUMNS: Final[tuple[str, ...]] = (
     "simulation_profile_kw",
     "irradiation_wh_m2",
     "load_kw",
     "fmp_usd_per_kwh",
     "cfmp_usd_per_kwh",
-}
+)
+
+HOURLY_DTYPES: Final[dict[str, type]] = dict.fromkeys(HOURLY_NUMERIC_COLUMNS, np.float64)
+
+HOURLY_NON_NEGATIVE_COLUMNS: Final[tuple[str, ...]] = (
+    "simulation_profile_kw",
+    "irradiation_wh_m2",
+    "load_kw",
+)
 
-REQUIRED_DEGRADATION_COLUMNS = {
-    "year",
+REQUIRED_DEGRADATION_COLUMNS: Final[frozenset[str]] = frozenset(
+    {
+        "year",
+        "pv_factor",
+        "battery_factor_no_replacement",
+        "battery_factor_with_replacement",
+    }
+)
+
+DEGRADATION_FACTOR_COLUMNS: Final[tuple[str, ...]] = (
     "pv_factor",
     "battery_factor_no_replacement",
     "battery_factor_with_replacement",
+)
+
+REQUIRED_TARIFF_COLUMNS: Final[frozenset[str]] = frozenset({"hour", "period"})
+
+TARIFF_PERIODS: Final[dict[str, TimePeriod]] = {
+    "off_peak": TimePeriod.OFF_PEAK,
+    "standard": TimePeriod.STANDARD,
+    "peak": TimePeriod.PEAK,
 }
 
+_sheet_cache_enabled = False
 
-def load_assumptions(path: Path) -> SystemAssumptions:
+ExcelSource: TypeAlias = Path | pd.ExcelFile
+"""Path to an input workbook, or a workbook already opened with pd.ExcelFile."""
+
+
+class ModelInputs(NamedTuple):
+    """
+    All validated model inputs read from one workbook.
+
+    Attributes:
+        assumptions: Validated system assumptions.
+        hourly_data: Hourly time series data.
+        degradation_table: Degradation factors by project year.
+        tariff_schedule: Mapping from TimePeriod to list of hours.
+    """
+
+    assumptions: SystemAssumptions
+    hourly_data: HourlyTimeSeries
+    degradation_table: pd.DataFrame
+    tariff_schedule: dict[TimePeriod, list[int]]
+
+
+def load_assumptions(path: ExcelSource) -> SystemAssumptions:
     """
     Load and validate the Assumption sheet.
 
     Args:
-        path: Path to Excel input file.
+        path: Path to Excel input file, or an open pd.ExcelFile.
 
     Returns:
         SystemAssumptions instance.
@@ -64,7 +126,7 @@ def load_assumptions(path: Path) -> SystemAssumptions:
             f"Expected exactly 1 row in {ASSUMPTIONS_SHEET}, got {len(df)}."
         )
 
-    missing = _missing_columns(df, SystemAssumptions.model_fields.keys())
+    missing = _missing_columns(df, REQUIRED_ASSUMPTIONS_COLUMNS)
     if missing:
         raise InputValidationError(
             f"Missing required assumptions columns: {sorted(missing)}."
@@ -78,18 +140,19 @@ def load_assumptions(path: Path) -> SystemAssumptions:
         raise InputValidationError(f"Assumptions validation failed: {exc}") from exc
 
 
-def load_hourly_data(path: Path) -> HourlyTimeSeries:
+def load_hourly_data(path: ExcelSource) -> HourlyTimeSeries:
     """
     Load and validate the hourly time series data.
 
     Args:
-        path: Path to Excel input file.
+        path: Path to Excel input file, or an open pd.ExcelFile.
 
     Returns:
         HourlyTimeSeries DataFrame.
 
     Raises:
-        InputValidationError: If row count or required columns are invalid.
+        InputValidationError: If row count, required columns or values are
+            invalid.
     """
     df = _read_sheet(path, DATA_INPUT_SHEET)
 
@@ -103,21 +166,30 @@ def load_hourly_data(path: Path) -> HourlyTimeSeries:
     if missing:
         raise InputValidationError(f"Missing required hourly columns: {sorted(missing)}.")
 
-    for column in ("simulation_profile_kw", "irradiation_wh_m2", "load_kw"):
-        if (df[column] < 0).any():
-            raise InputValidationError(
-                f"Hourly column '{column}' contains negative values."
-            )
+    # The whole sheet is coerced and checked column-wise; HourlyInputRow is
+    # never built per row
+    try:
+        df["datetime"] = pd.to_datetime(df["datetime"])
+        df = df.astype(HOURLY_DTYPES, copy=False)
+    except (ValueError, TypeError) as exc:
+        raise InputValidationError(f"Hourly data has invalid values: {exc}") from exc
+
+    negative = (df[list(HOURLY_NON_NEGATIVE_COLUMNS)].to_numpy() < 0).any(axis=0)
+    if negative.any():
+        column = HOURLY_NON_NEGATIVE_COLUMNS[int(np.argmax(negative))]
+        raise InputValidationError(
+            f"Hourly column '{column}' contains negative values."
+        )
 
     return df
 
 
-def load_degradation_table(path: Path, project_years: int = 25) -> pd.DataFrame:
+def load_degradation_table(path: ExcelSource, project_years: int = 25) -> pd.DataFrame:
     """
     Load and validate the degradation (Loss) table.
 
     Args:
-        path: Path to Excel input file.
+        path: Path to Excel input file, or an open pd.ExcelFile.
         project_years: Expected project length in years.
 
     Returns:
@@ -135,19 +207,21 @@ def load_degradation_table(path: Path, project_years: int = 25) -> pd.DataFrame:
             f"Missing required degradation columns: {sorted(missing)}."
         )
 
-    invalid_mask = (
-        (df["pv_factor"] <= 0)
-        | (df["pv_factor"] > 1)
-        | (df["battery_factor_no_replacement"] <= 0)
-        | (df["battery_factor_no_replacement"] > 1)
-        | (df["battery_factor_with_replacement"] <= 0)
-        | (df["battery_factor_with_replacement"] > 1)
-    )
+    factors = df[list(DEGRADATION_FACTOR_COLUMNS)].to_numpy(dtype=np.float64)
+    invalid_mask = (factors <= 0) | (factors > 1)
     if invalid_mask.any():
-        raise InputValidationError("Degradation factors out of range (0, 1].")
+        row, column = np.unravel_index(np.argmax(invalid_mask), invalid_mask.shape)
+        field = DEGRADATION_FACTOR_COLUMNS[column]
+        raise InputValidationError(
+            f"Degradation factors out of range (0, 1]: {field}={factors[row, column]} "
+            f"in year {df['year'].iloc[row]}.",
+            field=field,
+            value=float(factors[row, column]),
+        )
 
-    years = set(df["year"].astype(int).tolist())
-    missing_years = [year for year in range(1, project_years + 1) if year not in years]
+    expected_years = np.arange(1, project_years + 1, dtype=np.int64)
+    years = df["year"].to_numpy(dtype=np.int64)
+    missing_years = np.setdiff1d(expected_years, years).tolist()
     if missing_years:
         raise DegradationTableError(
             f"Missing degradation years: {missing_years}", missing_years=missing_years
@@ -156,12 +230,12 @@ def load_degradation_table(path: Path, project_years: int = 25) -> pd.DataFrame:
     return df
 
 
-def load_tariff_schedule(path: Path) -> dict[TimePeriod, list[int]]:
+def load_tariff_schedule(path: ExcelSource) -> dict[TimePeriod, list[int]]:
     """
     Load tariff schedule defining peak/off-peak hours.
 
     Args:
-        path: Path to Excel input file.
+        path: Path to Excel input file, or an open pd.ExcelFile.
 
     Returns:
         Mapping from TimePeriod to list of hours.
@@ -171,42 +245,89 @@ def load_tariff_schedule(path: Path) -> dict[TimePeriod, list[int]]:
     """
     df = _read_sheet(path, TARIFF_SHEET)
 
-    if _missing_columns(df, {"hour", "period"}):
+    if _missing_columns(df, REQUIRED_TARIFF_COLUMNS):
         raise InputValidationError("Tariff schedule must contain 'hour' and 'period'.")
 
     if (df["hour"] < 0).any() or (df["hour"] > 23).any():
         raise InputValidationError("Invalid hour in tariff schedule (must be 0-23).")
 
-    period_map = {
-        "off_peak": TimePeriod.OFF_PEAK,
-        "standard": TimePeriod.STANDARD,
-        "peak": TimePeriod.PEAK,
-    }
+    # Encode the normalised labels against the known periods once; unknown
+    # labels get code -1
+    period_codes = pd.Categorical(
+        df["period"].astype(str).str.strip().str.lower(),
+        categories=list(TARIFF_PERIODS),
+    ).codes
+    invalid_mask = period_codes < 0
+    if invalid_mask.any():
+        invalid_period = df["period"].iloc[int(np.argmax(invalid_mask))]
+        raise InputValidationError(
+            f"Invalid tariff period '{invalid_period}'. Expected off_peak, standard, peak."
+        )
 
-    schedule: dict[TimePeriod, list[int]] = {
-        TimePeriod.OFF_PEAK: [],
-        TimePeriod.STANDARD: [],
-        TimePeriod.PEAK: [],
+    # Boolean-mask gathers keep the hours of each period in sheet order
+    hours = df["hour"].to_numpy(dtype=np.int64)
+    return {
+        period: hours[period_codes == code].tolist()
+        for code, period in enumerate(TARIFF_PERIODS.values())
     }
 
-    for _, row in df.iterrows():
-        period_key = str(row["period"]).strip().lower()
-        if period_key not in period_map:
-            raise InputValidationError(
-                f"Invalid tariff period '{row['period']}'. Expected off_peak, standard, peak."
-            )
-        period = period_map[period_key]
-        schedule[period].append(int(row["hour"]))
 
-    return schedule
+def load_all(path: Path, project_years: int = 25) -> ModelInputs:
+    """
+    Load and validate every input sheet, opening the workbook once.
+
+    Args:
+        path: Path to Excel input workbook.
+        project_years: Expected project length in years.
+
+    Returns:
+        ModelInputs with the assumptions, hourly data, degradation table
+        and tariff schedule.
+
+    Raises:
+        InputValidationError: If the workbook or any sheet is missing or invalid.
+        DegradationTableError: If degradation year coverage is incomplete.
+    """
+    try:
+        workbook = pd.ExcelFile(path)
+    except (FileNotFoundError, OSError, ValueError) as exc:  # pragma: no cover - IO errors
+        raise InputValidationError(f"Failed to open workbook {path}: {exc}") from exc
+
+    with workbook:
+        return ModelInputs(
+            assumptions=load_assumptions(workbook),
+            hourly_data=load_hourly_data(workbook),
+            degradation_table=load_degradation_table(workbook, project_years),
+            tariff_schedule=load_tariff_schedule(workbook),
+        )
 
 
-def _read_sheet(path: Path, sheet_name: str) -> pd.DataFrame:
+def set_sheet_cache(enabled: bool) -> None:
+    """
+    Enable or disable the on-disk cache of parsed input sheets.
+
+    When enabled, each sheet read from a workbook path is pickled next to
+    the workbook as ``<workbook name>.<sheet name>.pkl`` together with the
+    workbook's modification time and size. Later reads of an unchanged
+    workbook load the pickle instead of parsing the XLSX again; editing the
+    workbook invalidates its cached sheets. Only enable this for input
+    directories you trust, since the cache files are unpickled.
+
+    Args:
+        enabled: True to read and write cached sheets; False (the default)
+            to always parse the workbook.
+    """
+    global _sheet_cache_enabled
+    _sheet_cache_enabled = bool(enabled)
+
+
+def _read_sheet(path: ExcelSource, sheet_name: str) -> pd.DataFrame:
     """
     Read a sheet from an Excel file with standard error handling.
 
     Args:
-        path: Path to Excel input file.
+        path: Path to Excel input file, or an open pd.ExcelFile whose
+            parsed workbook is reused.
         sheet_name: Name of sheet to read.
 
     Returns:
@@ -215,16 +336,72 @@ def _read_sheet(path: Path, sheet_name: str) -> pd.DataFrame:
     Raises:
         InputValidationError: If sheet cannot be loaded.
     """
+    source = path.io if isinstance(path, pd.ExcelFile) else path
+    cache_path = None
+    signature: tuple[int, int] | None = None
+    if _sheet_cache_enabled and isinstance(source, (str, os.PathLike)):
+        try:
+            signature = _workbook_signature(source)
+        except OSError:
+            signature = None
+        if signature is not None:
+            cache_path = Path(source).with_name(f"{Path(source).name}.{sheet_name}.pkl")
+            cached = _read_cached_sheet(cache_path, signature)
+            if cached is not None:
+                return cached
+
     try:
-        return pd.read_excel(path, sheet_name=sheet_name)
+        if isinstance(path, pd.ExcelFile):
+            df = path.parse(sheet_name=sheet_name)
+        else:
+            df = pd.read_excel(path, sheet_name=sheet_name)
     except (FileNotFoundError, OSError, ValueError) as exc:  # pragma: no cover - IO errors
         raise InputValidationError(
-            f"Failed to read sheet '{sheet_name}' from {path}: {exc}"
+            f"Failed to read sheet '{sheet_name}' from {source}: {exc}"
         ) from exc
 
+    if cache_path is not None and signature is not None:
+        _write_cached_sheet(cache_path, signature, df)
+    return df
+
+
+def _workbook_signature(source: str | os.PathLike[str]) -> tuple[int, int]:
+    stat = os.stat(source)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_cached_sheet(cache_path: Path, signature: tuple[int, int]) -> pd.DataFrame | None:
+    """
+    Return the cached sheet if it was written for the current workbook.
+
+    The signature is pickled ahead of the frame, so a stale cache is
+    rejected without unpickling the sheet itself.
+    """
+    try:
+        with open(cache_path, "rb") as handle:
+            if pickle.load(handle) == signature:
+                return pickle.load(handle)
+    except (OSError, EOFError, ValueError, TypeError, ImportError, pickle.UnpicklingError):
+        pass
+    return None
+
+
+def _write_cached_sheet(cache_path: Path, signature: tuple[int, int], df: pd.DataFrame) -> None:
+    """
+    Cache a parsed sheet; failures are ignored since the cache is optional.
+    """
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "wb") as handle:
+            pickle.dump(signature, handle, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(df, handle, pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError):
+        tmp_path.unlink(missing_ok=True)
+
 
-def _missing_columns(df: pd.DataFrame, required: set[str]) -> set[str]:
+def _missing_columns(df: pd.DataFrame, required: frozenset[str]) -> frozenset[str]:
     """
     Return the set of missing required columns for a DataFrame.
     """
-    return set(required) - set(df.columns)
+    return required.difference(df.columns)
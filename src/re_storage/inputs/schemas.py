@@ -65,7 +65,9 @@ class HourlyInputRow(BaseModel):
     """
     Single row of hourly time series data.
 
-    Represents one timestep from the Data Input sheet.
+    Represents one timestep from the Data Input sheet. Use it to validate
+    individual rows; load_hourly_data checks the full sheet with vectorized
+    column operations rather than building one model per row.
     """
 
     model_config = ConfigDict(extra="forbid")
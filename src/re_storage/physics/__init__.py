@@ -20,6 +20,8 @@ from re_storage.physics.balance import (
     validate_energy_balance,
     validate_soc_bounds,
     validate_power_rating,
+    make_power_validator,
+    validate_timestep,
 )
 from re_storage.physics.solar import (
     scale_generation,
@@ -32,7 +34,9 @@ from re_storage.physics.battery import (
     evaluate_discharge_permission,
     calculate_discharge_power,
     update_soc,
+    dispatch_vectorized,
     BatteryState,
+    BatteryStateArrays,
 )
 
 __all__ = [
@@ -46,9 +50,13 @@ __all__ = [
     "evaluate_discharge_permission",
     "calculate_discharge_power",
     "update_soc",
+    "dispatch_vectorized",
     "BatteryState",
+    "BatteryStateArrays",
     # Balance
     "validate_energy_balance",
     "validate_soc_bounds",
     "validate_power_rating",
+    "make_power_validator",
+    "validate_timestep",
 ]
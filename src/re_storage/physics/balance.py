@@ -14,6 +14,7 @@ Reference: model_architecture.md Risk 6 (Balance Check Column)
 """
 
 import logging
+from collections.abc import Callable
 
 import numpy as np
 
@@ -109,22 +110,30 @@ def validate_energy_balance_vectorized(
     Raises:
         EnergyBalanceError: If any timestep violates balance constraint.
     """
-    total_accounted = direct_consumption_kwh + charged_kwh + surplus_kwh
-    imbalance = solar_gen_kwh - total_accounted
-
-    violations = np.abs(imbalance) > tolerance
-    if np.any(violations):
-        violation_count = np.sum(violations)
-        first_idx = int(np.argmax(violations))
-        max_imbalance = float(np.max(np.abs(imbalance)))
-
-        raise EnergyBalanceError(
-            f"Energy balance failed at {violation_count} timesteps. "
-            f"First violation at index {first_idx}: {imbalance[first_idx]:.6f} kWh. "
-            f"Maximum imbalance: {max_imbalance:.6f} kWh.",
-            imbalance_kwh=max_imbalance,
-            timestep=first_idx,
-        )
+    # Summed in the same order as the scalar check, reusing one scratch buffer
+    imbalance = np.add(direct_consumption_kwh, charged_kwh, dtype=np.float64)
+    imbalance += surplus_kwh
+    np.subtract(solar_gen_kwh, imbalance, out=imbalance)
+
+    # Balanced data is the common case, so a single reduction decides it;
+    # fmax skips NaN imbalances, which never count as violations
+    abs_imbalance = np.abs(imbalance)
+    if not np.fmax.reduce(abs_imbalance, axis=None, initial=0.0) > tolerance:
+        return
+
+    # Error details are only worked out once a violation is certain
+    violations = abs_imbalance > tolerance
+    violation_count = np.count_nonzero(violations)
+    first_idx = int(np.argmax(violations))
+    max_imbalance = float(np.max(abs_imbalance))
+
+    raise EnergyBalanceError(
+        f"Energy balance failed at {violation_count} timesteps. "
+        f"First violation at index {first_idx}: {imbalance[first_idx]:.6f} kWh. "
+        f"Maximum imbalance: {max_imbalance:.6f} kWh.",
+        imbalance_kwh=max_imbalance,
+        timestep=first_idx,
+    )
 
 
 def validate_soc_bounds(
@@ -156,6 +165,10 @@ def validate_soc_bounds(
         >>> validate_soc_bounds(soc_kwh=-1.0, max_capacity_kwh=100.0)  # Raises
         >>> validate_soc_bounds(soc_kwh=101.0, max_capacity_kwh=100.0)  # Raises
     """
+    # Per-timestep callers almost always pass, so return before any formatting
+    if -tolerance <= soc_kwh <= max_capacity_kwh + tolerance:
+        return
+
     ts_info = f" at timestep {timestep}" if timestep is not None else ""
 
     if soc_kwh < -tolerance:
@@ -193,6 +206,13 @@ def validate_soc_bounds_vectorized(
     Raises:
         SoCBoundsError: If any timestep violates SoC bounds.
     """
+    # Valid SoC is the common case: the lowest and highest values decide it
+    # without building masks (fmin/fmax skip NaN, which never violates a bound)
+    lowest_soc = np.fmin.reduce(soc_kwh, axis=None, initial=np.inf)
+    highest_soc = np.fmax.reduce(soc_kwh, axis=None, initial=-np.inf)
+    if lowest_soc >= -tolerance and highest_soc <= max_capacity_kwh + tolerance:
+        return
+
     too_low = soc_kwh < -tolerance
     too_high = soc_kwh > max_capacity_kwh + tolerance
 
@@ -266,12 +286,128 @@ def validate_power_rating(
     allowable_max = max_rating_kw * (1 + tolerance)
 
     if power_kw > allowable_max:
-        ts_info = f" at timestep {timestep}" if timestep is not None else ""
-        overage_pct = ((power_kw / max_rating_kw) - 1) * 100
+        _raise_power_rating_error(power_kw, max_rating_kw, equipment_name, timestep)
 
-        raise InsufficientCapacityError(
-            f"{equipment_name} rating exceeded{ts_info}: "
-            f"{power_kw:.2f} kW > {max_rating_kw:.2f} kW ({overage_pct:.1f}% over).",
-            requested_kw=power_kw,
-            available_kw=max_rating_kw,
-        )
+
+def make_power_validator(
+    max_rating_kw: PowerKW,
+    equipment_name: str = "equipment",
+    tolerance: float = 0.01,
+) -> Callable[[PowerKW, int | None], None]:
+    """
+    Build a power rating check for one piece of equipment.
+
+    Equivalent to validate_power_rating with the rating, name and tolerance
+    fixed, but the allowable maximum is computed once here rather than on
+    every call. Use it when checking many timesteps against the same rating.
+
+    Args:
+        max_rating_kw: Maximum equipment rating (kW).
+        equipment_name: Name of equipment for error message.
+        tolerance: Acceptable overshoot percentage (ratio, not %).
+
+    Returns:
+        Function taking (power_kw, timestep=None) that raises
+        InsufficientCapacityError if power exceeds the rating by more than
+        the tolerance.
+
+    Raises:
+        ValueError: If max_rating_kw is not positive.
+    """
+    if max_rating_kw <= 0:
+        raise ValueError(f"max_rating_kw must be positive, got {max_rating_kw}")
+
+    allowable_max = max_rating_kw * (1 + tolerance)
+
+    def validate(power_kw: PowerKW, timestep: int | None = None) -> None:
+        if power_kw > allowable_max:
+            _raise_power_rating_error(power_kw, max_rating_kw, equipment_name, timestep)
+
+    return validate
+
+
+def validate_timestep(
+    solar_gen_kwh: EnergyKWH,
+    direct_consumption_kwh: EnergyKWH,
+    charged_kwh: EnergyKWH,
+    surplus_kwh: EnergyKWH,
+    soc_kwh: EnergyKWH,
+    max_capacity_kwh: EnergyKWH,
+    power_kw: PowerKW,
+    max_rating_kw: PowerKW,
+    equipment_name: str = "equipment",
+    timestep: int | None = None,
+    energy_tolerance: float = 0.001,
+    soc_tolerance: float = 0.001,
+    power_tolerance: float = 0.01,
+) -> None:
+    """
+    Run the energy balance, SoC bounds and power rating checks together.
+
+    All three conditions are tested inline in a single call. Only when one
+    fails are the individual validators called, in that order, to raise
+    the same error they would raise on their own.
+
+    Args:
+        solar_gen_kwh: Total solar energy generated this timestep (kWh).
+        direct_consumption_kwh: Energy consumed directly by load (kWh).
+        charged_kwh: Energy stored in battery (kWh).
+        surplus_kwh: Energy exported to grid or curtailed (kWh).
+        soc_kwh: State of charge at end of timestep (kWh).
+        max_capacity_kwh: Usable battery capacity (kWh).
+        power_kw: Power flow to validate (kW).
+        max_rating_kw: Maximum equipment rating (kW).
+        equipment_name: Name of equipment for error message.
+        timestep: Optional timestep index for error reporting.
+        energy_tolerance: Acceptable energy imbalance (kWh).
+        soc_tolerance: Acceptable SoC overshoot (kWh).
+        power_tolerance: Acceptable power overshoot (ratio, not %).
+
+    Raises:
+        EnergyBalanceError: If solar energy is not fully accounted for.
+        SoCBoundsError: If SoC is outside valid bounds.
+        InsufficientCapacityError: If power exceeds the rating.
+        ValueError: If max_rating_kw is not positive.
+    """
+    imbalance = solar_gen_kwh - (direct_consumption_kwh + charged_kwh + surplus_kwh)
+    if (
+        abs(imbalance) <= energy_tolerance
+        and -soc_tolerance <= soc_kwh <= max_capacity_kwh + soc_tolerance
+        and max_rating_kw > 0
+        and power_kw <= max_rating_kw * (1 + power_tolerance)
+    ):
+        return
+
+    validate_energy_balance(
+        solar_gen_kwh,
+        direct_consumption_kwh,
+        charged_kwh,
+        surplus_kwh,
+        tolerance=energy_tolerance,
+        timestep=timestep,
+    )
+    validate_soc_bounds(soc_kwh, max_capacity_kwh, timestep=timestep, tolerance=soc_tolerance)
+    validate_power_rating(
+        power_kw,
+        max_rating_kw,
+        equipment_name=equipment_name,
+        timestep=timestep,
+        tolerance=power_tolerance,
+    )
+
+
+def _raise_power_rating_error(
+    power_kw: PowerKW,
+    max_rating_kw: PowerKW,
+    equipment_name: str,
+    timestep: int | None,
+) -> None:
+    ts_info = f" at timestep {timestep}" if timestep is not None else ""
+    overage_pct = ((power_kw / max_rating_kw) - 1) * 100
+
+    raise InsufficientCapacityError(
+        f"{equipment_name} rating exceeded{ts_info}: "
+        f"{power_kw:.2f} kW > {max_rating_kw:.2f} kW ({overage_pct:.1f}% over).",
+        requested_kw=power_kw,
+        available_kw=max_rating_kw,
+    )
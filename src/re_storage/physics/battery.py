@@ -15,13 +15,15 @@ multiple conditions are TRUE simultaneously.
 """
 
 import logging
-from dataclasses import dataclass, field
-from typing import NamedTuple
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Final, NamedTuple
 
 import numpy as np
 
 from re_storage.core.exceptions import SoCBoundsError
 from re_storage.core.types import (
+    HOURS_PER_DAY,
     ChargingMode,
     EnergyKWH,
     GridChargeMode,
@@ -52,7 +54,7 @@ class BatteryState(NamedTuple):
         grid_charged_kw: Power from grid to battery (kW).
         discharged_kw: Power from battery to load/grid (kW).
         discharge_permitted: Whether discharge was allowed this step.
-        active_discharge_conditions: List of conditions that permitted discharge.
+        active_discharge_conditions: Names of conditions that permitted discharge.
     """
 
     soc_kwh: EnergyKWH
@@ -60,10 +62,77 @@ class BatteryState(NamedTuple):
     grid_charged_kw: PowerKW
     discharged_kw: PowerKW
     discharge_permitted: bool
-    active_discharge_conditions: list[str] = field(default_factory=list)
+    active_discharge_conditions: tuple[str, ...] = ()
 
 
-@dataclass(frozen=True)
+@dataclass
+class BatteryStateArrays:
+    """
+    Battery states for a whole simulation, stored as one array per field.
+
+    Multi-timestep dispatch writes each step into preallocated arrays
+    instead of keeping one BatteryState tuple per timestep, so results stay
+    contiguous for downstream vector maths. Use state_at() to get a
+    BatteryState for a single step, e.g. for error reporting.
+
+    Attributes:
+        soc_kwh: State of charge at end of each timestep (kWh).
+        pv_charged_kw: Power from PV to battery (kW).
+        grid_charged_kw: Power from grid to battery (kW).
+        discharged_kw: Power from battery to load/grid (kW).
+        discharge_permitted: Whether discharge was allowed each step.
+        discharge_conditions: Conditions that permitted discharge, as a
+            uint8 DischargeConditions mask per timestep.
+    """
+
+    soc_kwh: np.ndarray
+    pv_charged_kw: np.ndarray
+    grid_charged_kw: np.ndarray
+    discharged_kw: np.ndarray
+    discharge_permitted: np.ndarray
+    discharge_conditions: np.ndarray
+
+    @classmethod
+    def allocate(cls, n_steps: int) -> "BatteryStateArrays":
+        """Return zero-filled arrays for n_steps timesteps."""
+        return cls(
+            soc_kwh=np.zeros(n_steps),
+            pv_charged_kw=np.zeros(n_steps),
+            grid_charged_kw=np.zeros(n_steps),
+            discharged_kw=np.zeros(n_steps),
+            discharge_permitted=np.zeros(n_steps, dtype=bool),
+            discharge_conditions=np.zeros(n_steps, dtype=np.uint8),
+        )
+
+    def __len__(self) -> int:
+        return len(self.soc_kwh)
+
+    def record(self, timestep: int, state: BatteryState) -> None:
+        """Store a single dispatch result at the given timestep."""
+        self.soc_kwh[timestep] = state.soc_kwh
+        self.pv_charged_kw[timestep] = state.pv_charged_kw
+        self.grid_charged_kw[timestep] = state.grid_charged_kw
+        self.discharged_kw[timestep] = state.discharged_kw
+        self.discharge_permitted[timestep] = state.discharge_permitted
+        self.discharge_conditions[timestep] = DischargeConditions.from_names(
+            state.active_discharge_conditions
+        ).mask
+
+    def state_at(self, timestep: int) -> BatteryState:
+        """Return the stored state at the given timestep as a BatteryState."""
+        return BatteryState(
+            soc_kwh=float(self.soc_kwh[timestep]),
+            pv_charged_kw=float(self.pv_charged_kw[timestep]),
+            grid_charged_kw=float(self.grid_charged_kw[timestep]),
+            discharged_kw=float(self.discharged_kw[timestep]),
+            discharge_permitted=bool(self.discharge_permitted[timestep]),
+            active_discharge_conditions=DischargeConditions(
+                int(self.discharge_conditions[timestep])
+            ).active_tuple(),
+        )
+
+
+@dataclass(frozen=True, slots=True)
 class BatteryConfig:
     """
     Immutable battery system configuration.
@@ -125,42 +194,101 @@ class BatteryConfig:
             )
 
 
-@dataclass(frozen=True)
+# SoC overshoot beyond which update_soc treats a result as a dispatch bug
+_SOC_UPDATE_TOLERANCE_KWH: Final[float] = 0.01  # 10 Wh tolerance for floating point
+
+# Discharge condition bits, combined into DischargeConditions.mask
+DISCHARGE_WHEN_NEEDED: Final[int] = 1
+DISCHARGE_AFTER_SUNSET: Final[int] = 2
+DISCHARGE_OPTIMIZE: Final[int] = 4
+DISCHARGE_PEAK: Final[int] = 8
+
+_DISCHARGE_CONDITION_NAMES: Final[tuple[tuple[int, str], ...]] = (
+    (DISCHARGE_WHEN_NEEDED, "when_needed"),
+    (DISCHARGE_AFTER_SUNSET, "after_sunset"),
+    (DISCHARGE_OPTIMIZE, "optimize"),
+    (DISCHARGE_PEAK, "peak"),
+)
+
+# Active condition names for every possible mask, built once so dispatch
+# results share these tuples instead of allocating a list per timestep
+_ACTIVE_CONDITION_NAMES: Final[tuple[tuple[str, ...], ...]] = tuple(
+    tuple(name for bit, name in _DISCHARGE_CONDITION_NAMES if mask & bit)
+    for mask in range(1 << len(_DISCHARGE_CONDITION_NAMES))
+)
+
+
+@dataclass(frozen=True, slots=True)
 class DischargeConditions:
     """
     Flags indicating which discharge conditions are currently active.
 
     Used to track and log when multiple overlapping conditions permit
-    discharge, which can lead to unexpected behavior.
+    discharge, which can lead to unexpected behavior. The flags are held
+    as a bitmask of the DISCHARGE_* constants, so a simulation can store
+    one uint8 per timestep (see BatteryStateArrays).
 
     Reference: model_architecture.md Risk 1 (Discharge Strategy Complexity)
     """
 
-    when_needed: bool = False
-    after_sunset: bool = False
-    optimize: bool = False
-    peak: bool = False
+    mask: int = 0
+
+    @classmethod
+    def from_flags(
+        cls,
+        when_needed: bool = False,
+        after_sunset: bool = False,
+        optimize: bool = False,
+        peak: bool = False,
+    ) -> "DischargeConditions":
+        """Build conditions from individual flags."""
+        return cls(
+            (DISCHARGE_WHEN_NEEDED if when_needed else 0)
+            | (DISCHARGE_AFTER_SUNSET if after_sunset else 0)
+            | (DISCHARGE_OPTIMIZE if optimize else 0)
+            | (DISCHARGE_PEAK if peak else 0)
+        )
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "DischargeConditions":
+        """Build conditions from condition names as returned by active_tuple()."""
+        return cls(sum(bit for bit, name in _DISCHARGE_CONDITION_NAMES if name in names))
+
+    @property
+    def when_needed(self) -> bool:
+        """Discharge because load exceeds solar (or the demand target)."""
+        return bool(self.mask & DISCHARGE_WHEN_NEEDED)
+
+    @property
+    def after_sunset(self) -> bool:
+        """Discharge because it is after sunset."""
+        return bool(self.mask & DISCHARGE_AFTER_SUNSET)
+
+    @property
+    def optimize(self) -> bool:
+        """Discharge inside the optimisation window."""
+        return bool(self.mask & DISCHARGE_OPTIMIZE)
+
+    @property
+    def peak(self) -> bool:
+        """Discharge during a peak tariff period."""
+        return bool(self.mask & DISCHARGE_PEAK)
 
     def any_active(self) -> bool:
         """Return True if any discharge condition is active."""
-        return self.when_needed or self.after_sunset or self.optimize or self.peak
+        return self.mask != 0
 
     def active_list(self) -> list[str]:
         """Return list of active condition names."""
-        active = []
-        if self.when_needed:
-            active.append("when_needed")
-        if self.after_sunset:
-            active.append("after_sunset")
-        if self.optimize:
-            active.append("optimize")
-        if self.peak:
-            active.append("peak")
-        return active
+        return list(_ACTIVE_CONDITION_NAMES[self.mask])
+
+    def active_tuple(self) -> tuple[str, ...]:
+        """Return active condition names as a shared, immutable tuple."""
+        return _ACTIVE_CONDITION_NAMES[self.mask]
 
     def count_active(self) -> int:
         """Return number of active conditions."""
-        return sum([self.when_needed, self.after_sunset, self.optimize, self.peak])
+        return self.mask.bit_count()
 
 
 # =============================================================================
@@ -282,7 +410,7 @@ def calculate_pv_to_bess(
     if available_for_charging <= 0:
         return 0.0
 
-    if config.charging_mode == ChargingMode.TIME_WINDOW:
+    if config.charging_mode is ChargingMode.TIME_WINDOW:
         return _calculate_pv_to_bess_time_window(
             available_for_charging=available_for_charging,
             max_charge_power=max_charge_power,
@@ -291,7 +419,7 @@ def calculate_pv_to_bess(
             is_peak_period=is_peak_period,
         )
 
-    elif config.charging_mode == ChargingMode.PRECHARGE_TARGET:
+    elif config.charging_mode is ChargingMode.PRECHARGE_TARGET:
         return _calculate_pv_to_bess_precharge(
             available_for_charging=available_for_charging,
             max_charge_power=max_charge_power,
@@ -317,14 +445,7 @@ def _calculate_pv_to_bess_time_window(
 
     Reference: model_architecture.md §A.2 Mode 1
     """
-    # Check if within charging window
-    if config.charge_start_hour <= config.charge_end_hour:
-        in_window = config.charge_start_hour <= hour <= config.charge_end_hour
-    else:
-        # Window wraps midnight (e.g., 22:00 to 06:00)
-        in_window = hour >= config.charge_start_hour or hour <= config.charge_end_hour
-
-    if not in_window:
+    if not _is_in_charge_window(hour, config.charge_start_hour, config.charge_end_hour):
         return 0.0
 
     # Do not charge during peak periods (preserve for arbitrage)
@@ -336,6 +457,18 @@ def _calculate_pv_to_bess_time_window(
     return min(desired_charge, max_charge_power)
 
 
+def _is_in_charge_window(hour: int, start_hour: int, end_hour: int) -> bool:
+    """
+    Check if hour is in the charging window, inclusive at both ends.
+
+    A window whose start is after its end wraps midnight
+    (e.g., 22:00 to 06:00).
+    """
+    if start_hour <= end_hour:
+        return start_hour <= hour <= end_hour
+    return hour >= start_hour or hour <= end_hour
+
+
 def _calculate_pv_to_bess_precharge(
     available_for_charging: PowerKW,
     max_charge_power: PowerKW,
@@ -409,13 +542,13 @@ def evaluate_discharge_permission(
     Returns:
         DischargeConditions showing which conditions are active.
     """
-    if config.strategy_mode == StrategyMode.PEAK_SHAVING:
+    if config.strategy_mode is StrategyMode.PEAK_SHAVING:
         # Peak shaving: discharge only when exceeding demand target
         peak_shaving_needed = grid_load_after_solar_kw > config.demand_target_kw
-        return DischargeConditions(when_needed=peak_shaving_needed)
+        return DischargeConditions.from_flags(when_needed=peak_shaving_needed)
 
     # Arbitrage mode: evaluate 4 conditions
-    conditions = DischargeConditions(
+    conditions = DischargeConditions.from_flags(
         when_needed=config.when_needed and (load_kw > solar_gen_kw),
         after_sunset=config.after_sunset and (hour >= 17),
         optimize=config.optimize_mode
@@ -542,13 +675,13 @@ def calculate_grid_charge_power(
     Returns:
         Grid charging power (kW).
     """
-    if config.grid_charge_mode == GridChargeMode.DISABLED:
+    if config.grid_charge_mode is GridChargeMode.DISABLED:
         return 0.0
 
     # Determine target capacity based on mode
-    if config.grid_charge_mode == GridChargeMode.TO_TARGET:
+    if config.grid_charge_mode is GridChargeMode.TO_TARGET:
         target_kwh = config.grid_charge_capacity_kw  # CapGrid target
-    elif config.grid_charge_mode == GridChargeMode.TO_FULL:
+    elif config.grid_charge_mode is GridChargeMode.TO_FULL:
         target_kwh = config.usable_capacity_kwh
     else:
         return 0.0
@@ -627,7 +760,7 @@ def update_soc(
     new_soc_unbounded = previous_soc_kwh + energy_stored_kwh - energy_extracted_kwh
 
     # Check for significant bounds violation (indicates logic error)
-    tolerance = 0.01  # 10 Wh tolerance for floating point
+    tolerance = _SOC_UPDATE_TOLERANCE_KWH
 
     if new_soc_unbounded < -tolerance:
         raise SoCBoundsError(
@@ -652,10 +785,13 @@ def update_soc(
             timestep=timestep,
         )
 
-    # Apply bounds (for floating point tolerance only)
-    new_soc = np.clip(new_soc_unbounded, 0.0, config.usable_capacity_kwh)
-
-    return float(new_soc)
+    # Apply bounds (for floating point tolerance only). Plain comparisons
+    # avoid np.clip's 0-d array round trip on every timestep
+    if new_soc_unbounded < 0.0:
+        return 0.0
+    if new_soc_unbounded > config.usable_capacity_kwh:
+        return float(config.usable_capacity_kwh)
+    return float(new_soc_unbounded)
 
 
 # =============================================================================
@@ -765,5 +901,273 @@ def dispatch_single_timestep(
         grid_charged_kw=grid_charge_kw,
         discharged_kw=discharge_kw,
         discharge_permitted=conditions.any_active(),
-        active_discharge_conditions=conditions.active_list(),
+        active_discharge_conditions=conditions.active_tuple(),
+    )
+
+
+def dispatch_vectorized(
+    solar_gen_kw: np.ndarray,
+    load_kw: np.ndarray,
+    hour: np.ndarray,
+    is_peak_period: np.ndarray,
+    config: BatteryConfig,
+    is_sunday: np.ndarray | None = None,
+    initial_soc_kwh: EnergyKWH = 0.0,
+    step_hours: float = 1.0,
+) -> BatteryStateArrays:
+    """
+    Run battery dispatch over a whole timeseries in one call.
+
+    Produces the same results as chaining dispatch_single_timestep over
+    every timestep, carrying SoC forward. The per-step helpers are fused
+    into a single loop: configuration is unpacked into locals and the mode
+    branches are resolved once, so each timestep runs only scalar
+    arithmetic with no helper calls or BatteryState construction. Charging
+    hours and the calendar-only discharge conditions are computed for all
+    timesteps as arrays before the loop.
+
+    Overlapping discharge conditions are reported in a single warning for
+    the whole run rather than one per timestep.
+
+    Args:
+        solar_gen_kw: Solar generation per timestep (kW).
+        load_kw: Site load per timestep (kW).
+        hour: Hour of day (0-23) per timestep.
+        is_peak_period: Whether each timestep is a peak tariff period.
+        config: Battery configuration.
+        is_sunday: Whether each timestep falls on a Sunday. Defaults to
+            all False.
+        initial_soc_kwh: SoC before the first timestep (kWh).
+        step_hours: Timestep duration in hours.
+
+    Returns:
+        BatteryStateArrays with one entry per timestep.
+
+    Raises:
+        ValueError: If the input arrays differ in length, hours fall outside
+            0-23, or initial SoC or step_hours is invalid.
+        SoCBoundsError: If dispatch produces a physically impossible SoC.
+    """
+    n_steps = len(solar_gen_kw)
+    if is_sunday is None:
+        is_sunday = np.zeros(n_steps, dtype=bool)
+    lengths = {len(load_kw), len(hour), len(is_peak_period), len(is_sunday)}
+    if lengths != {n_steps}:
+        raise ValueError("Dispatch input arrays must all have the same length")
+    if initial_soc_kwh < 0:
+        raise ValueError(f"initial_soc_kwh cannot be negative: {initial_soc_kwh}")
+    if step_hours <= 0:
+        raise ValueError(f"step_hours must be positive: {step_hours}")
+    if not isinstance(config.charging_mode, ChargingMode):
+        raise ValueError(f"Unknown charging mode: {config.charging_mode}")
+
+    hour = np.asarray(hour, dtype=int)
+    if n_steps and (hour.min() < 0 or hour.max() >= HOURS_PER_DAY):
+        raise ValueError("Dispatch hours must be in the range 0-23")
+
+    is_peak_period = np.asarray(is_peak_period, dtype=bool)
+    is_sunday = np.asarray(is_sunday, dtype=bool)
+
+    # Charging hours and the discharge conditions that depend only on the
+    # calendar are fixed for the run, so resolve them for every step up front
+    if config.charging_mode is ChargingMode.TIME_WINDOW:
+        charge_window = np.array(
+            [
+                _is_in_charge_window(h, config.charge_start_hour, config.charge_end_hour)
+                for h in range(HOURS_PER_DAY)
+            ]
+        )
+        pv_charge_allowed = charge_window[hour] & ~is_peak_period
+    else:
+        pv_charge_allowed = hour < config.precharge_target_hour
+
+    calendar_conditions = np.zeros(n_steps, dtype=np.uint8)
+    if config.strategy_mode is not StrategyMode.PEAK_SHAVING:
+        if config.after_sunset:
+            calendar_conditions[hour >= 17] |= DISCHARGE_AFTER_SUNSET
+        if config.optimize_mode:
+            optimization_window = np.array(
+                [_is_in_optimization_window(h) for h in range(HOURS_PER_DAY)]
+            )
+            calendar_conditions[optimization_window[hour] | is_peak_period] |= DISCHARGE_OPTIMIZE
+        if config.peak_mode:
+            sunday_peak_window = np.array(
+                [_is_sunday_peak_window(h) for h in range(HOURS_PER_DAY)]
+            )
+            calendar_conditions[is_peak_period | (is_sunday & sunday_peak_window[hour])] |= (
+                DISCHARGE_PEAK
+            )
+
+    solar_values = np.asarray(solar_gen_kw, dtype=float).tolist()
+    load_values = np.asarray(load_kw, dtype=float).tolist()
+    hour_values = hour.tolist()
+    charge_allowed_values = pv_charge_allowed.tolist()
+    calendar_condition_values = calendar_conditions.tolist()
+
+    soc_out = [0.0] * n_steps
+    pv_charged_out = [0.0] * n_steps
+    grid_charged_out = [0.0] * n_steps
+    discharged_out = [0.0] * n_steps
+    conditions_out = [0] * n_steps
+
+    capacity_kwh = config.usable_capacity_kwh
+    power_rating_kw = config.power_rating_kw
+    charge_efficiency = config.charge_efficiency
+    discharge_efficiency = config.discharge_efficiency
+    min_direct_pv_share = config.min_direct_pv_share
+    pv2bess_share = config.active_pv2bess_share
+    precharge_target_hour = config.precharge_target_hour
+    precharge_target_soc_kwh = config.precharge_target_soc_kwh
+    demand_target_kw = config.demand_target_kw
+    grid_charge_capacity_kw = config.grid_charge_capacity_kw
+    time_window = config.charging_mode is ChargingMode.TIME_WINDOW
+    peak_shaving = config.strategy_mode is StrategyMode.PEAK_SHAVING
+    when_needed = config.when_needed
+
+    if config.grid_charge_mode is GridChargeMode.TO_TARGET:
+        grid_target_kwh = grid_charge_capacity_kw
+    elif config.grid_charge_mode is GridChargeMode.TO_FULL:
+        grid_target_kwh = capacity_kwh
+    else:
+        grid_target_kwh = None
+    grid_charge_divisor = charge_efficiency * step_hours
+
+    # update_soc is only called to raise on a violation, with its usual message
+    max_soc_kwh = capacity_kwh + _SOC_UPDATE_TOLERANCE_KWH
+    soc_kwh = float(initial_soc_kwh)
+
+    for timestep in range(n_steps):
+        solar = solar_values[timestep]
+        load = load_values[timestep]
+
+        # PV charging (calculate_pv_to_bess). Clamps are written as
+        # comparisons rather than min()/max() calls, with the same tie and
+        # NaN behaviour, since this runs for every timestep
+        pv_to_bess_kw = 0.0
+        if solar > 0 and charge_allowed_values[timestep]:
+            headroom_kwh = capacity_kwh - soc_kwh
+            if headroom_kwh < 0.0:
+                headroom_kwh = 0.0
+            max_charge_power = headroom_kwh / charge_efficiency / step_hours
+            if power_rating_kw < max_charge_power:
+                max_charge_power = power_rating_kw
+            available = solar - load * min_direct_pv_share
+            if max_charge_power > 0 and available > 0:
+                if time_window:
+                    pv_to_bess_kw = available * pv2bess_share
+                else:
+                    deficit_kwh = precharge_target_soc_kwh - soc_kwh
+                    if deficit_kwh > 0:
+                        hours_remaining = precharge_target_hour - hour_values[timestep]
+                        pv_to_bess_kw = deficit_kwh / (charge_efficiency * hours_remaining)
+                        if available < pv_to_bess_kw:
+                            pv_to_bess_kw = available
+                if max_charge_power < pv_to_bess_kw:
+                    pv_to_bess_kw = max_charge_power
+
+        # Grid charging (calculate_grid_charge_power)
+        grid_charge_kw = 0.0
+        if grid_target_kwh is not None:
+            needed_kwh = grid_target_kwh - soc_kwh
+            if needed_kwh > 0:
+                grid_charge_kw = needed_kwh / grid_charge_divisor
+                if grid_charge_capacity_kw < grid_charge_kw:
+                    grid_charge_kw = grid_charge_capacity_kw
+                if power_rating_kw < grid_charge_kw:
+                    grid_charge_kw = power_rating_kw
+
+        charged_kwh = (pv_to_bess_kw + grid_charge_kw) * step_hours
+        soc_after_charge = soc_kwh + charged_kwh * charge_efficiency
+        if capacity_kwh < soc_after_charge:
+            soc_after_charge = capacity_kwh
+
+        # Discharge permission (evaluate_discharge_permission)
+        if peak_shaving:
+            grid_load_after_solar = load - (solar - pv_to_bess_kw)
+            if grid_load_after_solar < 0.0:
+                grid_load_after_solar = 0.0
+            mask = DISCHARGE_WHEN_NEEDED if grid_load_after_solar > demand_target_kw else 0
+        else:
+            mask = calendar_condition_values[timestep]
+            if when_needed and load > solar:
+                mask |= DISCHARGE_WHEN_NEEDED
+
+        # Discharge power (calculate_discharge_power)
+        discharge_kw = 0.0
+        if mask and soc_after_charge > 0:
+            pv_for_load_kw = solar - pv_to_bess_kw
+            if pv_for_load_kw < 0.0:
+                pv_for_load_kw = 0.0
+            unmet_load_kw = load - pv_for_load_kw
+            if unmet_load_kw > 0:
+                discharge_kw = soc_after_charge * discharge_efficiency / step_hours
+                if power_rating_kw < discharge_kw:
+                    discharge_kw = power_rating_kw
+                if not discharge_kw < unmet_load_kw:
+                    discharge_kw = unmet_load_kw
+
+        # SoC update (update_soc)
+        new_soc = (
+            soc_kwh
+            + charged_kwh * charge_efficiency
+            - discharge_kw * step_hours / discharge_efficiency
+        )
+        if new_soc < 0.0:
+            if new_soc < -_SOC_UPDATE_TOLERANCE_KWH:
+                update_soc(
+                    soc_kwh,
+                    pv_to_bess_kw,
+                    grid_charge_kw,
+                    discharge_kw,
+                    config,
+                    step_hours,
+                    timestep,
+                )
+            new_soc = 0.0
+        elif new_soc > capacity_kwh:
+            if new_soc > max_soc_kwh:
+                update_soc(
+                    soc_kwh,
+                    pv_to_bess_kw,
+                    grid_charge_kw,
+                    discharge_kw,
+                    config,
+                    step_hours,
+                    timestep,
+                )
+            new_soc = float(capacity_kwh)
+        soc_kwh = new_soc
+
+        soc_out[timestep] = soc_kwh
+        pv_charged_out[timestep] = pv_to_bess_kw
+        grid_charged_out[timestep] = grid_charge_kw
+        discharged_out[timestep] = discharge_kw
+        conditions_out[timestep] = mask
+
+    discharge_conditions = np.array(conditions_out, dtype=np.uint8)
+    _warn_overlapping_conditions(discharge_conditions, hour)
+    return BatteryStateArrays(
+        soc_kwh=np.array(soc_out, dtype=float),
+        pv_charged_kw=np.array(pv_charged_out, dtype=float),
+        grid_charged_kw=np.array(grid_charged_out, dtype=float),
+        discharged_kw=np.array(discharged_out, dtype=float),
+        discharge_permitted=discharge_conditions != 0,
+        discharge_conditions=discharge_conditions,
+    )
+
+
+def _warn_overlapping_conditions(discharge_conditions: np.ndarray, hour: np.ndarray) -> None:
+    """
+    Log one warning covering every timestep with more than one discharge condition.
+    """
+    overlapping = np.flatnonzero(discharge_conditions & (discharge_conditions - 1))
+    if overlapping.size == 0:
+        return
+
+    first = overlapping[0]
+    logger.warning(
+        f"Multiple discharge conditions active at {overlapping.size} timesteps, "
+        f"first at hour {hour[first]}: "
+        f"{list(_ACTIVE_CONDITION_NAMES[discharge_conditions[first]])}. "
+        "Review dispatch strategy for unintended overlap."
     )
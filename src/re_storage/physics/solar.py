@@ -136,15 +136,18 @@ def calculate_direct_pv_consumption_vectorized(
     load = np.asarray(load_kw, dtype=np.float64)
     pv2bess = np.asarray(pv_to_bess_kw, dtype=np.float64)
 
-    if np.any(solar < 0):
+    if _any_below(solar, 0.0):
         raise ValueError("solar_gen_kw contains negative values")
-    if np.any(load < 0):
+    if _any_below(load, 0.0):
         raise ValueError("load_kw contains negative values")
-    if np.any(pv2bess < 0):
+    if _any_below(pv2bess, 0.0):
         raise ValueError("pv_to_bess_kw contains negative values")
 
-    available_for_load = np.maximum(solar - pv2bess, 0.0)
-    return np.minimum(load, available_for_load)
+    # Reuse one buffer for the available PV and the result
+    direct = np.empty(np.broadcast_shapes(solar.shape, load.shape, pv2bess.shape))
+    np.subtract(solar, pv2bess, out=direct)
+    np.maximum(direct, 0.0, out=direct)
+    return np.minimum(load, direct, out=direct)
 
 
 def calculate_surplus_generation(
@@ -219,10 +222,12 @@ def calculate_surplus_generation_vectorized(
     direct = np.asarray(direct_consumption_kw, dtype=np.float64)
     charged = np.asarray(pv_charged_kw, dtype=np.float64)
 
-    surplus = solar - direct - charged
+    surplus = np.empty(np.broadcast_shapes(solar.shape, direct.shape, charged.shape))
+    np.subtract(solar, direct, out=surplus)
+    np.subtract(surplus, charged, out=surplus)
 
-    negative_mask = surplus < -tolerance
-    if np.any(negative_mask):
+    if _any_below(surplus, -tolerance):
+        negative_mask = surplus < -tolerance
         bad_indices = np.where(negative_mask)[0]
         first_bad = bad_indices[0]
         raise ValueError(
@@ -230,4 +235,13 @@ def calculate_surplus_generation_vectorized(
             f"First violation at index {first_bad}: surplus={surplus[first_bad]:.4f} kW"
         )
 
-    return np.maximum(surplus, 0.0)
+    return np.maximum(surplus, 0.0, out=surplus)
+
+
+def _any_below(values: np.ndarray, threshold: float) -> bool:
+    """
+    Return whether any value is below threshold, in a single reduction pass.
+
+    np.fmin ignores NaN, so a NaN element cannot hide a real violation.
+    """
+    return bool(np.fmin.reduce(values, axis=None, initial=np.inf) < threshold)
@@ -44,6 +44,16 @@ class TestAnnualTotals:
         result = calculate_total_solar_generation_mwh(hourly, scale_factor=1.1)
         assert result == pytest.approx(0.44)
 
+    def test_negative_solar_generation_raises(self) -> None:
+        hourly = pd.DataFrame({"solar_gen_kw": [100.0, float("nan"), -1.0]})
+        with pytest.raises(InputValidationError, match="negative"):
+            calculate_total_solar_generation_mwh(hourly)
+
+    def test_missing_solar_hours_are_skipped(self) -> None:
+        hourly = pd.DataFrame({"solar_gen_kw": [100.0, float("nan"), 300.0]})
+        result = calculate_total_solar_generation_mwh(hourly, scale_factor=2.0)
+        assert result == pytest.approx(0.8)
+
     def test_total_dppa_revenue_usd(self) -> None:
         dppa = _dppa_hourly()
         result = calculate_total_dppa_revenue_usd(dppa)
@@ -77,3 +77,22 @@ class TestLifetimeProjection:
         table.loc[1, "pv_factor"] = 1.2
         with pytest.raises(InputValidationError, match="pv_factor"):
             project_lifetime_generation_mwh(100.0, table, project_years=3)
+
+    def test_build_rejects_missing_years(self) -> None:
+        table = _degradation_table().iloc[:2].copy()
+        with pytest.raises(DegradationTableError, match="does not cover"):
+            build_lifetime_projection(
+                _year1_totals(), table, initial_capacity_kwh=200.0, project_years=3
+            )
+
+    def test_build_rejects_non_positive_capacity(self) -> None:
+        with pytest.raises(InputValidationError, match="initial_capacity_kwh"):
+            build_lifetime_projection(
+                _year1_totals(), _degradation_table(), initial_capacity_kwh=0.0, project_years=3
+            )
+
+    def test_non_positive_battery_factor_raises(self) -> None:
+        table = _degradation_table().copy()
+        table.loc[2, "battery_factor_with_replacement"] = 0.0
+        with pytest.raises(InputValidationError, match="battery_factor_with_replacement"):
+            project_battery_capacity_kwh(200.0, table, project_years=3)
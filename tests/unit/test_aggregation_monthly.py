@@ -61,3 +61,35 @@ class TestAggregateHourlyToMonthly:
         hourly = _sample_hourly()
         with pytest.raises(InputValidationError, match="demand_reduction_target_ratio"):
             aggregate_hourly_to_monthly(hourly, demand_reduction_target_ratio=1.5)
+
+    def test_string_timestamps_are_parsed(self) -> None:
+        hourly = _sample_hourly()
+        hourly["datetime"] = hourly["datetime"].dt.strftime("%Y-%m-%d %H:%M")
+        result = aggregate_hourly_to_monthly(hourly, demand_reduction_target_ratio=0.1)
+        assert list(result.index) == [1, 2]
+        assert result.loc[1, "baseline_peak_kw"] == pytest.approx(120.0)
+
+    def test_timezone_aware_timestamps_use_local_month(self) -> None:
+        hourly = _sample_hourly()
+        # 2025-02-01 00:00 at UTC+7 is still January in UTC
+        hourly["datetime"] = hourly["datetime"].dt.tz_localize("Asia/Ho_Chi_Minh")
+        result = aggregate_hourly_to_monthly(hourly, demand_reduction_target_ratio=0.1)
+        assert list(result.index) == [1, 2]
+        assert result.loc[2, "baseline_peak_kw"] == pytest.approx(90.0)
+
+    def test_missing_hourly_values_are_skipped(self) -> None:
+        hourly = _sample_hourly()
+        hourly.loc[1, ["load_kw", "bau_expense_usd"]] = float("nan")
+        result = aggregate_hourly_to_monthly(hourly, demand_reduction_target_ratio=0.1)
+        assert result.loc[1, "baseline_peak_kw"] == pytest.approx(100.0)
+        assert result.loc[1, "bau_grid_expense_usd"] == pytest.approx(10.0)
+
+    def test_integer_columns_keep_source_dtype(self) -> None:
+        hourly = _sample_hourly()
+        hourly["load_kw"] = hourly["load_kw"].astype("int64")
+        hourly["bau_expense_usd"] = hourly["bau_expense_usd"].astype("int64")
+        result = aggregate_hourly_to_monthly(hourly, demand_reduction_target_ratio=0.1)
+        assert result["baseline_peak_kw"].dtype == "int64"
+        assert result["bau_grid_expense_usd"].dtype == "int64"
+        assert result.loc[1, "baseline_peak_kw"] == 120
+        assert result.loc[2, "bau_grid_expense_usd"] == 17
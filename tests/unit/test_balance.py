@@ -5,6 +5,8 @@ Tests cover:
 1. Energy balance validation
 2. SoC bounds validation
 3. Power rating validation
+4. Prebuilt power rating validators
+5. Combined per-timestep validation
 
 These tests enforce the "Physics First" principle.
 """
@@ -18,11 +20,13 @@ from re_storage.core.exceptions import (
     SoCBoundsError,
 )
 from re_storage.physics.balance import (
+    make_power_validator,
     validate_energy_balance,
     validate_energy_balance_vectorized,
     validate_power_rating,
     validate_soc_bounds,
     validate_soc_bounds_vectorized,
+    validate_timestep,
 )
 
 
@@ -109,6 +113,15 @@ class TestValidateEnergyBalanceVectorized:
             surplus_kwh=np.array([10.0, 20.0, 20.0]),
         )
 
+    def test_integer_inputs_and_missing_values(self) -> None:
+        """Integer arrays are accepted and NaN timesteps do not count as violations."""
+        validate_energy_balance_vectorized(
+            solar_gen_kwh=np.array([100, 200, 150]),
+            direct_consumption_kwh=np.array([60, 100, 80]),
+            charged_kwh=np.array([30.0, 80.0, np.nan]),
+            surplus_kwh=np.array([10, 20, 20]),
+        )
+
     def test_one_imbalanced_raises(self) -> None:
         """Single imbalanced timestep should raise."""
         with pytest.raises(EnergyBalanceError, match="1 timesteps"):
@@ -297,3 +310,62 @@ class TestValidatePowerRating:
                 max_rating_kw=0.0,
                 equipment_name="inverter",
             )
+
+
+class TestMakePowerValidator:
+    """Tests for make_power_validator function."""
+
+    def test_matches_validate_power_rating(self) -> None:
+        """The built validator should accept and reject the same powers."""
+        validate = make_power_validator(100.0, equipment_name="inverter", tolerance=0.1)
+
+        validate(110.0)
+        with pytest.raises(InsufficientCapacityError, match="inverter.*timestep 7") as exc:
+            validate(115.0, 7)
+        assert exc.value.requested_kw == 115.0
+        assert exc.value.available_kw == 100.0
+
+    def test_zero_rating_raises(self) -> None:
+        """Zero max rating should be rejected when building the validator."""
+        with pytest.raises(ValueError, match="must be positive"):
+            make_power_validator(0.0)
+
+
+class TestValidateTimestep:
+    """Tests for validate_timestep function."""
+
+    @staticmethod
+    def _check(**overrides: float) -> None:
+        values = {
+            "solar_gen_kwh": 100.0,
+            "direct_consumption_kwh": 60.0,
+            "charged_kwh": 30.0,
+            "surplus_kwh": 10.0,
+            "soc_kwh": 50.0,
+            "max_capacity_kwh": 100.0,
+            "power_kw": 40.0,
+            "max_rating_kw": 50.0,
+        }
+        values.update(overrides)
+        validate_timestep(**values, equipment_name="inverter", timestep=3)
+
+    def test_valid_timestep_passes(self) -> None:
+        """A balanced, in-bounds, within-rating timestep should not raise."""
+        self._check()
+
+    @pytest.mark.parametrize(
+        ("overrides", "error", "match"),
+        [
+            ({"surplus_kwh": 20.0}, EnergyBalanceError, "timestep 3"),
+            ({"soc_kwh": -1.0}, SoCBoundsError, "Negative SoC at timestep 3"),
+            ({"soc_kwh": 101.0}, SoCBoundsError, "exceeds capacity at timestep 3"),
+            ({"power_kw": 60.0}, InsufficientCapacityError, "inverter.*timestep 3"),
+            ({"max_rating_kw": 0.0}, ValueError, "must be positive"),
+        ],
+    )
+    def test_failures_raise_individual_validator_errors(
+        self, overrides: dict[str, float], error: type[Exception], match: str
+    ) -> None:
+        """Each failing check should raise the error its own validator raises."""
+        with pytest.raises(error, match=match):
+            self._check(**overrides)
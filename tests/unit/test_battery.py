@@ -8,10 +8,15 @@ Tests cover:
 4. Discharge power calculations
 5. SoC update with efficiency
 6. Single timestep dispatch integration
+7. Array storage of dispatch results
+8. Vectorized multi-timestep dispatch
 
 Reference: AGENTS.md §4 (Testing Requirements)
 """
 
+from dataclasses import replace
+
+import numpy as np
 import pytest
 from hypothesis import given, strategies as st, assume
 
@@ -20,12 +25,16 @@ from re_storage.core.types import ChargingMode, GridChargeMode, StrategyMode
 from re_storage.physics.battery import (
     BatteryConfig,
     BatteryState,
+    BatteryStateArrays,
+    DISCHARGE_PEAK,
+    DISCHARGE_WHEN_NEEDED,
     DischargeConditions,
     calculate_charge_limit,
     calculate_discharge_power,
     calculate_grid_charge_power,
     calculate_pv_to_bess,
     dispatch_single_timestep,
+    dispatch_vectorized,
     evaluate_discharge_permission,
     update_soc,
 )
@@ -417,6 +426,16 @@ class TestEvaluateDischargePermission:
         assert conditions.count_active() > 1
         assert "Multiple discharge conditions" in caplog.text
 
+    def test_conditions_bitmask(self) -> None:
+        """Flags should map onto the DISCHARGE_* bits and back."""
+        conditions = DischargeConditions.from_flags(when_needed=True, peak=True)
+        assert conditions.mask == DISCHARGE_WHEN_NEEDED | DISCHARGE_PEAK
+        assert conditions.active_list() == ["when_needed", "peak"]
+        assert conditions.count_active() == 2
+        assert conditions.active_tuple() == ("when_needed", "peak")
+        assert DischargeConditions.from_names(conditions.active_tuple()) == conditions
+        assert not DischargeConditions().any_active()
+
 
 # =============================================================================
 # DISCHARGE POWER TESTS
@@ -739,6 +758,18 @@ class TestDispatchSingleTimestep:
         assert hasattr(result, "pv_charged_kw")
         assert hasattr(result, "discharged_kw")
         assert hasattr(result, "discharge_permitted")
+        assert result.active_discharge_conditions == ()
+
+    def test_battery_state_defaults_to_no_conditions(self) -> None:
+        """Omitted discharge conditions should default to an empty tuple."""
+        state = BatteryState(
+            soc_kwh=10.0,
+            pv_charged_kw=0.0,
+            grid_charged_kw=0.0,
+            discharged_kw=0.0,
+            discharge_permitted=False,
+        )
+        assert state.active_discharge_conditions == ()
 
     def test_peak_shaving_mode(self, peak_shaving_config: BatteryConfig) -> None:
         """Peak shaving should discharge when load exceeds target."""
@@ -773,3 +804,168 @@ class TestDispatchSingleTimestep:
         expected_soc = max(0, min(expected_soc, 100.0))
 
         assert result.soc_kwh == pytest.approx(expected_soc, abs=0.01)
+
+
+# =============================================================================
+# STATE ARRAY TESTS
+# =============================================================================
+
+
+class TestBatteryStateArrays:
+    """Tests for BatteryStateArrays storage."""
+
+    def test_allocate_is_zero_filled(self) -> None:
+        """Freshly allocated arrays should hold an idle, empty battery."""
+        states = BatteryStateArrays.allocate(24)
+        assert len(states) == 24
+        assert states.soc_kwh.sum() == 0.0
+        assert not states.discharge_permitted.any()
+        assert states.discharge_conditions.dtype == np.uint8
+        assert states.state_at(5).active_discharge_conditions == ()
+
+    def test_record_and_state_at_round_trip(
+        self, default_battery_config: BatteryConfig
+    ) -> None:
+        """A recorded dispatch result should read back unchanged."""
+        states = BatteryStateArrays.allocate(3)
+        result = dispatch_single_timestep(
+            solar_gen_kw=0.0,
+            load_kw=50.0,
+            previous_soc_kwh=100.0,
+            hour=18,
+            config=default_battery_config,
+            is_peak_period=True,
+        )
+        states.record(1, result)
+
+        assert states.state_at(1) == result
+        assert states.discharged_kw[1] == result.discharged_kw
+        assert states.state_at(0).soc_kwh == 0.0
+
+
+class TestDispatchVectorized:
+    """Tests for dispatch_vectorized function."""
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {},
+            {"after_sunset": True, "optimize_mode": True, "charge_start_hour": 20},
+            {"charging_mode": ChargingMode.PRECHARGE_TARGET, "min_direct_pv_share": 0.3},
+            {"strategy_mode": StrategyMode.PEAK_SHAVING, "demand_target_kw": 40.0},
+            {"grid_charge_mode": GridChargeMode.TO_TARGET, "grid_charge_capacity_kw": 30.0},
+            {
+                "grid_charge_mode": GridChargeMode.TO_FULL,
+                "grid_charge_capacity_kw": 20.0,
+                "active_pv2bess_share": 0.0,
+            },
+        ],
+    )
+    def test_matches_single_timestep_dispatch(
+        self, default_battery_config: BatteryConfig, overrides: dict[str, object]
+    ) -> None:
+        """Vectorized dispatch should reproduce chained single-step results."""
+        config = replace(default_battery_config, **overrides)
+        rng = np.random.default_rng(7)
+        hours = np.arange(72) % 24
+        solar = np.where((hours >= 7) & (hours <= 17), rng.uniform(0.0, 200.0, 72), 0.0)
+        load = rng.uniform(20.0, 120.0, 72)
+        is_peak = (hours >= 17) & (hours <= 20)
+        is_sunday = np.arange(72) >= 48
+
+        states = dispatch_vectorized(
+            solar_gen_kw=solar,
+            load_kw=load,
+            hour=hours,
+            is_peak_period=is_peak,
+            config=config,
+            is_sunday=is_sunday,
+            initial_soc_kwh=20.0,
+        )
+
+        soc = 20.0
+        for i in range(72):
+            expected = dispatch_single_timestep(
+                solar_gen_kw=float(solar[i]),
+                load_kw=float(load[i]),
+                previous_soc_kwh=soc,
+                hour=int(hours[i]),
+                config=config,
+                is_peak_period=bool(is_peak[i]),
+                is_sunday=bool(is_sunday[i]),
+                timestep=i,
+            )
+            assert states.state_at(i) == expected
+            soc = expected.soc_kwh
+
+        assert len(states) == 72
+
+    def test_mismatched_lengths_raise(self, default_battery_config: BatteryConfig) -> None:
+        """Inputs of different lengths should be rejected."""
+        with pytest.raises(ValueError, match="same length"):
+            dispatch_vectorized(
+                solar_gen_kw=np.zeros(24),
+                load_kw=np.zeros(23),
+                hour=np.arange(24),
+                is_peak_period=np.zeros(24, dtype=bool),
+                config=default_battery_config,
+            )
+
+    def test_negative_initial_soc_raises(self, default_battery_config: BatteryConfig) -> None:
+        """A negative starting SoC should be rejected."""
+        with pytest.raises(ValueError, match="initial_soc_kwh"):
+            dispatch_vectorized(
+                solar_gen_kw=np.zeros(24),
+                load_kw=np.zeros(24),
+                hour=np.arange(24),
+                is_peak_period=np.zeros(24, dtype=bool),
+                config=default_battery_config,
+                initial_soc_kwh=-1.0,
+            )
+
+    def test_over_charge_raises_with_timestep(self, default_battery_config: BatteryConfig) -> None:
+        """SoC bound violations should raise SoCBoundsError for the failing step."""
+        config = replace(
+            default_battery_config,
+            grid_charge_mode=GridChargeMode.TO_FULL,
+            grid_charge_capacity_kw=50.0,
+        )
+        with pytest.raises(SoCBoundsError, match="over-capacity") as exc:
+            dispatch_vectorized(
+                solar_gen_kw=np.full(3, 200.0),
+                load_kw=np.zeros(3),
+                hour=np.array([10, 11, 12]),
+                is_peak_period=np.zeros(3, dtype=bool),
+                config=config,
+                initial_soc_kwh=60.0,
+            )
+        assert exc.value.timestep == 0
+
+    def test_out_of_range_hour_raises(self, default_battery_config: BatteryConfig) -> None:
+        """Hours outside 0-23 should be rejected before dispatch."""
+        with pytest.raises(ValueError, match="0-23"):
+            dispatch_vectorized(
+                solar_gen_kw=np.zeros(2),
+                load_kw=np.zeros(2),
+                hour=np.array([23, 24]),
+                is_peak_period=np.zeros(2, dtype=bool),
+                config=default_battery_config,
+            )
+
+    def test_overlapping_conditions_logged_once(
+        self, default_battery_config: BatteryConfig, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Overlapping discharge conditions should produce one summary warning."""
+        hours = np.arange(24)
+        with caplog.at_level("WARNING", logger="re_storage.physics.battery"):
+            dispatch_vectorized(
+                solar_gen_kw=np.zeros(24),
+                load_kw=np.full(24, 50.0),
+                hour=hours,
+                is_peak_period=(hours >= 17) & (hours <= 20),
+                config=default_battery_config,
+                initial_soc_kwh=100.0,
+            )
+
+        assert len(caplog.records) == 1
+        assert "at 4 timesteps, first at hour 17" in caplog.records[0].getMessage()
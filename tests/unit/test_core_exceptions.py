@@ -0,0 +1,49 @@
+"""
+Unit tests for core.exceptions module.
+
+Tests cover:
+1. Context attributes stored on exception instances.
+2. Pickle round-trips keeping the context attributes.
+"""
+
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from re_storage.core.exceptions import (
+    DSCRConstraintError,
+    InputValidationError,
+    REStorageError,
+    SoCBoundsError,
+)
+
+
+class TestExceptionContext:
+    """Tests for exception context attributes."""
+
+    def test_attributes_are_set(self) -> None:
+        error = SoCBoundsError("SoC above capacity", soc_kwh=5.0, max_capacity_kwh=4.0, timestep=7)
+
+        assert str(error) == "SoC above capacity"
+        assert error.soc_kwh == 5.0
+        assert error.max_capacity_kwh == 4.0
+        assert error.timestep == 7
+        assert isinstance(error, REStorageError)
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            SoCBoundsError("SoC above capacity", soc_kwh=5.0, max_capacity_kwh=4.0, timestep=7),
+            InputValidationError("bad field", field="load_kw", value=-1.0),
+            DSCRConstraintError("DSCR missed", min_dscr_achieved=1.1, target_dscr=1.3),
+        ],
+    )
+    def test_pickle_round_trip_keeps_attributes(self, error: REStorageError) -> None:
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert type(restored) is type(error)
+        assert restored.args == error.args
+        for name in type(error).__slots__:
+            assert getattr(restored, name) == getattr(error, name)
@@ -0,0 +1,33 @@
+"""
+Unit tests for core.types module.
+
+Tests cover:
+1. Lazy resolution of the DataFrame type aliases.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import pandas as pd
+
+from re_storage.core import AnnualTimeSeries, HourlyTimeSeries, MonthlyTimeSeries, types
+
+
+class TestTimeSeriesAliases:
+    """Tests for the DataFrame type aliases."""
+
+    def test_aliases_resolve_to_dataframe(self) -> None:
+        assert HourlyTimeSeries is pd.DataFrame
+        assert MonthlyTimeSeries is pd.DataFrame
+        assert AnnualTimeSeries is pd.DataFrame
+        assert types.HourlyTimeSeries is pd.DataFrame
+
+    def test_core_import_does_not_load_pandas(self) -> None:
+        code = "import sys, re_storage.core; print('pandas' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
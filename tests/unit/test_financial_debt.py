@@ -32,6 +32,28 @@ class TestAmortizationSchedule:
             schedule.loc[2, "total_debt_service_usd"], rel=1e-6
         )
 
+    def test_zero_rate_schedule_repays_evenly(self) -> None:
+        schedule = calculate_amortization_schedule(
+            debt_amount_usd=900.0, interest_rate_pct=0.0, tenor_years=3
+        )
+
+        assert schedule["principal_usd"].tolist() == pytest.approx([300.0, 300.0, 300.0])
+        assert schedule["opening_balance_usd"].tolist() == pytest.approx([900.0, 600.0, 300.0])
+        assert schedule["interest_usd"].tolist() == pytest.approx([0.0, 0.0, 0.0])
+        assert schedule.loc[3, "closing_balance_usd"] == 0.0
+
+    def test_repeated_schedules_are_independent(self) -> None:
+        first = calculate_amortization_schedule(
+            debt_amount_usd=1000.0, interest_rate_pct=10.0, tenor_years=2
+        )
+        first.loc[1, "interest_usd"] = -1.0
+
+        second = calculate_amortization_schedule(
+            debt_amount_usd=1000.0, interest_rate_pct=10.0, tenor_years=2
+        )
+
+        assert second.loc[1, "interest_usd"] == pytest.approx(100.0)
+
 
 class TestDebtSizing:
     """Tests for size_debt_for_dscr."""
@@ -50,6 +72,35 @@ class TestDebtSizing:
         assert debt_amount > 0
         assert dscr.min() >= 1.3 - 1e-6
 
+    def test_debt_binds_dscr_in_lowest_ebitda_year(self) -> None:
+        ebitda = pd.Series([1300.0, 1200.0], index=[1, 2], name="ebitda_usd")
+        debt_amount, schedule = size_debt_for_dscr(
+            ebitda_series=ebitda,
+            interest_rate_pct=10.0,
+            tenor_years=2,
+            target_dscr=1.3,
+            initial_guess_usd=1.0,
+        )
+
+        payment_per_usd = 0.1 / (1 - 1.1**-2)
+        assert debt_amount == pytest.approx(1200.0 / (1.3 * payment_per_usd), rel=1e-12)
+        dscr = ebitda / schedule["total_debt_service_usd"]
+        assert dscr.min() == pytest.approx(1.3, rel=1e-9)
+
+    def test_zero_rate_debt_is_min_ebitda_times_tenor(self) -> None:
+        ebitda = pd.Series([1300.0, 1200.0, 1250.0], index=[1, 2, 3], name="ebitda_usd")
+        debt_amount, schedule = size_debt_for_dscr(
+            ebitda_series=ebitda,
+            interest_rate_pct=0.0,
+            tenor_years=3,
+            target_dscr=1.25,
+            initial_guess_usd=1000.0,
+        )
+
+        assert debt_amount == 1200.0 * 3 / 1.25
+        assert (schedule["interest_usd"] == 0.0).all()
+        assert schedule["total_debt_service_usd"].tolist() == pytest.approx([960.0] * 3)
+
     def test_non_positive_ebitda_raises(self) -> None:
         ebitda = pd.Series([-10.0, 20.0], index=[1, 2], name="ebitda_usd")
         with pytest.raises(DSCRConstraintError, match="EBITDA"):
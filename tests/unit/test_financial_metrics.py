@@ -2,21 +2,25 @@
 Unit tests for financial.metrics module.
 
 Tests cover:
-1. XNPV calculation for dated cashflows.
+1. XNPV calculation for dated cashflows, single and batched.
 2. XIRR calculations for project and equity cashflows.
 3. DSCR series calculation and validation.
 """
 
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from re_storage.core.exceptions import InputValidationError
+from re_storage.financial import set_validation
 from re_storage.financial.metrics import (
+    IRR_UPPER_BOUNDS,
     calculate_dscr_series,
     calculate_equity_irr,
     calculate_npv,
+    calculate_npv_batch,
     calculate_project_irr,
 )
 
@@ -37,6 +41,34 @@ class TestFinancialMetrics:
 
         assert result == pytest.approx(expected)
 
+    def test_npv_batch_matches_scalar_npv(self) -> None:
+        cashflows = np.array([[-1000.0, 600.0, 600.0], [-500.0, 100.0, 700.0]])
+        rates_pct = np.array([0.0, 8.0, 10.0, 25.0])
+
+        result = calculate_npv_batch(cashflows, _dates(), rates_pct)
+
+        assert result.shape == (2, 4)
+        for i, row in enumerate(cashflows):
+            for j, rate_pct in enumerate(rates_pct):
+                expected = calculate_npv(pd.Series(row), _dates(), discount_rate_pct=rate_pct)
+                assert result[i, j] == pytest.approx(expected, rel=1e-12)
+
+    def test_npv_batch_rejects_mismatched_periods(self) -> None:
+        cashflows = np.array([[-1000.0, 600.0]])
+
+        with pytest.raises(InputValidationError, match="one period per date"):
+            calculate_npv_batch(cashflows, _dates(), np.array([10.0]))
+
+    def test_empty_cashflows_raise_sign_error(self) -> None:
+        empty_dates = pd.Series([], dtype="datetime64[ns]")
+
+        with pytest.raises(InputValidationError, match="one positive and one negative"):
+            calculate_npv(pd.Series([], dtype=float), empty_dates, discount_rate_pct=10.0)
+        with pytest.raises(InputValidationError, match="one positive and one negative"):
+            calculate_project_irr(pd.Series([], dtype=float), empty_dates)
+        with pytest.raises(InputValidationError, match="one positive and one negative"):
+            calculate_npv_batch(np.empty((1, 0)), empty_dates, np.array([10.0]))
+
     def test_calculate_project_irr(self) -> None:
         cashflows = pd.Series([-1000.0, 600.0, 600.0])
         dates = _dates()
@@ -68,3 +100,20 @@ class TestFinancialMetrics:
 
         with pytest.raises(InputValidationError, match="debt_service"):
             calculate_dscr_series(ebitda, debt_service)
+
+    def test_disabled_validation_skips_sign_check(self) -> None:
+        cashflows = pd.Series([100.0, 100.0, 100.0])
+        with pytest.raises(InputValidationError, match="positive and one negative"):
+            calculate_npv(cashflows, _dates(), discount_rate_pct=0.0)
+
+        set_validation(False)
+        try:
+            result = calculate_npv(cashflows, _dates(), discount_rate_pct=0.0)
+        finally:
+            set_validation(True)
+
+        assert result == pytest.approx(300.0)
+
+    def test_irr_upper_bounds_are_read_only(self) -> None:
+        with pytest.raises(ValueError, match="read-only"):
+            IRR_UPPER_BOUNDS[1] = 0.0
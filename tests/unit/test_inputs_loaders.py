@@ -6,10 +6,14 @@ Tests cover:
 2. Hourly data loading and validation
 3. Degradation table loading and validation
 4. Tariff schedule loading and validation
+5. Loading every sheet from one open workbook
+6. On-disk cache of parsed sheets
 """
 
 from __future__ import annotations
 
+import os
+import pickle
 from pathlib import Path
 
 import numpy as np
@@ -19,10 +23,12 @@ import pytest
 from re_storage.core.exceptions import DegradationTableError, InputValidationError
 from re_storage.core.types import HOURS_PER_LEAP_YEAR, HOURS_PER_YEAR, TimePeriod
 from re_storage.inputs.loaders import (
+    load_all,
     load_assumptions,
     load_degradation_table,
     load_hourly_data,
     load_tariff_schedule,
+    set_sheet_cache,
 )
 
 
@@ -149,6 +155,23 @@ class TestLoadHourlyData:
         with pytest.raises(InputValidationError, match="contains negative values"):
             load_hourly_data(path)
 
+    def test_load_hourly_data_coerces_numeric_columns(self, tmp_path: Path) -> None:
+        """Integer-valued columns should be returned as float64."""
+        frame = _hourly_frame(HOURS_PER_YEAR)
+        frame["load_kw"] = 80
+        path = _write_excel(tmp_path / "inputs.xlsx", {"Data Input": frame})
+        df = load_hourly_data(path)
+        assert df["load_kw"].dtype == np.float64
+        assert df["datetime"].dtype.kind == "M"
+
+    def test_load_hourly_data_non_numeric_value_raises(self, tmp_path: Path) -> None:
+        """Text in a numeric column should raise InputValidationError."""
+        frame = _hourly_frame(HOURS_PER_YEAR).astype({"fmp_usd_per_kwh": object})
+        frame.loc[3, "fmp_usd_per_kwh"] = "pending"
+        path = _write_excel(tmp_path / "inputs.xlsx", {"Data Input": frame})
+        with pytest.raises(InputValidationError, match="invalid values"):
+            load_hourly_data(path)
+
 
 class TestLoadDegradationTable:
     """Tests for load_degradation_table."""
@@ -174,6 +197,17 @@ class TestLoadDegradationTable:
         with pytest.raises(InputValidationError, match="out of range"):
             load_degradation_table(path)
 
+    def test_invalid_factor_reports_first_offender(self, tmp_path: Path) -> None:
+        """The error should name the first out-of-range factor and its year."""
+        frame = _degradation_frame(25)
+        frame.loc[4, "battery_factor_with_replacement"] = 0.0
+        frame.loc[9, "pv_factor"] = 1.2
+        path = _write_excel(tmp_path / "inputs.xlsx", {"Loss": frame})
+        with pytest.raises(InputValidationError, match="in year 5") as exc_info:
+            load_degradation_table(path)
+        assert exc_info.value.field == "battery_factor_with_replacement"
+        assert exc_info.value.value == 0.0
+
 
 class TestLoadTariffSchedule:
     """Tests for load_tariff_schedule."""
@@ -186,6 +220,19 @@ class TestLoadTariffSchedule:
         assert schedule[TimePeriod.STANDARD]
         assert schedule[TimePeriod.PEAK]
 
+    def test_period_labels_are_normalised(self, tmp_path: Path) -> None:
+        """Period labels should match regardless of case and surrounding spaces."""
+        frame = pd.DataFrame(
+            {"hour": [18, 0, 19, 9], "period": [" Peak", "OFF_PEAK", "peak ", "Standard"]}
+        )
+        path = _write_excel(tmp_path / "inputs.xlsx", {"Tariff Schedule": frame})
+        schedule = load_tariff_schedule(path)
+        assert schedule == {
+            TimePeriod.OFF_PEAK: [0],
+            TimePeriod.STANDARD: [9],
+            TimePeriod.PEAK: [18, 19],
+        }
+
     def test_invalid_period_raises(self, tmp_path: Path) -> None:
         """Unknown period label should raise InputValidationError."""
         frame = _tariff_frame()
@@ -201,3 +248,88 @@ class TestLoadTariffSchedule:
         path = _write_excel(tmp_path / "inputs.xlsx", {"Tariff Schedule": frame})
         with pytest.raises(InputValidationError, match="Invalid hour"):
             load_tariff_schedule(path)
+
+
+class TestLoadAll:
+    """Tests for load_all."""
+
+    def test_load_all_matches_individual_loaders(self, tmp_path: Path) -> None:
+        """Sheets read from one open workbook should match per-sheet loading."""
+        path = _write_excel(
+            tmp_path / "inputs.xlsx",
+            {
+                "Assumption": _assumptions_frame(),
+                "Data Input": _hourly_frame(HOURS_PER_YEAR),
+                "Loss": _degradation_frame(25),
+                "Tariff Schedule": _tariff_frame(),
+            },
+        )
+
+        inputs = load_all(path)
+
+        assert inputs.assumptions == load_assumptions(path)
+        pd.testing.assert_frame_equal(inputs.hourly_data, load_hourly_data(path))
+        pd.testing.assert_frame_equal(inputs.degradation_table, load_degradation_table(path))
+        assert inputs.tariff_schedule == load_tariff_schedule(path)
+
+    def test_load_all_missing_sheet_raises(self, tmp_path: Path) -> None:
+        """A workbook without every input sheet should raise InputValidationError."""
+        path = _write_excel(tmp_path / "inputs.xlsx", {"Assumption": _assumptions_frame()})
+        with pytest.raises(InputValidationError, match="Data Input"):
+            load_all(path)
+
+
+class TestSheetCache:
+    """Tests for the opt-in parsed sheet cache."""
+
+    def test_cache_disabled_by_default(self, tmp_path: Path) -> None:
+        """No cache files should be written unless the cache is enabled."""
+        path = _write_excel(tmp_path / "inputs.xlsx", {"Loss": _degradation_frame(25)})
+        load_degradation_table(path)
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["inputs.xlsx"]
+
+    def test_cached_sheet_is_reused_until_workbook_changes(self, tmp_path: Path) -> None:
+        """Cached sheets should match a fresh parse and be invalidated by edits."""
+        path = _write_excel(tmp_path / "inputs.xlsx", {"Loss": _degradation_frame(25)})
+        set_sheet_cache(True)
+        try:
+            first = load_degradation_table(path)
+            cache_file = tmp_path / "inputs.xlsx.Loss.pkl"
+            assert cache_file.exists()
+            pd.testing.assert_frame_equal(load_degradation_table(path), first)
+
+            _write_excel(path, {"Loss": _degradation_frame(30)})
+            os.utime(path, ns=(cache_file.stat().st_mtime_ns + 10**9,) * 2)
+            assert len(load_degradation_table(path)) == 30
+        finally:
+            set_sheet_cache(False)
+
+    def test_unrecognised_cache_file_is_replaced(self, tmp_path: Path) -> None:
+        """A cache file without a matching signature should be reparsed and rewritten."""
+        path = _write_excel(tmp_path / "inputs.xlsx", {"Loss": _degradation_frame(25)})
+        cache_file = tmp_path / "inputs.xlsx.Loss.pkl"
+        cache_file.write_bytes(b"not a pickle")
+        set_sheet_cache(True)
+        try:
+            assert len(load_degradation_table(path)) == 25
+            with open(cache_file, "rb") as handle:
+                assert pickle.load(handle) == (path.stat().st_mtime_ns, path.stat().st_size)
+        finally:
+            set_sheet_cache(False)
+
+    def test_unpicklable_sheet_is_loaded_without_cache(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A sheet that cannot be pickled should still load and leave no cache files."""
+        path = _write_excel(tmp_path / "inputs.xlsx", {"Loss": _degradation_frame(25)})
+
+        def fail_dump(*args: object, **kwargs: object) -> None:
+            raise pickle.PicklingError("cannot pickle")
+
+        monkeypatch.setattr(pickle, "dump", fail_dump)
+        set_sheet_cache(True)
+        try:
+            assert len(load_degradation_table(path)) == 25
+            assert sorted(p.name for p in tmp_path.iterdir()) == ["inputs.xlsx"]
+        finally:
+            set_sheet_cache(False)
@@ -55,6 +55,15 @@ class TestSystemAssumptions:
         assumptions = SystemAssumptions(**_valid_assumptions_data())
         assert assumptions.scale_factor == pytest.approx(1.2)
 
+    def test_scale_factor_follows_model_copy_update(self) -> None:
+        """scale_factor should reflect capacities changed through model_copy."""
+        assumptions = SystemAssumptions(**_valid_assumptions_data())
+        assert assumptions.scale_factor == pytest.approx(1.2)
+        doubled = assumptions.model_copy(
+            update={"actual_capacity_kwp": 2 * assumptions.actual_capacity_kwp}
+        )
+        assert doubled.scale_factor == pytest.approx(2.4)
+
     def test_invalid_efficiency_raises(self) -> None:
         """Efficiency outside bounds should raise ValidationError."""
         data = _valid_assumptions_data()
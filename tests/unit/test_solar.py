@@ -162,6 +162,20 @@ class TestCalculateDirectPvConsumptionVectorized:
                 pv_to_bess_kw=np.array([0.0, 0.0]),
             )
 
+    def test_negative_value_next_to_nan_raises(self) -> None:
+        """A NaN element should not hide a negative value elsewhere."""
+        with pytest.raises(ValueError, match="solar_gen_kw contains negative"):
+            calculate_direct_pv_consumption_vectorized(
+                solar_gen_kw=np.array([np.nan, -1.0]),
+                load_kw=np.array([50.0, 50.0]),
+                pv_to_bess_kw=np.array([0.0, 0.0]),
+            )
+
+    def test_scalar_inputs_broadcast(self) -> None:
+        """Scalar solar and PV diversion should broadcast against a load array."""
+        result = calculate_direct_pv_consumption_vectorized(50.0, np.array([10.0, 80.0]), 5.0)
+        np.testing.assert_array_equal(result, [10.0, 45.0])
+
 
 class TestCalculateSurplusGeneration:
     """Tests for calculate_surplus_generation function."""
@@ -224,3 +238,12 @@ class TestCalculateSurplusGenerationVectorized:
 
         with pytest.raises(ValueError, match="Negative surplus"):
             calculate_surplus_generation_vectorized(solar, direct, charged)
+
+    def test_negative_surplus_next_to_nan_raises(self) -> None:
+        """A NaN surplus should not hide a negative surplus elsewhere."""
+        solar = np.array([np.nan, 50.0])
+        direct = np.array([60.0, 30.0])
+        charged = np.array([30.0, 30.0])
+
+        with pytest.raises(ValueError, match="Negative surplus at 1 timesteps"):
+            calculate_surplus_generation_vectorized(solar, direct, charged)